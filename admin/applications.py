@@ -3,16 +3,27 @@
 """
 import streamlit as st
 from firebase_admin import firestore
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from .firebase import get_db
 from .config import COLLECTIONS
-from .utils import convert_firestore_data
+from .utils import convert_firestore_data, with_timestamp_ms
+from .metrics import instrument, record_reads, record_writes
+from .swr_cache import swr_cache
+from .shared_cache import invalidate_collection, register_local_cache
+from .tools import BATCH_WRITE_LIMIT, build_tool_document, normalize_tool_id
+from .categories import resolve_category
 
+# 승인 가능한 상태 (상세 화면의 승인 버튼과 동일)
+APPROVABLE_STATUSES = ("pending", "reviewing")
+# 신청 1건당 쓰기 2회 (신청 상태 + ai-tools 문서) — 트랜잭션 쓰기 한도 안에서 묶음
+APPROVAL_BATCH_SIZE = BATCH_WRITE_LIMIT // 2
 
-@st.cache_data(ttl=300)  # 5분 캐시
+
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
+@swr_cache(ttl=300, error_message="등록 신청 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_tool_registrations() -> List[Dict[str, Any]]:
     """
-    모든 도구 등록 신청 조회 (캐시됨)
+    모든 도구 등록 신청 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
         List[Dict]: 등록 신청 리스트
@@ -37,7 +48,7 @@ def get_all_tool_registrations() -> List[Dict[str, Any]]:
         for doc in docs:
             reg_data = doc.to_dict()
             reg_data["id"] = doc.id
-            reg_data = convert_firestore_data(reg_data)
+            reg_data = convert_firestore_data(with_timestamp_ms(reg_data))
             registrations.append(reg_data)
         return registrations
     except Exception as e:
@@ -49,14 +60,14 @@ def get_all_tool_registrations() -> List[Dict[str, Any]]:
             for doc in docs:
                 reg_data = doc.to_dict()
                 reg_data["id"] = doc.id
-                reg_data = convert_firestore_data(reg_data)
+                reg_data = convert_firestore_data(with_timestamp_ms(reg_data))
                 registrations.append(reg_data)
             return registrations
         except Exception as e2:
-            st.warning(f"등록 신청 조회 실패: {e}. 컬렉션 경로를 확인해주세요.")
-            return []
+            raise RuntimeError(f"{e}. 컬렉션 경로를 확인해주세요.") from e2
 
 
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_registration_by_id(registration_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -86,7 +97,7 @@ def get_registration_by_id(registration_id: str) -> Optional[Dict[str, Any]]:
                 if doc.exists:
                     reg_data = doc.to_dict()
                     reg_data["id"] = doc.id
-                    reg_data = convert_firestore_data(reg_data)
+                    reg_data = convert_firestore_data(with_timestamp_ms(reg_data))
                     return reg_data
             except:
                 continue
@@ -97,6 +108,11 @@ def get_registration_by_id(registration_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["TOOL_REGISTRATIONS"], get_all_tool_registrations.clear, get_registration_by_id.clear)
+
+
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
 def update_registration(registration_id: str, data: Dict[str, Any]) -> bool:
     """
     등록 신청 정보 업데이트
@@ -126,8 +142,7 @@ def update_registration(registration_id: str, data: Dict[str, Any]) -> bool:
             try:
                 doc_ref.update(data)
                 # 캐시 무효화
-                get_all_tool_registrations.clear()
-                get_registration_by_id.clear()
+                invalidate_collection(COLLECTIONS["TOOL_REGISTRATIONS"])
                 return True
             except:
                 continue
@@ -138,6 +153,7 @@ def update_registration(registration_id: str, data: Dict[str, Any]) -> bool:
         return False
 
 
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
 def approve_registration(registration_id: str) -> bool:
     """
     등록 신청 승인
@@ -154,6 +170,7 @@ def approve_registration(registration_id: str) -> bool:
     })
 
 
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
 def reject_registration(registration_id: str, reason: str = "") -> bool:
     """
     등록 신청 거부
@@ -172,6 +189,7 @@ def reject_registration(registration_id: str, reason: str = "") -> bool:
     })
 
 
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
 def delete_registration(registration_id: str) -> bool:
     """
     등록 신청 삭제
@@ -198,8 +216,7 @@ def delete_registration(registration_id: str) -> bool:
             try:
                 doc_ref.delete()
                 # 캐시 무효화
-                get_all_tool_registrations.clear()
-                get_registration_by_id.clear()
+                invalidate_collection(COLLECTIONS["TOOL_REGISTRATIONS"])
                 return True
             except:
                 continue
@@ -208,3 +225,192 @@ def delete_registration(registration_id: str) -> bool:
     except Exception as e:
         st.error(f"등록 신청 삭제 실패: {e}")
         return False
+
+
+# 등록 신청 문서 후보 경로 (update_registration과 같은 순서)
+_REGISTRATION_PATHS = (
+    lambda db, rid: db.collection(COLLECTIONS["TOOL_REGISTRATIONS"]).document(rid),
+    lambda db, rid: db.collection("tool-registrations").document(rid),
+    lambda db, rid: db.collection(COLLECTIONS["APPLICATIONS"]).document("tool-registrations").collection("requests").document(rid),
+)
+
+
+def build_tool_from_registration(registration: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    등록 신청 내용을 ai-tools 입력값으로 변환 (도구 등록 폼과 같은 필드 이름)
+    
+    Args:
+        registration: 등록 신청 데이터
+        
+    Returns:
+        (도구 ID 또는 None, 입력값 — 신청에 값이 있는 필드만, build_tool_document에 전달)
+    """
+    values = {
+        "name": registration.get("toolName") or registration.get("name"),
+        "company": registration.get("company"),
+        "description": registration.get("description"),
+        "websiteUrl": registration.get("websiteUrl") or registration.get("website") or registration.get("url"),
+        "tagsKr": registration.get("tagsKr") or registration.get("tags"),
+        "featuresKr": registration.get("featuresKr") or registration.get("features"),
+    }
+    category = resolve_category(registration.get("primaryCategory") or registration.get("category"))
+    if category:
+        values["primaryCategory"] = category
+    values = {key: value for key, value in values.items() if value not in (None, "", [])}
+    tool_id = normalize_tool_id(values.get("name") or "") or None
+    return tool_id, values
+
+
+def _approval_result(registration_id: str, tool_id: Optional[str], action: str, error: str = "") -> Dict[str, Any]:
+    return {"registrationId": registration_id, "toolId": tool_id, "action": action, "error": error}
+
+
+@firestore.transactional
+def _approve_registrations_in_transaction(
+    transaction, db, registration_ids: List[str], claimed_ids: set,
+) -> List[Dict[str, Any]]:
+    """
+    신청 묶음 1개 승인 (읽기 → 쓰기, 충돌 시 Firestore가 함수 전체를 다시 실행)
+    
+    Returns:
+        List[Dict]: 신청별 결과 (action: create / merge / skip / error, 저장한 경우 "data" 포함)
+    """
+    # 신청 문서를 트랜잭션 안에서 읽어 다른 관리자가 먼저 처리한 신청은 건너뜀
+    snapshots: Dict[str, Any] = {}
+    for make_ref in _REGISTRATION_PATHS:
+        missing = [rid for rid in registration_ids if rid not in snapshots]
+        if not missing:
+            break
+        try:
+            refs = [make_ref(db, rid) for rid in missing]
+        except ValueError:
+            continue  # 설정된 컬렉션 경로가 유효하지 않으면 다음 경로
+        for snapshot in transaction.get_all(refs):
+            if snapshot.exists:
+                snapshots[snapshot.id] = snapshot
+        record_reads(len(refs))
+    
+    # 1) 신청별 도구 ID 배정 (선택한 신청 사이 중복은 메모리 ID 집합으로 확인)
+    assigned: Dict[str, Any] = {}  # {도구 ID: (신청 ID, 신청 스냅샷, 입력값)} — 재실행마다 새로 계산
+    results: Dict[str, Dict[str, Any]] = {}
+    for registration_id in registration_ids:
+        snapshot = snapshots.get(registration_id)
+        if snapshot is None:
+            results[registration_id] = _approval_result(registration_id, None, "error", "등록 신청을 찾을 수 없습니다")
+            continue
+        registration = snapshot.to_dict() or {}
+        status = registration.get("status", "pending")
+        if status not in APPROVABLE_STATUSES:
+            results[registration_id] = _approval_result(registration_id, registration.get("toolId"), "skip", f"이미 처리된 신청 ({status})")
+            continue
+        tool_id, values = build_tool_from_registration(registration)
+        if tool_id is None:
+            results[registration_id] = _approval_result(registration_id, None, "error", "도구 이름으로 ID를 만들 수 없습니다")
+            continue
+        if tool_id in claimed_ids or tool_id in assigned:
+            results[registration_id] = _approval_result(registration_id, tool_id, "error", f"선택한 신청 사이에 도구 ID 중복: {tool_id}")
+            continue
+        assigned[tool_id] = (registration_id, snapshot, values)
+    
+    # 2) 도구 문서도 트랜잭션 안에서 읽어 생성/병합 판별 (목록 캐시는 오래됐을 수 있음)
+    tool_collection = db.collection(COLLECTIONS["AI_TOOLS"])
+    existing_ids = set()
+    if assigned:
+        tool_refs = [tool_collection.document(tool_id) for tool_id in assigned]
+        existing_ids = {snapshot.id for snapshot in transaction.get_all(tool_refs) if snapshot.exists}
+        record_reads(len(tool_refs))
+    
+    # 3) 쓰기
+    for tool_id, (registration_id, snapshot, values) in assigned.items():
+        tool_ref = tool_collection.document(tool_id)
+        if tool_id in existing_ids:
+            # 이미 있는 도구는 신청에 값이 있는 필드만 병합
+            action = "merge"
+            data = build_tool_document(values, for_update=True)
+            data["updatedAt"] = firestore.SERVER_TIMESTAMP
+            transaction.set(tool_ref, data, merge=True)
+        else:
+            action = "create"
+            data = build_tool_document(values)
+            data["createdAt"] = firestore.SERVER_TIMESTAMP
+            data["updatedAt"] = firestore.SERVER_TIMESTAMP
+            transaction.set(tool_ref, data)
+        transaction.update(snapshot.reference, {
+            "status": "approved",
+            "approvedAt": firestore.SERVER_TIMESTAMP,
+            "updatedAt": firestore.SERVER_TIMESTAMP,
+            "toolId": tool_id,
+        })
+        results[registration_id] = {**_approval_result(registration_id, tool_id, action), "data": data}
+    return [results[registration_id] for registration_id in registration_ids]
+
+
+@instrument(COLLECTIONS["TOOL_REGISTRATIONS"])
+def bulk_approve_registrations(registration_ids: List[str]) -> Tuple[bool, Dict[str, Any]]:
+    """
+    등록 신청 일괄 승인 + ai-tools 문서 생성·병합
+    
+    APPROVAL_BATCH_SIZE건씩 트랜잭션 1개로 신청 상태와 도구 문서를 함께 저장하므로
+    묶음 안에서는 승인만 되고 도구가 없는 상태가 생기지 않습니다.
+    도구 ID는 도구 등록 폼과 같이 이름으로 만들고(normalize_tool_id), 선택한 신청 사이의 중복은
+    이번 실행에서 배정한 ID 집합으로 확인합니다. 생성/병합은 트랜잭션 안에서 읽은 도구 문서로 판별하며,
+    캐시는 모든 묶음을 저장한 뒤 한 번만 무효화합니다.
+    
+    Args:
+        registration_ids: 승인할 등록 신청 ID 리스트
+        
+    Returns:
+        (모두 처리했는지, {"approved", "created", "merged", "skipped", "failed",
+                          "results": [{"registrationId", "toolId", "action", "error"}]})
+    """
+    registration_ids = list(dict.fromkeys(str(rid).strip() for rid in registration_ids if rid and str(rid).strip()))
+    stats: Dict[str, Any] = {"approved": 0, "created": 0, "merged": 0, "skipped": 0, "failed": 0, "results": []}
+    if not registration_ids:
+        return True, stats
+    db = get_db()
+    if db is None:
+        stats["failed"] = len(registration_ids)
+        return False, stats
+    
+    claimed_ids: set = set()
+    merged: Dict[str, Dict[str, Any]] = {}
+    error = None
+    for start in range(0, len(registration_ids), APPROVAL_BATCH_SIZE):
+        chunk = registration_ids[start:start + APPROVAL_BATCH_SIZE]
+        try:
+            results = _approve_registrations_in_transaction(db.transaction(), db, chunk, claimed_ids)
+        except Exception as e:
+            # 이 묶음은 전부 저장되지 않음 (트랜잭션 롤백), 다음 묶음은 계속 진행
+            error = e
+            results = [_approval_result(rid, None, "error", f"저장 실패: {e}") for rid in chunk]
+        
+        written = 0
+        for result in results:
+            data = result.pop("data", None)
+            if result["action"] in ("create", "merge"):
+                stats["approved"] += 1
+                written += 2
+                claimed_ids.add(result["toolId"])
+                if result["action"] == "create":
+                    stats["created"] += 1
+                else:
+                    stats["merged"] += 1
+                    merged[result["toolId"]] = data
+            elif result["action"] == "skip":
+                stats["skipped"] += 1
+            else:
+                stats["failed"] += 1
+            stats["results"].append(result)
+        if written:
+            record_writes(written)
+    
+    if stats["approved"]:
+        invalidate_collection(COLLECTIONS["TOOL_REGISTRATIONS"])
+        invalidate_collection(COLLECTIONS["AI_TOOLS"])
+        # 기존 도구의 원문 필드가 바뀌었으면 번역을 stale로 표시 (update_tool과 동일)
+        from .translation_freshness import mark_stale_translations_for_tool
+        for tool_id, data in merged.items():
+            mark_stale_translations_for_tool(tool_id, data)
+    if error is not None:
+        st.error(f"등록 신청 일괄 승인 실패 ({stats['failed']}건 미처리): {error}")
+    return stats["failed"] == 0, stats
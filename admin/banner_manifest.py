@@ -0,0 +1,243 @@
+"""
+배너 매니페스트 발행 (정적 JSON)
+
+프론트가 페이지 조회마다 banners / banner_slot_settings를 Firestore에서 읽지 않도록,
+현재 노출 중인 배너와 슬롯 레이아웃을 페이지별 JSON으로 컴파일해 정적 폴더에 씁니다.
+
+- 출력: {BANNER_MANIFEST_DIR}/{pageId}.json, index.json (페이지별 version 목록)
+- 페이지 매니페스트 구조:
+  { "schemaVersion", "page", "version", "generatedAt", "validUntil",
+    "spots": { spotId: { "layout", "maxBanners", "banners": [...] } } }
+- version: 내용 해시 (generatedAt 제외) — 내용이 같으면 파일을 다시 쓰지 않음
+- validUntil: 다음 일정 전환 시각 (LIVE 종료/예약 시작). 이 시각 이후 재발행 필요
+"""
+import os
+import json
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import BANNER_SPOTS, BANNER_PAGES, BANNER_DISPLAY_LAYOUTS, BANNER_MANIFEST_DIR
+from .banners import (
+    get_all_banners, get_all_banner_slot_settings, get_slot_setting_id, get_banner_status,
+)
+
+MANIFEST_SCHEMA_VERSION = 1
+MANIFEST_INDEX_FILE = "index.json"
+
+# 매니페스트에 포함하는 배너 필드 (관리용 필드 제외)
+_MANIFEST_BANNER_KEYS = (
+    "id", "priority", "webImageUrl", "webLinkUrl", "mobileImageUrl", "mobileLinkUrl",
+    "targetLanguages", "targetCountries", "displayEnd",
+)
+
+
+def get_manifest_page_ids() -> List[str]:
+    """매니페스트를 생성하는 페이지 ID 목록 ("all"은 실제 페이지가 아니므로 제외)"""
+    return [page_id for page_id in BANNER_PAGES.keys() if page_id != "all"]
+
+
+def get_affected_manifest_pages(page_id: Optional[str]) -> List[str]:
+    """
+    배너/슬롯의 pageId 기준으로 다시 생성해야 하는 페이지 목록
+
+    Args:
+        page_id: 배너 또는 슬롯 설정의 pageId (없거나 "all"이면 전체 페이지)
+
+    Returns:
+        List[str]: 페이지 ID 리스트
+    """
+    if not page_id or page_id == "all":
+        return get_manifest_page_ids()
+    if page_id in BANNER_PAGES:
+        return [page_id]
+    return []
+
+
+def _parse_schedule_datetime(value: Any) -> Optional[datetime]:
+    """displayStart/displayEnd 값을 naive datetime으로 변환 (get_banner_status와 동일 기준)"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
+
+
+def _resolve_layout(
+    spot_id: str,
+    page_id: str,
+    slot_settings: Dict[str, Dict[str, Any]],
+    banners: List[Dict[str, Any]],
+) -> str:
+    """슬롯 레이아웃 결정: 페이지 설정 → 전체 페이지 설정 → 배너 displayLayout → single"""
+    for pid in (page_id, "all"):
+        setting = slot_settings.get(get_slot_setting_id(spot_id, pid))
+        if setting and setting.get("displayLayout") in BANNER_DISPLAY_LAYOUTS:
+            return setting["displayLayout"]
+    for banner in banners:
+        if banner.get("displayLayout") in BANNER_DISPLAY_LAYOUTS:
+            return banner["displayLayout"]
+    return "single"
+
+
+def _compact_banner(banner: Dict[str, Any]) -> Dict[str, Any]:
+    """프론트에 필요한 필드만 남기고 빈 값은 제거"""
+    compact = {}
+    for key in _MANIFEST_BANNER_KEYS:
+        value = banner.get(key)
+        if value in (None, "", []):
+            continue
+        compact[key] = value
+    return compact
+
+
+def build_page_manifest(
+    page_id: str,
+    banners: List[Dict[str, Any]],
+    slot_settings: Dict[str, Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    한 페이지의 매니페스트 생성 (Firestore 접근 없음)
+
+    Args:
+        page_id: 페이지 ID
+        banners: 전체 배너 리스트
+        slot_settings: get_all_banner_slot_settings() 결과
+        now: 기준 시각 (기본: 현재)
+
+    Returns:
+        Dict: 매니페스트 (version 포함, generatedAt 제외)
+    """
+    now = now or datetime.now()
+    next_transition: Optional[datetime] = None
+    spots: Dict[str, Any] = {}
+
+    for spot_id in BANNER_SPOTS.keys():
+        page_banners = [
+            b for b in banners
+            if b.get("spotId") == spot_id
+            and (not b.get("pageId") or b.get("pageId") in ("all", page_id))
+        ]
+        layout = _resolve_layout(spot_id, page_id, slot_settings, page_banners)
+        max_banners = BANNER_DISPLAY_LAYOUTS[layout]["maxBanners"]
+
+        live: List[Dict[str, Any]] = []
+        for banner in page_banners:
+            status = get_banner_status(banner)
+            start_dt = _parse_schedule_datetime(banner.get("displayStart"))
+            end_dt = _parse_schedule_datetime(banner.get("displayEnd"))
+            if status == "live":
+                live.append(banner)
+                if end_dt and end_dt > now:
+                    next_transition = min(next_transition or end_dt, end_dt)
+            elif status == "scheduled" and start_dt and start_dt > now:
+                next_transition = min(next_transition or start_dt, start_dt)
+
+        live.sort(key=lambda b: int(b.get("priority", 999) or 999))
+        spots[spot_id] = {
+            "layout": layout,
+            "maxBanners": max_banners,
+            "banners": [_compact_banner(b) for b in live[:max_banners]],
+        }
+
+    manifest = {
+        "schemaVersion": MANIFEST_SCHEMA_VERSION,
+        "page": page_id,
+        "validUntil": next_transition.isoformat() if next_transition else None,
+        "spots": spots,
+    }
+    manifest["version"] = _manifest_version(manifest)
+    return manifest
+
+
+def _manifest_version(manifest: Dict[str, Any]) -> str:
+    """generatedAt을 제외한 내용 해시"""
+    payload = json.dumps(manifest, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 교체 (프론트가 반쯤 쓰인 파일을 읽지 않도록)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def publish_banner_manifests(
+    page_ids: Optional[Iterable[str]] = None,
+    output_dir: str = None,
+    create_dir: bool = False,
+) -> Tuple[bool, str]:
+    """
+    배너 매니페스트를 정적 폴더에 발행합니다.
+
+    Args:
+        page_ids: 다시 생성할 페이지 ID (None이면 전체 페이지)
+        output_dir: 대상 디렉터리 (기본: config.BANNER_MANIFEST_DIR)
+        create_dir: 디렉터리가 없으면 생성할지 여부
+
+    Returns:
+        (성공 여부, 메시지)
+    """
+    target_dir = output_dir or BANNER_MANIFEST_DIR
+    if not target_dir:
+        return False, "BANNER_MANIFEST_DIR이 설정되지 않았습니다."
+    if not os.path.isdir(target_dir):
+        if not create_dir:
+            return False, f"대상 디렉터리가 없습니다: {target_dir}"
+        os.makedirs(target_dir, exist_ok=True)
+
+    targets = list(dict.fromkeys(page_ids)) if page_ids is not None else get_manifest_page_ids()
+    targets = [p for p in targets if p in BANNER_PAGES and p != "all"]
+    if not targets:
+        return True, "갱신할 페이지가 없습니다."
+
+    try:
+        banners = get_all_banners()
+        slot_settings = get_all_banner_slot_settings()
+        generated_at = datetime.now(timezone.utc).isoformat()
+
+        index_path = os.path.join(target_dir, MANIFEST_INDEX_FILE)
+        index = _read_json(index_path) or {"schemaVersion": MANIFEST_SCHEMA_VERSION, "pages": {}}
+        index_pages = index.setdefault("pages", {})
+
+        written = []
+        for page_id in targets:
+            manifest = build_page_manifest(page_id, banners, slot_settings)
+            page_path = os.path.join(target_dir, f"{page_id}.json")
+            previous = index_pages.get(page_id) or {}
+            if previous.get("version") == manifest["version"] and os.path.isfile(page_path):
+                continue
+            manifest["generatedAt"] = generated_at
+            _write_json_atomic(page_path, manifest)
+            index_pages[page_id] = {
+                "version": manifest["version"],
+                "generatedAt": generated_at,
+                "validUntil": manifest["validUntil"],
+            }
+            written.append(page_id)
+
+        if written:
+            index["generatedAt"] = generated_at
+            _write_json_atomic(index_path, index)
+        return True, f"매니페스트 발행 완료: {len(written)}개 갱신 / {len(targets)}개 확인"
+    except Exception as e:
+        return False, f"매니페스트 발행 실패: {e}"
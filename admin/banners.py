@@ -3,17 +3,22 @@
 """
 import streamlit as st
 from firebase_admin import firestore
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable
 from datetime import datetime
+import os
 from .firebase import get_db
-from .config import COLLECTIONS
+from .config import COLLECTIONS, BANNER_MANIFEST_DIR
 from .utils import convert_firestore_data
+from .metrics import instrument, record_writes
+from .swr_cache import swr_cache, versioned_view
+from .shared_cache import invalidate_collection, register_local_cache
 
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@instrument(COLLECTIONS["BANNERS"])
+@swr_cache(ttl=300, error_message="배너 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_banners() -> List[Dict[str, Any]]:
     """
-    모든 배너 조회 (캐시됨)
+    모든 배너 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
         List[Dict]: 배너 리스트
@@ -22,22 +27,19 @@ def get_all_banners() -> List[Dict[str, Any]]:
     if db is None:
         return []
     
-    try:
-        banners_ref = db.collection(COLLECTIONS["BANNERS"])
-        docs = banners_ref.stream()
-        banners = []
-        for doc in docs:
-            banner_data = doc.to_dict()
-            banner_data["id"] = doc.id
-            banner_data = convert_firestore_data(banner_data)
-            banners.append(banner_data)
-        return banners
-    except Exception as e:
-        st.error(f"배너 조회 실패: {e}")
-        return []
+    banners_ref = db.collection(COLLECTIONS["BANNERS"])
+    docs = banners_ref.stream()
+    banners = []
+    for doc in docs:
+        banner_data = doc.to_dict()
+        banner_data["id"] = doc.id
+        banner_data = convert_firestore_data(banner_data)
+        banners.append(banner_data)
+    return banners
 
 
-@st.cache_data(ttl=60)  # 1분 캐시
+@instrument(COLLECTIONS["BANNERS"])
+@versioned_view(get_all_banners)  # 배너 목록이 바뀔 때만 다시 계산
 def get_banners_by_spot(spot_id: str) -> List[Dict[str, Any]]:
     """
     특정 위치의 배너 목록 조회 (우선순위 순으로 정렬)
@@ -58,6 +60,7 @@ def get_banners_by_spot(spot_id: str) -> List[Dict[str, Any]]:
     return spot_banners
 
 
+@instrument(COLLECTIONS["BANNERS"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_banner_by_id(banner_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -87,6 +90,43 @@ def get_banner_by_id(banner_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["BANNERS"], get_all_banners.clear, get_banners_by_spot.clear, get_banner_by_id.clear)
+
+
+def _clear_banner_caches() -> None:
+    """배너 조회 캐시 일괄 무효화 (모든 인스턴스)"""
+    invalidate_collection(COLLECTIONS["BANNERS"])
+
+
+def _get_cached_banner_page_id(banner_id: str) -> Optional[str]:
+    """캐시된 배너 목록에서 기존 pageId 조회 (매니페스트 갱신 대상 계산용)"""
+    for banner in get_all_banners():
+        if banner.get("id") == banner_id:
+            return banner.get("pageId") or "all"
+    return None
+
+
+def _publish_affected_manifests(page_ids: Iterable[Optional[str]]) -> None:
+    """
+    저장된 배너/슬롯의 pageId에 해당하는 매니페스트만 다시 발행
+    (BANNER_MANIFEST_DIR 폴더가 있을 때만 동작, 실패해도 저장은 유지)
+    """
+    if not BANNER_MANIFEST_DIR or not os.path.isdir(BANNER_MANIFEST_DIR):
+        return
+    from .banner_manifest import get_affected_manifest_pages, publish_banner_manifests
+
+    targets: List[str] = []
+    for page_id in page_ids:
+        targets.extend(get_affected_manifest_pages(page_id))
+    if not targets:
+        return
+    ok, msg = publish_banner_manifests(targets)
+    if not ok:
+        st.warning(msg)
+
+
+@instrument(COLLECTIONS["BANNERS"])
 def update_banner(banner_id: str, data: Dict[str, Any]) -> bool:
     """
     배너 정보 업데이트
@@ -103,19 +143,20 @@ def update_banner(banner_id: str, data: Dict[str, Any]) -> bool:
         return False
     
     try:
+        previous_page_id = _get_cached_banner_page_id(banner_id)
         doc_ref = db.collection(COLLECTIONS["BANNERS"]).document(banner_id)
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.update(data)
         # 캐시 무효화
-        get_all_banners.clear()
-        get_banners_by_spot.clear()
-        get_banner_by_id.clear()
+        _clear_banner_caches()
+        _publish_affected_manifests([previous_page_id, data.get("pageId", previous_page_id)])
         return True
     except Exception as e:
         st.error(f"배너 업데이트 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["BANNERS"])
 def create_banner(banner_id: str, data: Dict[str, Any]) -> bool:
     """
     새 배너 생성
@@ -137,15 +178,15 @@ def create_banner(banner_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.set(data)
         # 캐시 무효화
-        get_all_banners.clear()
-        get_banners_by_spot.clear()
-        get_banner_by_id.clear()
+        _clear_banner_caches()
+        _publish_affected_manifests([data.get("pageId") or "all"])
         return True
     except Exception as e:
         st.error(f"배너 생성 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["BANNERS"])
 def delete_banner(banner_id: str) -> bool:
     """
     배너 삭제
@@ -161,18 +202,19 @@ def delete_banner(banner_id: str) -> bool:
         return False
     
     try:
+        previous_page_id = _get_cached_banner_page_id(banner_id)
         doc_ref = db.collection(COLLECTIONS["BANNERS"]).document(banner_id)
         doc_ref.delete()
         # 캐시 무효화
-        get_all_banners.clear()
-        get_banners_by_spot.clear()
-        get_banner_by_id.clear()
+        _clear_banner_caches()
+        _publish_affected_manifests([previous_page_id])
         return True
     except Exception as e:
         st.error(f"배너 삭제 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["BANNERS"])
 def update_banner_priority(banner_id: str, new_priority: int) -> bool:
     """
     배너 우선순위 업데이트
@@ -192,6 +234,7 @@ def get_slot_setting_id(spot_id: str, page_id: str) -> str:
     return f"{spot_id}__{page_id}"
 
 
+@instrument(COLLECTIONS["BANNER_SLOT_SETTINGS"])
 @st.cache_data(ttl=60)
 def get_all_banner_slot_settings() -> Dict[str, Dict[str, Any]]:
     """모든 슬롯 디스플레이 설정 조회 (key: spotId__pageId)"""
@@ -211,25 +254,23 @@ def get_all_banner_slot_settings() -> Dict[str, Dict[str, Any]]:
         return {}
 
 
-@st.cache_data(ttl=60)
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["BANNER_SLOT_SETTINGS"], get_all_banner_slot_settings.clear)
+
+
 def get_banner_slot_setting(spot_id: str, page_id: str) -> Dict[str, Any]:
-    """특정 슬롯+페이지 디스플레이 설정 조회"""
-    db = get_db()
-    if db is None:
-        return {}
+    """
+    특정 슬롯+페이지 디스플레이 설정 조회
+    (get_all_banner_slot_settings 맵에서 조회, 없으면 기본값)
+    """
     doc_id = get_slot_setting_id(spot_id, page_id)
-    try:
-        doc = db.collection(COLLECTIONS["BANNER_SLOT_SETTINGS"]).document(doc_id).get()
-        if doc.exists:
-            data = convert_firestore_data(doc.to_dict() or {})
-            data["id"] = doc.id
-            return data
-        return {"displayLayout": "single", "spotId": spot_id, "pageId": page_id}
-    except Exception as e:
-        st.error(f"슬롯 설정 조회 실패: {e}")
-        return {"displayLayout": "single", "spotId": spot_id, "pageId": page_id}
+    setting = get_all_banner_slot_settings().get(doc_id)
+    if setting:
+        return {"displayLayout": "single", "spotId": spot_id, "pageId": page_id, **setting}
+    return {"displayLayout": "single", "spotId": spot_id, "pageId": page_id}
 
 
+@instrument(COLLECTIONS["BANNER_SLOT_SETTINGS"])
 def upsert_banner_slot_setting(spot_id: str, page_id: str, display_layout: str) -> bool:
     """슬롯+페이지 디스플레이 레이아웃 저장"""
     db = get_db()
@@ -243,14 +284,216 @@ def upsert_banner_slot_setting(spot_id: str, page_id: str, display_layout: str)
             "displayLayout": display_layout,
             "updatedAt": firestore.SERVER_TIMESTAMP,
         }, merge=True)
-        get_all_banner_slot_settings.clear()
-        get_banner_slot_setting.clear()
+        invalidate_collection(COLLECTIONS["BANNER_SLOT_SETTINGS"])
+        _publish_affected_manifests([page_id])
         return True
     except Exception as e:
         st.error(f"슬롯 설정 저장 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["BANNERS"])
+def commit_banner_group(
+    spot_id: str,
+    page_id: str,
+    creates: Optional[Dict[str, Dict[str, Any]]] = None,
+    updates: Optional[Dict[str, Dict[str, Any]]] = None,
+    deletes: Optional[Iterable[str]] = None,
+    display_layout: Optional[str] = None,
+) -> bool:
+    """
+    슬롯+페이지 배너 그룹 변경을 하나의 batch로 저장
+    (전부 적용되거나 전부 실패, 캐시 무효화·매니페스트 갱신은 1회)
+
+    Args:
+        spot_id: 배너 위치 ID
+        page_id: 페이지 ID
+        creates: {배너 ID: 배너 데이터} 신규 생성
+        updates: {배너 ID: 변경 필드} 부분 업데이트
+        deletes: 삭제할 배너 ID 목록
+        display_layout: 지정 시 banner_slot_settings 레이아웃도 함께 저장
+
+    Returns:
+        bool: 성공 여부
+    """
+    creates = creates or {}
+    updates = updates or {}
+    deletes = [banner_id for banner_id in (deletes or []) if banner_id]
+    if not (creates or updates or deletes or display_layout):
+        record_writes(0)
+        return True
+
+    db = get_db()
+    if db is None:
+        return False
+
+    try:
+        banners_ref = db.collection(COLLECTIONS["BANNERS"])
+        batch = db.batch()
+        affected_pages = {page_id}
+
+        for banner_id, data in creates.items():
+            payload = dict(data)
+            payload["createdAt"] = firestore.SERVER_TIMESTAMP
+            payload["updatedAt"] = firestore.SERVER_TIMESTAMP
+            batch.set(banners_ref.document(banner_id), payload)
+            affected_pages.add(payload.get("pageId") or "all")
+
+        for banner_id, data in updates.items():
+            payload = dict(data)
+            payload["updatedAt"] = firestore.SERVER_TIMESTAMP
+            batch.update(banners_ref.document(banner_id), payload)
+            affected_pages.add(_get_cached_banner_page_id(banner_id))
+            if "pageId" in payload:
+                affected_pages.add(payload["pageId"])
+
+        for banner_id in deletes:
+            batch.delete(banners_ref.document(banner_id))
+            affected_pages.add(_get_cached_banner_page_id(banner_id))
+
+        if display_layout:
+            doc_id = get_slot_setting_id(spot_id, page_id)
+            batch.set(db.collection(COLLECTIONS["BANNER_SLOT_SETTINGS"]).document(doc_id), {
+                "spotId": spot_id,
+                "pageId": page_id,
+                "displayLayout": display_layout,
+                "updatedAt": firestore.SERVER_TIMESTAMP,
+            }, merge=True)
+
+        batch.commit()
+        record_writes(len(creates) + len(updates) + len(deletes) + (1 if display_layout else 0))
+
+        _clear_banner_caches()
+        if display_layout:
+            invalidate_collection(COLLECTIONS["BANNER_SLOT_SETTINGS"])
+        _publish_affected_manifests(affected_pages)
+        return True
+    except Exception as e:
+        st.error(f"배너 그룹 저장 실패: {e}")
+        return False
+
+
+# 순서 변경 시 새로 매기는 우선순위 간격 (사이에 끼워 넣을 여유)
+BANNER_PRIORITY_STEP = 10
+
+
+def filter_banners_for_page(banners: List[Dict[str, Any]], page_id: str) -> List[Dict[str, Any]]:
+    """
+    특정 페이지(또는 전체 페이지)에 노출되는 배너만 필터
+
+    Args:
+        banners: 배너 리스트
+        page_id: 페이지 ID
+
+    Returns:
+        List[Dict]: pageId가 비었거나 "all"이거나 page_id인 배너
+    """
+    return [
+        b for b in banners
+        if not b.get("pageId") or b.get("pageId") == "all" or b.get("pageId") == page_id
+    ]
+
+
+def _banner_priority(banner: Dict[str, Any]) -> int:
+    try:
+        return int(banner.get("priority", 999))
+    except (TypeError, ValueError):
+        return 999
+
+
+def _kept_positions(priorities: List[int]) -> set:
+    """우선순위가 엄격히 증가하는 가장 긴 부분 수열의 위치 (그대로 둘 배너)"""
+    tails: List[int] = []  # 길이별 마지막 위치
+    parents: List[Optional[int]] = [None] * len(priorities)
+    for index, priority in enumerate(priorities):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if priorities[tails[mid]] < priority:
+                lo = mid + 1
+            else:
+                hi = mid
+        parents[index] = tails[lo - 1] if lo else None
+        if lo == len(tails):
+            tails.append(index)
+        else:
+            tails[lo] = index
+    kept = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        kept.add(index)
+        index = parents[index]
+    return kept
+
+
+def _plan_priorities(priorities: List[int]) -> List[int]:
+    """
+    새 순서의 현재 우선순위 → 새 우선순위 (상대 위치가 유지되는 배너는 그대로)
+
+    옮긴 배너는 앞뒤 배너 우선순위 사이의 빈 정수에 배치하고,
+    빈 값이 모자라면 전체를 BANNER_PRIORITY_STEP 간격으로 다시 매깁니다 (다음 변경부터는 여유가 생김).
+    """
+    kept = _kept_positions(priorities)
+    planned = list(priorities)
+    index = 0
+    while index < len(priorities):
+        if index in kept:
+            index += 1
+            continue
+        run_end = index
+        while run_end < len(priorities) and run_end not in kept:
+            run_end += 1
+        low = planned[index - 1] if index > 0 else 0
+        count = run_end - index
+        if run_end < len(priorities):
+            high = priorities[run_end]
+            if high - low - 1 < count:
+                return [BANNER_PRIORITY_STEP * (i + 1) for i in range(len(priorities))]
+            gap = (high - low) // (count + 1)
+            values = [low + gap * (i + 1) for i in range(count)]
+        else:
+            values = [low + BANNER_PRIORITY_STEP * (i + 1) for i in range(count)]
+        planned[index:run_end] = values
+        index = run_end
+    return planned
+
+
+@instrument(COLLECTIONS["BANNERS"])
+def reorder_banners(spot_id: str, page_id: str, ordered_ids: List[str]) -> bool:
+    """
+    슬롯+페이지 배너 순서 일괄 변경
+    상대 순서가 그대로인 배너는 두고, 옮긴 배너만 앞뒤 우선순위 사이 값으로 하나의 batch에 저장
+
+    Args:
+        spot_id: 배너 위치 ID
+        page_id: 페이지 ID
+        ordered_ids: 새 순서의 배너 ID 리스트 (빠진 페이지 배너는 현재 순서대로 뒤에 붙임)
+
+    Returns:
+        bool: 성공 여부 (변경 사항이 없어도 True)
+    """
+    page_banners = sorted(
+        (b for b in filter_banners_for_page(get_banners_by_spot(spot_id), page_id) if b.get("id")),
+        key=_banner_priority,
+    )
+    current = {b["id"]: b for b in page_banners}
+    ordered_ids = list(dict.fromkeys(ordered_ids))
+    unknown = [banner_id for banner_id in ordered_ids if banner_id not in current]
+    if unknown:
+        st.error(f"배너 순서 변경 실패: 이 페이지에 없는 배너 {', '.join(unknown)}")
+        return False
+    ordered_ids += [b["id"] for b in page_banners if b["id"] not in ordered_ids]
+
+    priorities = [_banner_priority(current[banner_id]) for banner_id in ordered_ids]
+    planned = _plan_priorities(priorities)
+    updates = {
+        banner_id: {"priority": new_priority}
+        for banner_id, old_priority, new_priority in zip(ordered_ids, priorities, planned)
+        if old_priority != new_priority
+    }
+    return commit_banner_group(spot_id, page_id, updates=updates)
+
+
 def get_banner_status(banner: Dict[str, Any]) -> str:
     """
     배너의 현재 상태 계산 (LIVE, SCHEDULED, OFF)
@@ -8,12 +8,16 @@ from .firebase import get_db
 from .config import COLLECTIONS, CATEGORIES
 from .tools import get_all_tools
 from .utils import convert_firestore_data
+from .metrics import instrument
+from .shared_cache import invalidate_collection, register_local_cache
+from .swr_cache import versioned_view
 
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@instrument(COLLECTIONS["AI_TOOLS"])
+@versioned_view(get_all_tools)  # 도구 목록이 바뀔 때만 다시 집계
 def get_category_statistics() -> Dict[str, int]:
     """
-    카테고리별 도구 수 통계
+    카테고리별 도구 수 통계 (도구 목록 버전별로 1회 계산, 호출 간 공유)
     
     Returns:
         Dict: 카테고리 ID별 도구 수
@@ -50,9 +54,15 @@ def get_category_statistics() -> Dict[str, int]:
     return stats
 
 
+# 도구 저장 시에도 통계가 바뀌므로 두 컬렉션 모두에 등록 (모든 인스턴스에서 함께 비움)
+register_local_cache(COLLECTIONS["AI_TOOLS"], get_category_statistics.clear)
+register_local_cache(COLLECTIONS["CATEGORIES"], get_category_statistics.clear)
+
+
+@versioned_view(get_all_tools)
 def get_tools_by_category(category_id: str) -> List[Dict[str, Any]]:
     """
-    특정 카테고리의 도구 목록 조회
+    특정 카테고리의 도구 목록 조회 (도구 목록 버전·카테고리별로 1회 계산, 호출 간 공유)
     
     Args:
         category_id: 카테고리 ID
@@ -95,6 +105,27 @@ def get_tools_by_category(category_id: str) -> List[Dict[str, Any]]:
     return filtered_tools
 
 
+def resolve_category(value: Any) -> Optional[str]:
+    """
+    카테고리 이름 또는 ID를 CATEGORIES 키(한글 이름)로 변환 (일괄 등록 검증용)
+    
+    Args:
+        value: "텍스트 생성" 또는 "text-generation" 등 (대소문자 무시)
+        
+    Returns:
+        str: CATEGORIES 키 ("전체"와 알 수 없는 값은 None)
+    """
+    text = str(value or "").strip().lower()
+    if not text:
+        return None
+    for cat_name, cat_info in CATEGORIES.items():
+        if cat_name == "전체":
+            continue
+        if text == cat_name.lower() or text == cat_info["id"]:
+            return cat_name
+    return None
+
+
 def get_all_categories() -> List[Dict[str, Any]]:
     """
     모든 카테고리 정보 조회 (config 기반)
@@ -124,6 +155,7 @@ def get_all_categories() -> List[Dict[str, Any]]:
     return categories
 
 
+@instrument(COLLECTIONS["CATEGORIES"])
 def update_category(category_id: str, data: Dict[str, Any]) -> bool:
     """
     카테고리 정보 업데이트 (Firebase categories 컬렉션에 저장)
@@ -144,7 +176,7 @@ def update_category(category_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.set(data, merge=True)  # merge=True로 부분 업데이트
         # 캐시 무효화
-        get_category_statistics.clear()
+        invalidate_collection(COLLECTIONS["CATEGORIES"])
         return True
     except Exception as e:
         st.error(f"카테고리 업데이트 실패: {e}")
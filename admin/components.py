@@ -5,7 +5,12 @@ import streamlit as st
 from typing import List, Dict, Optional
 from datetime import datetime
 from .menu import get_menu_translation, get_current_language
-from .config import SUPPORTED_LANGUAGES
+from .config import SUPPORTED_LANGUAGES, METRICS_DEBUG_PANEL
+from .metrics import begin_rerun, get_session_metrics, metrics_rows
+from .metrics_exporter import start_metrics_exporter
+from .jobs import start_job_workers
+from .shared_cache import sync_shared_cache
+from .swr_cache import get_refresh_status
 from .i18n import t
 
 
@@ -133,12 +138,86 @@ def render_page_header(title: str, description: Optional[str] = None):
         title: 페이지 제목
         description: 페이지 설명 (선택)
     """
+    begin_rerun()
+    start_metrics_exporter()  # 메인 페이지를 거치지 않고 하위 페이지로 바로 진입한 경우 대비
+    start_job_workers()  # 재시작 전에 대기열에 남은 작업 이어서 실행 (프로세스당 1회)
+    sync_shared_cache()  # 놓친 인스턴스 간 무효화 메시지 보정
+    with st.sidebar:
+        render_refresh_status()
+    render_metrics_debug_panel()
     st.markdown(f"## {title}")
     if description:
         st.caption(description)
     st.markdown("---")
 
 
+def render_refresh_status():
+    """
+    데이터 갱신 상태 표시 (마지막 갱신 시각, 백그라운드 갱신 중 여부, 갱신 실패)
+    swr_cache 로더 중 이 프로세스에서 조회된 것만 표시
+    """
+    rows = get_refresh_status()
+    if not rows:
+        return
+    refreshing = sorted({row["name"] for row in rows if row["refreshing"]})
+    oldest = datetime.fromtimestamp(min(row["loaded_at"] for row in rows)).strftime("%H:%M:%S")
+    if refreshing:
+        st.caption(f"🔄 백그라운드 갱신 중: {', '.join(refreshing)} · 마지막 갱신 {oldest}")
+    else:
+        st.caption(f"🕒 데이터 마지막 갱신 {oldest}")
+    for row in rows:
+        if row["error"]:
+            st.caption(f"⚠️ {row['name']} 갱신 실패 (이전 데이터 표시 중): {row['error']}")
+
+
+# 백그라운드 갱신이 끝나면 표시가 바뀌도록 주기적으로 다시 그림 (st.fragment 미지원 버전은 rerun 때만)
+if hasattr(st, "fragment"):
+    render_refresh_status = st.fragment(run_every=5)(render_refresh_status)
+
+
+JOBS_PAGE_PATH = "pages/11_⏳_작업_관리.py"
+
+
+def render_job_submitted(job_id: str, label: str):
+    """
+    백그라운드 작업 등록 안내 (작업 관리 페이지 링크)
+    
+    Args:
+        job_id: submit_job()이 반환한 작업 ID
+        label: 작업 설명
+    """
+    st.success(f"⏳ 백그라운드 작업을 등록했습니다: {label} (ID `{job_id[:8]}`) — 창을 닫아도 계속 실행됩니다.")
+    st.page_link(JOBS_PAGE_PATH, label="작업 관리에서 진행 상황 보기", icon="⏳")
+
+
+def render_metrics_debug_panel():
+    """
+    사이드바 데이터 접근 디버그 패널 (METRICS_DEBUG_PANEL일 때만)
+    직전 rerun과 세션 누적의 Firestore 읽기/쓰기 수, 캐시 hit/miss, 소요 시간 표시
+    """
+    if not METRICS_DEBUG_PANEL:
+        return
+    if not st.sidebar.toggle("🔍 데이터 접근 디버그", key="metrics_debug_panel"):
+        return
+    metrics = get_session_metrics()
+    if not metrics:
+        return
+
+    with st.sidebar:
+        for label, bucket in (("직전 rerun", metrics.get("last")), ("세션 누적", metrics.get("session"))):
+            st.markdown(f"**{label}**")
+            if not bucket or not bucket["totals"]["calls"]:
+                st.caption("기록 없음")
+                continue
+            totals = bucket["totals"]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("읽기", f"{totals['reads']:,}")
+            col2.metric("쓰기", f"{totals['writes']:,}")
+            col3.metric("ms", f"{totals['ms']:,.0f}")
+            st.caption(f"호출 {totals['calls']}회 · 캐시 hit {totals['hits']} / miss {totals['misses']}")
+            st.dataframe(metrics_rows(bucket["functions"]), hide_index=True, use_container_width=True)
+
+
 def render_info_box(message: str, type: str = "info"):
     """
     정보 박스 렌더링
@@ -83,6 +83,7 @@ BANNER_PAGES = {
 }
 
 # 배너 디스플레이 레이아웃 (Popular AI Tools 상단 등 그리드 배치)
+# webPx/mobilePx: 권장 이미지 크기 (가로, 세로) — 저장 시 이미지 검증 기준
 BANNER_DISPLAY_LAYOUTS = {
     "single": {
         "id": "single",
@@ -90,6 +91,8 @@ BANNER_DISPLAY_LAYOUTS = {
         "maxBanners": 1,
         "webSize": "1400 × 200px (비율 7:1)",
         "mobileSize": "750 × 150px (비율 5:1)",
+        "webPx": (1400, 200),
+        "mobilePx": (750, 150),
         "description": "전폭 가로형 히어로 배너 1장",
     },
     "double": {
@@ -98,6 +101,8 @@ BANNER_DISPLAY_LAYOUTS = {
         "maxBanners": 2,
         "webSize": "690 × 350px (비율 2:1) × 2장",
         "mobileSize": "360 × 200px (비율 16:9) × 2장",
+        "webPx": (690, 350),
+        "mobilePx": (360, 200),
         "description": "좌우 2분할 직사각형 배너",
     },
     "quad": {
@@ -106,6 +111,8 @@ BANNER_DISPLAY_LAYOUTS = {
         "maxBanners": 4,
         "webSize": "335 × 445px (비율 3:4) × 4장",
         "mobileSize": "170 × 230px (비율 3:4) × 4장",
+        "webPx": (335, 445),
+        "mobilePx": (170, 230),
         "description": "포스터 스타일 최대 4열 (등록 수만 노출, 모바일 2×2)",
     },
 }
@@ -226,6 +233,10 @@ FIREBASE_SERVICE_ACCOUNT_KEY_PATH = os.getenv(
 )
 FIREBASE_SERVICE_ACCOUNT_KEY_JSON = os.getenv("FIREBASE_SERVICE_ACCOUNT_KEY_JSON")
 
+# Firestore 에뮬레이터 (벤치마크·로컬 테스트용). 설정 시 서비스 계정 키 없이 에뮬레이터에 연결
+FIRESTORE_EMULATOR_HOST = os.getenv("FIRESTORE_EMULATOR_HOST", "")
+FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID", "aicuratorhub-local")
+
 # A6: UI 텍스트 ↔ 프론트 JSON 동기화용 경로 (프론트 public/lang 폴더)
 # Streamlit Cloud 등 배포 환경에서 _base_dir 경로가 없을 수 있으므로 예외 시 빈 문자열로 폴백
 try:
@@ -233,3 +244,68 @@ try:
 except Exception:
     _front_lang_default = ""
 FRONT_LANG_JSON_DIR = os.getenv("FRONT_LANG_JSON_DIR", _front_lang_default)
+
+# 배너 매니페스트 발행 경로 (프론트 public/banners 폴더, 페이지별 {pageId}.json)
+# 폴더가 존재할 때만 배너/슬롯 저장 시 자동 갱신됩니다. 빈 문자열이면 비활성화.
+try:
+    _banner_manifest_default = os.path.join(_base_dir, "ai_site_20_vt", "public", "banners")
+except Exception:
+    _banner_manifest_default = ""
+BANNER_MANIFEST_DIR = os.getenv("BANNER_MANIFEST_DIR", _banner_manifest_default)
+
+# 이미지 미리보기 썸네일 캐시 경로 (URL+ETag 기준, 로컬 디스크)
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", os.path.join(_project_root, ".cache", "images"))
+# 배너 이미지 권장 최대 용량 (초과 시 저장 시 경고)
+BANNER_IMAGE_MAX_BYTES = int(os.getenv("BANNER_IMAGE_MAX_BYTES", str(500 * 1024)))
+
+# 데이터 접근 계측 (Firestore 읽기/쓰기 수·캐시 hit/miss·소요 시간)
+METRICS_ENABLED = os.getenv("ADMIN_METRICS_ENABLED", "1") != "0"
+# 사이드바 디버그 패널 표시 여부 (기본: 개발 환경에서만)
+METRICS_DEBUG_PANEL = os.getenv("ADMIN_METRICS_DEBUG_PANEL", "1" if DEBUG else "0") == "1"
+# 호출 기록 JSON Lines 경로 (기본: 기록 안 함, 분석할 때만 지정), 최대 크기 초과 시 .1로 교체
+METRICS_LOG_PATH = os.getenv("ADMIN_METRICS_LOG_PATH", "")
+METRICS_LOG_MAX_BYTES = int(os.getenv("ADMIN_METRICS_LOG_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# 메트릭 내보내기 (Prometheus/OpenMetrics)
+# 포트 지정 시 별도 HTTP 엔드포인트(/metrics), 경로 지정 시 node_exporter textfile collector용 파일 주기 기록
+# 엔드포인트는 인증이 없어 기본값은 비활성화·루프백 바인딩 (다른 호스트에서 스크레이프하면 프라이빗 주소 지정)
+METRICS_EXPORTER_PORT = int(os.getenv("ADMIN_METRICS_PORT", "0"))
+METRICS_EXPORTER_ADDRESS = os.getenv("ADMIN_METRICS_ADDRESS", "127.0.0.1")
+METRICS_TEXTFILE_PATH = os.getenv("ADMIN_METRICS_TEXTFILE", "")
+METRICS_TEXTFILE_INTERVAL_SECONDS = int(os.getenv("ADMIN_METRICS_TEXTFILE_INTERVAL", "15"))
+METRICS_EXPORTER_ENABLED = bool(METRICS_EXPORTER_PORT or METRICS_TEXTFILE_PATH)
+
+# 재배포 후에도 유지해야 하는 로컬 데이터(스냅샷·작업 대기열·내보내기) 기본 디렉터리
+# 컨테이너 배포에서는 영구 디스크/볼륨 경로로 지정 (Dockerfile VOLUME /data, render.yaml disk)
+DATA_DIR = os.getenv("ADMIN_DATA_DIR", os.path.join(_project_root, ".cache"))
+
+# 컬렉션 스냅샷 디스크 캐시 (재시작 후 첫 조회를 디스크에서 처리, updatedAt 이후 변경분만 Firestore 조회)
+SNAPSHOT_CACHE_ENABLED = os.getenv("ADMIN_SNAPSHOT_CACHE", "1") != "0"
+SNAPSHOT_CACHE_PATH = os.getenv("ADMIN_SNAPSHOT_CACHE_PATH", os.path.join(DATA_DIR, "snapshots.sqlite3"))
+# 이 시간이 지나면 전체 조회로 스냅샷 교체 (외부 삭제·updatedAt 없는 변경 정리)
+SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv("ADMIN_SNAPSHOT_MAX_AGE_SECONDS", str(6 * 3600)))
+
+# 인스턴스 간 공유 캐시 (redis://… 또는 memory://, 빈 값이면 로컬 캐시만 사용)
+SHARED_CACHE_URL = os.getenv("ADMIN_SHARED_CACHE_URL", "")
+SHARED_CACHE_PREFIX = os.getenv("ADMIN_SHARED_CACHE_PREFIX", "aicuratorhub-admin")
+# 공유 저장소 보관 시간 (무효화 메시지가 오면 버전이 바뀌어 바로 다시 조회)
+SHARED_CACHE_TTL_SECONDS = int(os.getenv("ADMIN_SHARED_CACHE_TTL_SECONDS", "900"))
+# 놓친 무효화 메시지 보정용 버전 조회 간격 / 다른 인스턴스가 채우는 결과를 기다리는 최대 시간
+SHARED_CACHE_SYNC_INTERVAL_SECONDS = int(os.getenv("ADMIN_SHARED_CACHE_SYNC_INTERVAL", "5"))
+SHARED_CACHE_LOCK_WAIT_SECONDS = float(os.getenv("ADMIN_SHARED_CACHE_LOCK_WAIT", "10"))
+
+# 컬렉션 내보내기 (NDJSON/Parquet — 설정 페이지, scripts/export_collections.py)
+EXPORT_DIR = os.getenv("ADMIN_EXPORT_DIR", os.path.join(DATA_DIR, "exports"))
+# 1회 조회·기록 문서 수 (메모리 사용량 상한)
+EXPORT_CHUNK_SIZE = int(os.getenv("ADMIN_EXPORT_CHUNK_SIZE", "500"))
+
+# 백그라운드 작업 (admin.jobs — 작업 페이지, 일괄 번역·가져오기·내보내기 등)
+JOBS_DB_PATH = os.getenv("ADMIN_JOBS_DB_PATH", os.path.join(DATA_DIR, "jobs.sqlite3"))
+# 업로드 파일 등 작업 입력 파일 보관 디렉터리
+JOBS_FILES_DIR = os.getenv("ADMIN_JOBS_FILES_DIR", os.path.join(DATA_DIR, "job_files"))
+# 동시에 실행할 작업 수 (워커 스레드 수)
+JOBS_WORKERS = int(os.getenv("ADMIN_JOBS_WORKERS", "2"))
+# 이 시간 동안 진행 기록이 없는 running 작업은 중단된 것으로 보고 다시 대기열에 넣음 (프로세스 재시작 등)
+JOBS_STALE_SECONDS = int(os.getenv("ADMIN_JOBS_STALE_SECONDS", "120"))
+# 끝난 작업 기록 보관 기간
+JOBS_RETENTION_DAYS = int(os.getenv("ADMIN_JOBS_RETENTION_DAYS", "14"))
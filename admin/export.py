@@ -0,0 +1,388 @@
+"""
+컬렉션 스냅샷 내보내기 (NDJSON / Parquet)
+
+COLLECTIONS의 모든 컬렉션과 사용자 서브컬렉션(users/*/favorites 등)을 문서 ID 순 커서로
+EXPORT_CHUNK_SIZE건씩 조회해 청크마다 convert_firestore_data 후 파일에 이어 씁니다.
+컬렉션 전체를 메모리에 올리지 않으며, 청크마다 체크포인트({이름}.{형식}.checkpoint.json)를
+기록해 중단되면 마지막 커서부터 이어서 내보냅니다.
+
+- ndjson: {이름}.ndjson (문서 1건당 JSON 한 줄)
+- parquet: {이름}.parquet/part-00000.parquet … (청크 1개 = 파일 1개, pyarrow 필요)
+  중첩 값(dict/list)과 타입이 섞인 필드는 JSON 문자열 열로 저장합니다.
+  파트마다 열 구성이 다를 수 있으므로 read_parquet_export()로 읽으면 열을 맞춰 합칩니다.
+
+설정 페이지(캐시·내보내기 탭)와 scripts/export_collections.py에서 사용합니다.
+"""
+import os
+import re
+import glob
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .firebase import get_db
+from .config import COLLECTIONS, EXPORT_DIR, EXPORT_CHUNK_SIZE
+from .users import USER_SUBCOLLECTIONS
+from .utils import convert_firestore_data
+from .metrics import instrument, record_reads
+
+EXPORT_FORMATS = ("ndjson", "parquet")
+
+# 목록 로더와 같은 문서 ID 키
+_ID_FIELDS = {"USERS": "uid"}
+
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+def get_export_targets() -> Dict[str, Dict[str, Any]]:
+    """
+    내보낼 수 있는 대상 목록
+
+    Returns:
+        Dict[str, Dict]: {대상 키: {"label", "path", "group"}}
+            group=True면 path는 서브컬렉션 이름 (users/*/{path}, collection group 조회)
+    """
+    targets = {
+        key: {"label": path, "path": path, "group": False}
+        for key, path in COLLECTIONS.items()
+    }
+    for name in USER_SUBCOLLECTIONS:
+        targets[f"USERS/{name}"] = {"label": f"{COLLECTIONS['USERS']}/*/{name}", "path": name, "group": True}
+    return targets
+
+
+def _slug(target_key: str) -> str:
+    return re.sub(r"\W+", "_", target_key.lower()).strip("_")
+
+
+def _output_paths(target_key: str, fmt: str, output_dir: str) -> Tuple[str, str]:
+    """(데이터 경로, 체크포인트 경로)"""
+    slug = _slug(target_key)
+    return (
+        os.path.join(output_dir, f"{slug}.{fmt}"),
+        os.path.join(output_dir, f"{slug}.{fmt}.checkpoint.json"),
+    )
+
+
+def _read_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_checkpoint(path: str, data: Dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 교체 (중단 시 반쯤 쓰인 체크포인트가 남지 않도록)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _base_query(db, target: Dict[str, Any]):
+    if target["group"]:
+        return db.collection_group(target["path"])
+    path = target["path"]
+    if len(path.split("/")) % 2 == 0:
+        # applications/tool-registrations 처럼 문서 경로인 경우 requests 서브컬렉션 (등록 신청 로더와 동일)
+        path = f"{path}/requests"
+    return db.collection(path)
+
+
+def _fetch_chunk(db, target: Dict[str, Any], cursor: Optional[str], chunk_size: int) -> List[Any]:
+    """문서 경로 순으로 cursor 다음 chunk_size건 조회"""
+    query = _base_query(db, target).order_by("__name__").limit(chunk_size)
+    if cursor:
+        query = query.start_after({"__name__": db.document(cursor)})
+    docs = list(query.stream())
+    record_reads(len(docs))
+    return docs
+
+
+def _is_user_subcollection_doc(doc) -> bool:
+    parent_doc = doc.reference.parent.parent
+    return parent_doc is not None and parent_doc.parent.id == COLLECTIONS["USERS"] and parent_doc.parent.parent is None
+
+
+def _to_records(docs: List[Any], target_key: str, target: Dict[str, Any]) -> List[Dict[str, Any]]:
+    id_field = _ID_FIELDS.get(target_key, "id")
+    records = []
+    for doc in docs:
+        if target["group"] and not _is_user_subcollection_doc(doc):
+            continue  # 같은 이름의 다른 경로 서브컬렉션 제외
+        data = doc.to_dict() or {}
+        data[id_field] = doc.id
+        if target["group"]:
+            data["uid"] = doc.reference.parent.parent.id
+        records.append(data)
+    return convert_firestore_data(records)
+
+
+class _NdjsonWriter:
+    """{이름}.ndjson에 이어 쓰기 (체크포인트 위치 이후 내용은 잘라냄)"""
+
+    def __init__(self, path: str, checkpoint: Optional[Dict[str, Any]]):
+        self.path = path
+        if checkpoint:
+            self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+            self._file.truncate(checkpoint.get("bytes", 0))
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, "wb")
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records
+        ).encode("utf-8")
+        self._file.write(payload)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"bytes": self._file.tell()}
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _column_type(values: List[Any]):
+    import pyarrow as pa
+
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            kinds.add("bool")
+        elif isinstance(value, int):
+            kinds.add("int" if _INT64_MIN <= value <= _INT64_MAX else "other")
+        elif isinstance(value, float):
+            kinds.add("float")
+        elif isinstance(value, str):
+            kinds.add("str")
+        else:
+            kinds.add("other")
+    if not kinds:
+        return pa.null()
+    if kinds == {"bool"}:
+        return pa.bool_()
+    if kinds == {"int"}:
+        return pa.int64()
+    if kinds <= {"int", "float"}:
+        return pa.float64()
+    return pa.string()
+
+
+def _to_arrow_table(records: List[Dict[str, Any]]):
+    """청크 → Arrow 테이블 (중첩 값·타입 혼합 열은 JSON 문자열)"""
+    import pyarrow as pa
+
+    names: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            names.setdefault(key, None)
+    arrays, fields = [], []
+    for name in names:
+        values = [record.get(name) for record in records]
+        col_type = _column_type(values)
+        if col_type == pa.string():
+            values = [
+                v if v is None or isinstance(v, str) else json.dumps(v, ensure_ascii=False, default=str)
+                for v in values
+            ]
+        elif col_type == pa.float64():
+            values = [None if v is None else float(v) for v in values]
+        arrays.append(pa.array(values, type=col_type))
+        fields.append(pa.field(name, col_type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+class _ParquetWriter:
+    """{이름}.parquet/ 아래 청크마다 part 파일 1개 (임시 파일 → 교체)"""
+
+    def __init__(self, path: str, checkpoint: Optional[Dict[str, Any]]):
+        import pyarrow.parquet  # noqa: F401 — 없으면 시작 전에 ImportError
+
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.parts = checkpoint.get("parts", 0) if checkpoint else 0
+        # 새로 시작하거나 체크포인트 이후에 쓰인 part는 삭제
+        for part in glob.glob(os.path.join(path, "part-*.parquet")):
+            index = int(re.sub(r"\D", "", os.path.basename(part)) or 0)
+            if index >= self.parts:
+                os.remove(part)
+
+    def write_chunk(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        import pyarrow.parquet as pq
+
+        part_path = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        tmp_path = f"{part_path}.tmp"
+        pq.write_table(_to_arrow_table(records), tmp_path, compression="zstd")
+        os.replace(tmp_path, part_path)
+        self.parts += 1
+        return {"parts": self.parts}
+
+    def close(self) -> None:
+        pass
+
+
+def export_collection(
+    target_key: str,
+    fmt: str = "ndjson",
+    output_dir: str = None,
+    chunk_size: int = None,
+    resume: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[bool, str]:
+    """
+    컬렉션 1개를 청크 단위로 파일에 내보냅니다.
+
+    Args:
+        target_key: get_export_targets()의 키 (예: "AI_TOOLS", "USERS/favorites")
+        fmt: "ndjson" 또는 "parquet"
+        output_dir: 저장 디렉터리 (기본: config.EXPORT_DIR)
+        chunk_size: 1회 조회 문서 수 (기본: config.EXPORT_CHUNK_SIZE)
+        resume: 완료되지 않은 체크포인트가 있으면 이어서 진행 (False면 처음부터)
+        progress: 청크마다 호출 (누적 문서 수, 누적 청크 수)
+
+    Returns:
+        (성공 여부, 메시지)
+    """
+    targets = get_export_targets()
+    if target_key not in targets:
+        return False, f"알 수 없는 내보내기 대상: {target_key}"
+    if fmt not in EXPORT_FORMATS:
+        return False, f"지원하지 않는 형식: {fmt} ({', '.join(EXPORT_FORMATS)})"
+    db = get_db()
+    if db is None:
+        return False, "Firebase에 연결되지 않았습니다."
+
+    target = targets[target_key]
+    target_dir = output_dir or EXPORT_DIR
+    chunk_size = max(1, int(chunk_size or EXPORT_CHUNK_SIZE))
+    data_path, checkpoint_path = _output_paths(target_key, fmt, target_dir)
+
+    checkpoint = _read_checkpoint(checkpoint_path) if resume else None
+    if checkpoint and checkpoint.get("completed"):
+        checkpoint = None
+    resumed = checkpoint is not None
+    now = datetime.now().isoformat()
+    state = checkpoint or {
+        "target": target_key,
+        "collection": target["label"],
+        "format": fmt,
+        "path": data_path,
+        "cursor": None,
+        "documents": 0,
+        "chunks": 0,
+        "startedAt": now,
+        "completed": False,
+    }
+    state["chunkSize"] = chunk_size
+
+    try:
+        os.makedirs(target_dir, exist_ok=True)
+        writer = _ParquetWriter(data_path, state if resumed else None) if fmt == "parquet" \
+            else _NdjsonWriter(data_path, state if resumed else None)
+    except ImportError:
+        return False, "Parquet 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)."
+    except OSError as e:
+        return False, f"내보내기 파일 준비 실패: {e}"
+
+    fetch = instrument(target["label"], kind="read", name="export.fetch_chunk")(_fetch_chunk)
+    try:
+        while True:
+            docs = fetch(db, target, state["cursor"], chunk_size)
+            if not docs:
+                break
+            records = _to_records(docs, target_key, target)
+            if records:
+                state.update(writer.write_chunk(records))
+            state["cursor"] = docs[-1].reference.path
+            state["documents"] += len(records)
+            state["chunks"] += 1
+            state["updatedAt"] = datetime.now().isoformat()
+            _write_checkpoint(checkpoint_path, state)
+            if progress:
+                progress(state["documents"], state["chunks"])
+            if len(docs) < chunk_size:
+                break
+        state["completed"] = True
+        state["completedAt"] = datetime.now().isoformat()
+        _write_checkpoint(checkpoint_path, state)
+    except Exception as e:
+        return False, (
+            f"{target['label']} 내보내기 실패 ({state['documents']:,}건까지 저장, "
+            f"다시 실행하면 이어서 진행): {e}"
+        )
+    finally:
+        writer.close()
+
+    prefix = "이어서 " if resumed else ""
+    return True, f"{target['label']} {prefix}내보내기 완료: {state['documents']:,}건 → {data_path}"
+
+
+def get_export_status(output_dir: str = None) -> List[Dict[str, Any]]:
+    """
+    저장 디렉터리의 내보내기 체크포인트 목록 (완료 여부·문서 수·경로)
+
+    Args:
+        output_dir: 저장 디렉터리 (기본: config.EXPORT_DIR)
+
+    Returns:
+        List[Dict]: 체크포인트 내용 (updatedAt 최신순)
+    """
+    target_dir = output_dir or EXPORT_DIR
+    rows = []
+    for path in glob.glob(os.path.join(target_dir, "*.checkpoint.json")):
+        data = _read_checkpoint(path)
+        if data:
+            rows.append(data)
+    rows.sort(key=lambda row: row.get("updatedAt") or row.get("startedAt") or "", reverse=True)
+    return rows
+
+
+def read_parquet_export(path: str):
+    """
+    Parquet 내보내기 디렉터리를 DataFrame으로 읽기 (파트별 열 구성·타입 차이를 맞춤)
+
+    같은 열의 타입이 파트마다 다르면 숫자끼리는 float64, 그 밖에는 문자열로 맞춥니다.
+
+    Args:
+        path: {이름}.parquet 디렉터리
+
+    Returns:
+        pandas.DataFrame
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parts = sorted(glob.glob(os.path.join(path, "part-*.parquet")))
+    if not parts:
+        return pa.table({}).to_pandas()
+    column_types: Dict[str, set] = {}
+    for part in parts:
+        for field in pq.read_schema(part):
+            column_types.setdefault(field.name, set()).add(field.type)
+
+    def _unify(types: set):
+        types = {t for t in types if t != pa.null()}
+        if not types:
+            return pa.null()
+        if len(types) == 1:
+            return types.pop()
+        if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+            return pa.float64()
+        return pa.string()
+
+    schema = pa.schema([(name, _unify(types)) for name, types in column_types.items()])
+    tables = []
+    for part in parts:
+        table = pq.read_table(part)
+        columns = [
+            table.column(field.name).cast(field.type) if field.name in table.column_names
+            else pa.nulls(table.num_rows, type=field.type)
+            for field in schema
+        ]
+        tables.append(pa.Table.from_arrays(columns, schema=schema))
+    return pa.concat_tables(tables).to_pandas()
@@ -6,7 +6,16 @@ import firebase_admin
 from firebase_admin import credentials, firestore
 import json
 import os
-from .config import FIREBASE_SERVICE_ACCOUNT_KEY_PATH, FIREBASE_SERVICE_ACCOUNT_KEY_JSON
+from typing import Any, Dict, Iterable, Optional
+from .config import (
+    FIREBASE_SERVICE_ACCOUNT_KEY_PATH, FIREBASE_SERVICE_ACCOUNT_KEY_JSON,
+    FIRESTORE_EMULATOR_HOST, FIREBASE_PROJECT_ID,
+)
+from .utils import convert_firestore_data
+from .metrics import instrument, note_db_access
+
+# get_all 1회 요청당 문서 수 (요청 크기 제한 여유)
+GET_ALL_CHUNK_SIZE = 300
 
 
 @st.cache_resource
@@ -18,6 +27,12 @@ def init_firebase():
         firestore.Client: Firestore 클라이언트 또는 None
     """
     try:
+        # 에뮬레이터: 익명 자격 증명으로 연결 (프로덕션 키를 읽지 않음)
+        if FIRESTORE_EMULATOR_HOST:
+            from google.auth.credentials import AnonymousCredentials
+            from google.cloud import firestore as gcloud_firestore
+            return gcloud_firestore.Client(project=FIREBASE_PROJECT_ID, credentials=AnonymousCredentials())
+
         if not firebase_admin._apps:
             # Streamlit Cloud Secrets에서 우선 읽기 (st.secrets)
             # 그 다음 환경 변수 (os.getenv), 마지막으로 파일 경로
@@ -76,4 +91,38 @@ def get_db():
     Returns:
         firestore.Client: Firestore 클라이언트 또는 None
     """
+    note_db_access()
     return init_firebase()
+
+
+@instrument()
+def get_documents_by_ids(collection: str, doc_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    여러 문서를 get_all로 한 번에 조회 (ID별 개별 get 대신 사용)
+
+    Args:
+        collection: 컬렉션 경로
+        doc_ids: 문서 ID 목록 (빈 값·중복 제외)
+
+    Returns:
+        Dict[str, Optional[Dict]]: {문서 ID: 데이터(id 포함) 또는 None(없음)}, 요청 순서 유지
+    """
+    ids = list(dict.fromkeys(str(doc_id) for doc_id in doc_ids if doc_id))
+    results: Dict[str, Optional[Dict[str, Any]]] = {doc_id: None for doc_id in ids}
+    db = get_db()
+    if db is None or not ids:
+        return results
+
+    try:
+        collection_ref = db.collection(collection)
+        for start in range(0, len(ids), GET_ALL_CHUNK_SIZE):
+            refs = [collection_ref.document(doc_id) for doc_id in ids[start:start + GET_ALL_CHUNK_SIZE]]
+            for snap in db.get_all(refs):
+                if snap.exists:
+                    data = snap.to_dict() or {}
+                    data["id"] = snap.id
+                    results[snap.id] = convert_firestore_data(data)
+        return results
+    except Exception as e:
+        st.error(f"문서 일괄 조회 실패: {e}")
+        return results
@@ -0,0 +1,85 @@
+"""
+불변(읽기 전용) 레코드
+
+캐시된 컬렉션을 호출마다 복사하지 않고 같은 객체로 넘겨주기 위한 dict/list 하위 클래스입니다.
+isinstance(x, dict/list), json.dumps, pandas, dict(record) 등은 그대로 동작하고
+수정 메서드만 TypeError를 냅니다. 수정이 필요하면 dict(record) 또는 copy.deepcopy(record)로
+일반 dict를 만들어 사용합니다 (deepcopy는 중첩 값까지 일반 dict/list로 되돌림).
+"""
+from collections.abc import Mapping
+from typing import Any
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__}는 캐시 공유 객체라 수정할 수 없습니다. "
+        f"dict(...)/list(...) 또는 copy.deepcopy(...)로 복사 후 수정하세요."
+    )
+
+
+class FrozenRecord(dict):
+    """읽기 전용 dict (캐시된 문서 1건)"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self):
+        # pickle(st.cache_data 등) 시 __setitem__을 거치지 않고 복원
+        return (FrozenRecord, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """읽기 전용 list (캐시된 문서 목록·배열 필드)"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = clear = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """
+    dict/list를 중첩까지 읽기 전용으로 변환 (이미 읽기 전용이면 그대로 반환)
+
+    Args:
+        value: 변환할 값
+
+    Returns:
+        FrozenRecord / FrozenList / 원래 값 (문자열·숫자·datetime 등)
+    """
+    if isinstance(value, (FrozenRecord, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenRecord({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if type(value) is tuple:
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """읽기 전용 값(admin.records 레코드 포함)을 중첩까지 일반 dict/list로 복사"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
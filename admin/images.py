@@ -0,0 +1,227 @@
+"""
+이미지 미리보기 파이프라인 (배너·도구 로고)
+
+- 원격 이미지를 스레드 풀로 동시에 가져오고, 축소 썸네일을 로컬 디스크에 캐시합니다.
+- 캐시 키: sha1(URL) + ETag — 재요청 시 If-None-Match로 본문 재전송 없이 확인
+- 메타데이터(가로/세로, 바이트 수, 포맷)를 함께 기록해 배너 규격 검증에 사용
+- http://localhost 정적 서버(python -m http.server)로도 동작 확인 가능
+"""
+import os
+import io
+import json
+import hashlib
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import streamlit as st
+from PIL import Image
+
+from .config import IMAGE_CACHE_DIR, BANNER_DISPLAY_LAYOUTS, BANNER_IMAGE_MAX_BYTES
+
+THUMBNAIL_MAX_SIZE = (480, 480)
+FETCH_TIMEOUT_SECONDS = 10
+FETCH_MAX_BYTES = 20 * 1024 * 1024
+FETCH_MAX_WORKERS = 8
+# 권장 크기 대비 비율 허용 오차 (2%)
+ASPECT_RATIO_TOLERANCE = 0.02
+
+_USER_AGENT = "aicuratorhub-admin/1.0 (image preview)"
+
+
+def _cache_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _meta_path(url: str) -> str:
+    return os.path.join(IMAGE_CACHE_DIR, f"{_cache_key(url)}.json")
+
+
+def _thumb_path(url: str, etag: Optional[str]) -> str:
+    etag_key = hashlib.sha1((etag or "").encode("utf-8")).hexdigest()[:10]
+    return os.path.join(IMAGE_CACHE_DIR, f"{_cache_key(url)}_{etag_key}.png")
+
+
+def _read_meta(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_meta_path(url), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta if isinstance(meta, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(url: str, meta: Dict[str, Any]) -> None:
+    path = _meta_path(url)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def fetch_image(url: str, timeout: int = FETCH_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """
+    이미지 1건 조회 + 썸네일 캐시 (Streamlit 캐시 없음, 스레드에서 호출 가능)
+
+    Args:
+        url: 이미지 URL (http/https)
+        timeout: 요청 타임아웃(초)
+
+    Returns:
+        Dict: {url, ok, width, height, bytes, format, etag, thumbPath, error}
+    """
+    url = (url or "").strip()
+    result: Dict[str, Any] = {"url": url, "ok": False}
+    if not url.startswith(("http://", "https://")):
+        result["error"] = "URL은 http:// 또는 https:// 로 시작해야 합니다."
+        return result
+
+    os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+    cached = _read_meta(url)
+    request = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+    if cached and cached.get("etag") and os.path.isfile(cached.get("thumbPath", "")):
+        request.add_header("If-None-Match", cached["etag"])
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            body = resp.read(FETCH_MAX_BYTES + 1)
+            etag = resp.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return cached
+        result["error"] = f"HTTP {e.code}"
+        return result
+    except Exception as e:
+        # 네트워크 오류 시 이전 캐시가 있으면 그대로 사용
+        if cached and os.path.isfile(cached.get("thumbPath", "")):
+            return cached
+        result["error"] = str(e)
+        return result
+
+    if len(body) > FETCH_MAX_BYTES:
+        result["error"] = f"이미지가 너무 큽니다 (>{FETCH_MAX_BYTES // (1024 * 1024)}MB)"
+        return result
+
+    try:
+        with Image.open(io.BytesIO(body)) as img:
+            width, height = img.size
+            image_format = img.format
+            thumb = img.copy()
+        thumb.thumbnail(THUMBNAIL_MAX_SIZE)
+        if thumb.mode not in ("RGB", "RGBA"):
+            thumb = thumb.convert("RGBA")
+        thumb_path = _thumb_path(url, etag)
+        thumb.save(thumb_path, format="PNG")
+    except Exception as e:
+        result["error"] = f"이미지 형식을 읽을 수 없습니다: {e}"
+        return result
+
+    # 이전 ETag의 썸네일 정리
+    if cached and cached.get("thumbPath") and cached["thumbPath"] != thumb_path:
+        try:
+            os.remove(cached["thumbPath"])
+        except OSError:
+            pass
+
+    result.update({
+        "ok": True,
+        "width": width,
+        "height": height,
+        "bytes": len(body),
+        "format": image_format,
+        "etag": etag,
+        "thumbPath": thumb_path,
+    })
+    _write_meta(url, result)
+    return result
+
+
+def fetch_images(urls: Iterable[str], max_workers: int = FETCH_MAX_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 이미지를 스레드 풀로 동시에 조회
+
+    Args:
+        urls: 이미지 URL 목록 (빈 값·중복 제외)
+        max_workers: 동시 요청 수
+
+    Returns:
+        Dict[str, Dict]: {url: fetch_image 결과}
+    """
+    targets = list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as pool:
+        return dict(zip(targets, pool.map(fetch_image, targets)))
+
+
+@st.cache_data(ttl=600, show_spinner=False)  # 10분 캐시 (rerun마다 재요청 방지)
+def get_image_meta(url: str) -> Dict[str, Any]:
+    """
+    이미지 메타데이터 + 썸네일 경로 조회 (캐시됨)
+
+    Args:
+        url: 이미지 URL
+
+    Returns:
+        Dict: fetch_image 결과
+    """
+    return fetch_image(url)
+
+
+def summarize_image_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Firestore 저장용 메타 요약 (로컬 경로·ETag 제외)"""
+    if not meta or not meta.get("ok"):
+        return {}
+    return {
+        "width": meta.get("width"),
+        "height": meta.get("height"),
+        "bytes": meta.get("bytes"),
+        "format": meta.get("format"),
+    }
+
+
+def format_image_meta(meta: Dict[str, Any]) -> str:
+    """미리보기 캡션용 문자열 (예: 1400×200 · PNG · 182KB)"""
+    if not meta or not meta.get("ok"):
+        return ""
+    size_kb = (meta.get("bytes") or 0) / 1024
+    return f"{meta.get('width')}×{meta.get('height')} · {meta.get('format') or '?'} · {size_kb:,.0f}KB"
+
+
+def validate_banner_image(meta: Dict[str, Any], layout_id: str, device: str = "web") -> List[str]:
+    """
+    배너 이미지 규격 검증
+
+    Args:
+        meta: fetch_image 결과
+        layout_id: BANNER_DISPLAY_LAYOUTS 키
+        device: "web" 또는 "mobile"
+
+    Returns:
+        List[str]: 경고 메시지 (문제 없으면 빈 리스트)
+    """
+    if not meta:
+        return []
+    if not meta.get("ok"):
+        return [f"이미지를 불러올 수 없습니다: {meta.get('error', '알 수 없는 오류')}"]
+
+    warnings = []
+    layout = BANNER_DISPLAY_LAYOUTS.get(layout_id, BANNER_DISPLAY_LAYOUTS["single"])
+    expected = layout.get("mobilePx" if device == "mobile" else "webPx")
+    width, height = meta.get("width") or 0, meta.get("height") or 0
+    if expected and width and height:
+        exp_w, exp_h = expected
+        ratio, exp_ratio = width / height, exp_w / exp_h
+        if abs(ratio - exp_ratio) / exp_ratio > ASPECT_RATIO_TOLERANCE:
+            warnings.append(
+                f"비율 불일치: {width}×{height} (권장 {exp_w}×{exp_h}, {layout['name']})"
+            )
+        elif width < exp_w or height < exp_h:
+            warnings.append(f"해상도 부족: {width}×{height} (권장 {exp_w}×{exp_h} 이상)")
+
+    if (meta.get("bytes") or 0) > BANNER_IMAGE_MAX_BYTES:
+        warnings.append(
+            f"용량 초과: {meta['bytes'] / 1024:,.0f}KB (권장 {BANNER_IMAGE_MAX_BYTES / 1024:,.0f}KB 이하)"
+        )
+    return warnings
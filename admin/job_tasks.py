@@ -0,0 +1,112 @@
+"""
+기본 백그라운드 작업 (admin.jobs가 처음 사용될 때 등록)
+
+params는 JSON으로 저장되므로 파일은 save_job_file() 경로로, 객체는 이름(번역 공급자 등)으로 전달합니다.
+"""
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from .jobs import JobCancelled, JobContext, register_job
+
+
+@register_job("tool_import", "AI 도구 일괄 등록")
+def run_tool_import(
+    ctx: JobContext, path: str, fmt: str, dry_run: bool = False, on_existing: str = "update",
+) -> Tuple[bool, Dict[str, Any]]:
+    """CSV / Parquet 도구 일괄 등록 (성공하면 입력 파일 삭제)"""
+    from .tool_import import import_tools
+
+    if not os.path.isfile(path):
+        return False, {"message": f"입력 파일이 없습니다: {os.path.basename(path)}"}
+
+    def _progress(done: int) -> None:
+        ctx.progress(done, message=f"{done:,}행 처리")
+        ctx.check_cancelled()
+
+    ok, report = import_tools(path, fmt, dry_run=dry_run, on_existing=on_existing, progress=_progress)
+    ctx.progress(report["total"], report["total"], force=True)
+    if ok and not dry_run:
+        os.remove(path)
+    return ok, report
+
+
+@register_job("tool_translation_batch", "AI 도구 일괄 번역")
+def run_translation_batch(
+    ctx: JobContext, langs: List[str], provider: str, tool_ids: Optional[List[str]] = None, include_stale: bool = True,
+) -> Tuple[bool, Dict[str, Any]]:
+    """누락/stale 필드 일괄 번역 (취소하면 완료된 번역까지 저장)"""
+    from .tool_translation_batch import get_translation_provider, run_tool_translation_batch
+
+    ok, stats = run_tool_translation_batch(
+        tool_ids or None,
+        langs,
+        get_translation_provider(provider),
+        include_stale=include_stale,
+        progress_callback=lambda done, total: ctx.progress(done, total, f"번역 요청 {done:,}/{total:,}"),
+        should_cancel=ctx.is_cancelled,
+    )
+    if stats["cancelled"]:
+        raise JobCancelled(f"취소됨 — 완료된 번역 {stats['written']:,}건 저장 (다시 실행하면 남은 필드만 처리)")
+    ctx.progress(stats["requests"], stats["requests"], force=True)
+    stats["message"] = (
+        f"문서 {stats['docs']:,}건 · 요청 {stats['requests']:,}회 · 저장 {stats['written']:,}건"
+        + (f" · 실패 요청 {stats['failedRequests']:,}회" if stats["failedRequests"] else "")
+    )
+    return ok, stats
+
+
+@register_job("export_collections", "컬렉션 내보내기")
+def run_export(
+    ctx: JobContext, targets: List[str], fmt: str = "ndjson", chunk_size: Optional[int] = None, resume: bool = True,
+) -> Tuple[bool, Dict[str, Any]]:
+    """컬렉션 NDJSON / Parquet 내보내기 (취소 후 다시 실행하면 체크포인트부터)"""
+    from .export import export_collection
+
+    results = []
+    for index, key in enumerate(targets):
+        def _progress(documents: int, chunks: int, key: str = key, index: int = index) -> None:
+            ctx.progress(index, len(targets), f"{key}: {documents:,}건")
+            ctx.check_cancelled()
+
+        ctx.progress(index, len(targets), f"{key} 시작", force=True)
+        ok, msg = export_collection(key, fmt, chunk_size=chunk_size, resume=resume, progress=_progress)
+        results.append({"target": key, "ok": ok, "message": msg})
+    ctx.progress(len(targets), len(targets), force=True)
+    failed = sum(1 for r in results if not r["ok"])
+    return failed == 0, {
+        "message": f"{len(targets)}개 중 {len(targets) - failed}개 완료" + (f", {failed}개 실패" if failed else ""),
+        "results": results,
+    }
+
+
+@register_job("delete_user", "사용자 삭제 (서브컬렉션 포함)")
+def run_delete_user(ctx: JobContext, uid: str) -> Tuple[bool, str]:
+    """사용자와 favorites / reviews / my-ai-sets 서브컬렉션 삭제"""
+    from .users import delete_user
+
+    # 실패 시 예외가 그대로 올라가 작업 기록 error에 저장됨
+    if delete_user(uid, raise_errors=True):
+        return True, f"사용자 삭제 완료: {uid}"
+    return False, f"사용자 삭제 실패: {uid} (Firestore 연결 없음)"
+
+
+@register_job("sweep_stale_translations", "번역 stale 전체 검사")
+def run_stale_sweep(ctx: JobContext) -> Tuple[bool, Dict[str, Any]]:
+    """전체 카탈로그 원문 변경 검사"""
+    from .translation_freshness import sweep_stale_translations
+
+    ok, stats = sweep_stale_translations()
+    stats = dict(stats)
+    stats["message"] = (
+        f"검사 {stats['checked']:,}건 · stale 문서 {stats['staleDocs']:,}건 "
+        f"(필드 {stats['staleFields']:,}개) · 기준선 기록 {stats['baselined']:,}건"
+    )
+    return ok, stats
+
+
+@register_job("import_ui_translations", "UI 텍스트 가져오기 (JSON → translations)")
+def run_ui_translation_import(ctx: JobContext) -> Tuple[bool, str]:
+    """프론트 public/lang/*.json → translations 컬렉션"""
+    from .ui_translation_sync import import_ui_translations_from_json
+
+    return import_ui_translations_from_json()
@@ -0,0 +1,503 @@
+"""
+백그라운드 작업 (SQLite 대기열 + 워커 스레드)
+
+일괄 번역·가져오기·내보내기·연쇄 삭제처럼 오래 걸리는 작업을 클릭 핸들러 안에서 실행하면
+세션이 멈추고, 탭을 닫거나 다시 실행(rerun)되면 중단·중복 실행됩니다.
+submit_job()은 작업을 JOBS_DB_PATH의 jobs 테이블에 넣고 바로 반환하며,
+Streamlit 실행과 무관한 워커 스레드(프로세스당 JOBS_WORKERS개)가 순서대로 꺼내 실행합니다.
+
+- 작업 종류는 @register_job(kind, label)으로 등록 (기본 작업: admin.job_tasks)
+- 핸들러는 (JobContext, **params) → (성공 여부, 결과 메시지 또는 dict)
+- JobContext.progress()로 진행 상황을 기록하고, check_cancelled()는 취소 요청 시 JobCancelled 발생
+- 진행 기록(heartbeat)이 JOBS_STALE_SECONDS 동안 없는 running 작업은 다시 대기열로 (프로세스 재시작 등)
+- ADMIN_JOBS_WORKERS=0이면 Streamlit 프로세스는 대기열만 쓰고, scripts/run_jobs.py 프로세스가 실행
+
+상태: queued → running → succeeded / failed / cancelled
+작업 페이지(pages/11)에서 목록·진행률·결과 조회와 취소를 합니다.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import JOBS_DB_PATH, JOBS_FILES_DIR, JOBS_RETENTION_DAYS, JOBS_STALE_SECONDS, JOBS_WORKERS
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+# 중단 후 다시 대기열에 넣는 최대 횟수 (넘으면 failed)
+MAX_ATTEMPTS = 3
+# 진행률·취소 여부를 DB에 쓰고 읽는 최소 간격(초)
+_PROGRESS_INTERVAL = 0.5
+_CANCEL_CHECK_INTERVAL = 1.0
+# 대기열 확인·heartbeat 간격(초)
+_POLL_INTERVAL = 2.0
+_HEARTBEAT_INTERVAL = 15.0
+
+_handlers: Dict[str, Dict[str, Any]] = {}
+_handlers_loaded = False
+_start_lock = threading.Lock()
+_workers: List[threading.Thread] = []
+_wake = threading.Event()
+_running_lock = threading.Lock()
+# 이 프로세스에서 실행 중인 작업 ID (heartbeat 대상)
+_running: set = set()
+_worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class JobCancelled(BaseException):
+    """
+    취소 요청된 작업 중단 (JobContext.check_cancelled()에서 발생)
+
+    작업 함수 안의 `except Exception` 오류 처리에 잡히지 않도록 BaseException을 상속합니다.
+    """
+
+
+def register_job(kind: str, label: str) -> Callable[[Callable], Callable]:
+    """
+    작업 종류 등록 데코레이터
+
+    Args:
+        kind: 작업 종류 키 (submit_job에 전달)
+        label: 작업 페이지에 표시할 이름
+
+    Returns:
+        데코레이터 (함수는 그대로 반환)
+    """
+    def decorator(func: Callable) -> Callable:
+        _handlers[kind] = {"label": label, "func": func}
+        return func
+
+    return decorator
+
+
+def _load_handlers() -> None:
+    global _handlers_loaded
+    if not _handlers_loaded:
+        _handlers_loaded = True
+        from . import job_tasks  # noqa: F401 — 기본 작업 등록
+
+
+def get_job_kinds() -> Dict[str, str]:
+    """등록된 작업 종류 {kind: label}"""
+    _load_handlers()
+    return {kind: handler["label"] for kind, handler in _handlers.items()}
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(JOBS_DB_PATH) or ".", exist_ok=True)
+    conn = sqlite3.connect(JOBS_DB_PATH, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        "id TEXT PRIMARY KEY, kind TEXT NOT NULL, label TEXT, params TEXT, status TEXT NOT NULL, "
+        "progress_done INTEGER DEFAULT 0, progress_total INTEGER, message TEXT, result TEXT, error TEXT, "
+        "cancel_requested INTEGER DEFAULT 0, attempts INTEGER DEFAULT 0, worker TEXT, "
+        "created_by TEXT, created_at REAL, started_at REAL, finished_at REAL, heartbeat_at REAL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+    return conn
+
+
+def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    for key in ("params", "result"):
+        job[key] = json.loads(job[key]) if job[key] else None
+    job["cancelRequested"] = bool(job.pop("cancel_requested"))
+    total = job.get("progress_total")
+    job["percent"] = round(job["progress_done"] / total * 100, 1) if total else None
+    return job
+
+
+def submit_job(kind: str, params: Optional[Dict[str, Any]] = None, label: str = None, created_by: str = None) -> str:
+    """
+    작업을 대기열에 넣고 바로 반환
+
+    Args:
+        kind: 작업 종류 (register_job으로 등록된 키)
+        params: 핸들러 키워드 인자 (JSON 직렬화 가능해야 함)
+        label: 목록에 표시할 설명 (기본: 작업 종류 이름)
+        created_by: 요청자 표시 (선택)
+
+    Returns:
+        str: 작업 ID
+
+    Raises:
+        ValueError: 등록되지 않은 작업 종류
+    """
+    kinds = get_job_kinds()
+    if kind not in kinds:
+        raise ValueError(f"알 수 없는 작업 종류: {kind}")
+    job_id = uuid.uuid4().hex
+    conn = _connect()
+    try:
+        conn.execute(
+            "INSERT INTO jobs (id, kind, label, params, status, created_by, created_at) VALUES (?, ?, ?, ?, 'queued', ?, ?)",
+            (job_id, kind, label or kinds[kind], json.dumps(params or {}, ensure_ascii=False), created_by, time.time()),
+        )
+    finally:
+        conn.close()
+    start_job_workers()
+    _wake.set()
+    return job_id
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    작업 1건 조회
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        Dict: 작업 정보 또는 None
+    """
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+    finally:
+        conn.close()
+
+
+def list_jobs(statuses: Optional[List[str]] = None, limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    작업 목록 (최근 생성 순)
+
+    Args:
+        statuses: 상태 필터 (None이면 전체)
+        limit: 최대 개수
+
+    Returns:
+        List[Dict]: 작업 리스트
+    """
+    conn = _connect()
+    try:
+        if statuses:
+            marks = ",".join("?" for _ in statuses)
+            rows = conn.execute(
+                f"SELECT * FROM jobs WHERE status IN ({marks}) ORDER BY created_at DESC LIMIT ?",
+                (*statuses, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [_row_to_job(row) for row in rows]
+    finally:
+        conn.close()
+
+
+def get_job_counts() -> Dict[str, int]:
+    """상태별 작업 수"""
+    conn = _connect()
+    try:
+        counts = {status: 0 for status in JOB_STATUSES}
+        for status, count in conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = count
+        return counts
+    finally:
+        conn.close()
+
+
+def cancel_job(job_id: str) -> bool:
+    """
+    작업 취소 (대기 중이면 바로 취소, 실행 중이면 다음 진행 확인 때 중단)
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        bool: 취소 요청 여부 (이미 끝난 작업이면 False)
+    """
+    conn = _connect()
+    try:
+        now = time.time()
+        cur = conn.execute(
+            "UPDATE jobs SET status = 'cancelled', finished_at = ?, message = '실행 전 취소됨' "
+            "WHERE id = ? AND status = 'queued'",
+            (now, job_id),
+        )
+        if cur.rowcount:
+            return True
+        cur = conn.execute(
+            "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,)
+        )
+        return bool(cur.rowcount)
+    finally:
+        conn.close()
+
+
+def retry_job(job_id: str) -> Optional[str]:
+    """
+    끝난 작업을 같은 인자로 다시 대기열에 넣음
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        str: 새 작업 ID 또는 None (없거나 아직 끝나지 않은 작업)
+    """
+    job = get_job(job_id)
+    if not job or job["status"] not in FINISHED_STATUSES:
+        return None
+    return submit_job(job["kind"], job["params"], label=job["label"], created_by=job.get("created_by"))
+
+
+def purge_finished_jobs(older_than_days: int = None) -> int:
+    """
+    오래된 끝난 작업 기록 삭제
+
+    Args:
+        older_than_days: 이 기간 이전에 끝난 작업 삭제 (기본: JOBS_RETENTION_DAYS, 0이면 전부)
+
+    Returns:
+        int: 삭제한 작업 수
+    """
+    days = JOBS_RETENTION_DAYS if older_than_days is None else older_than_days
+    cutoff = time.time() - days * 86400
+    marks = ",".join("?" for _ in FINISHED_STATUSES)
+    conn = _connect()
+    try:
+        cur = conn.execute(
+            f"DELETE FROM jobs WHERE status IN ({marks}) AND finished_at <= ?", (*FINISHED_STATUSES, cutoff)
+        )
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def save_job_file(filename: str, data: bytes) -> str:
+    """
+    작업 입력 파일 저장 (업로드 파일은 세션이 끝나면 사라지므로 경로를 params로 전달)
+
+    Args:
+        filename: 원래 파일 이름 (확장자 유지)
+        data: 파일 내용
+
+    Returns:
+        str: 저장 경로
+    """
+    os.makedirs(JOBS_FILES_DIR, exist_ok=True)
+    path = os.path.join(JOBS_FILES_DIR, f"{uuid.uuid4().hex}_{os.path.basename(filename)}")
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+class JobContext:
+    """실행 중인 작업에 전달되는 진행 기록·취소 확인 객체"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self._last_progress = 0.0
+        self._last_cancel_check = 0.0
+        self._cancelled = False
+
+    def progress(self, done: int, total: Optional[int] = None, message: str = None, force: bool = False) -> None:
+        """
+        진행 상황 기록 (_PROGRESS_INTERVAL보다 자주 호출되면 건너뜀)
+
+        Args:
+            done: 처리한 수
+            total: 전체 수 (모르면 None)
+            message: 표시할 메시지
+            force: 간격과 무관하게 기록
+        """
+        now = time.time()
+        if force or now - self._last_progress >= _PROGRESS_INTERVAL:
+            self._last_progress = now
+            conn = _connect()
+            try:
+                conn.execute(
+                    "UPDATE jobs SET progress_done = ?, progress_total = COALESCE(?, progress_total), "
+                    "message = COALESCE(?, message), heartbeat_at = ? WHERE id = ?",
+                    (int(done), total, message, now, self.job_id),
+                )
+            finally:
+                conn.close()
+
+    def is_cancelled(self) -> bool:
+        """취소 요청 여부 (_CANCEL_CHECK_INTERVAL마다 DB 확인)"""
+        now = time.time()
+        if not self._cancelled and now - self._last_cancel_check >= _CANCEL_CHECK_INTERVAL:
+            self._last_cancel_check = now
+            conn = _connect()
+            try:
+                row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (self.job_id,)).fetchone()
+                self._cancelled = bool(row and row[0])
+            finally:
+                conn.close()
+        return self._cancelled
+
+    def check_cancelled(self) -> None:
+        """취소 요청이 있으면 JobCancelled 발생"""
+        if self.is_cancelled():
+            raise JobCancelled()
+
+
+def _claim_next_job() -> Optional[sqlite3.Row]:
+    """대기 중인 작업 1건을 running으로 바꾸고 반환 (다른 워커와 겹치지 않도록 IMMEDIATE 트랜잭션)"""
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        now = time.time()
+        conn.execute(
+            "UPDATE jobs SET status = 'running', worker = ?, started_at = ?, heartbeat_at = ?, "
+            "attempts = attempts + 1 WHERE id = ?",
+            (_worker_id, now, now, row["id"]),
+        )
+        conn.execute("COMMIT")
+        return row
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        return None
+    finally:
+        conn.close()
+
+
+def _finish_job(job_id: str, status: str, message: str = None, result: Any = None, error: str = None) -> None:
+    conn = _connect()
+    try:
+        conn.execute(
+            "UPDATE jobs SET status = ?, message = COALESCE(?, message), result = ?, error = ?, finished_at = ?, "
+            "progress_done = CASE WHEN ? AND progress_total IS NOT NULL THEN progress_total ELSE progress_done END "
+            "WHERE id = ?",
+            (
+                status, message,
+                json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                error, time.time(), status == "succeeded", job_id,
+            ),
+        )
+    finally:
+        conn.close()
+
+
+def _run_job(row: sqlite3.Row) -> None:
+    job_id = row["id"]
+    handler = _handlers.get(row["kind"])
+    if handler is None:
+        _finish_job(job_id, "failed", error=f"알 수 없는 작업 종류: {row['kind']}")
+        return
+    params = json.loads(row["params"] or "{}")
+    ctx = JobContext(job_id)
+    with _running_lock:
+        _running.add(job_id)
+    try:
+        ctx.check_cancelled()
+        ok, result = handler["func"](ctx, **params)
+        message = result if isinstance(result, str) else (result or {}).get("message")
+        # 결과 dict의 "error"(헬퍼가 st.error 대신 남긴 오류 내용)는 작업 기록 error로 저장
+        _finish_job(
+            job_id, "succeeded" if ok else "failed", message=message,
+            result=None if isinstance(result, str) else result,
+            error=None if isinstance(result, str) else (result or {}).get("error"),
+        )
+    except JobCancelled as e:
+        _finish_job(job_id, "cancelled", message=str(e) or "사용자 요청으로 취소됨")
+    except Exception as e:
+        _finish_job(job_id, "failed", message=f"작업 실패: {e}", error=traceback.format_exc())
+    finally:
+        with _running_lock:
+            _running.discard(job_id)
+
+
+def _worker_loop() -> None:
+    _load_handlers()
+    while True:
+        row = _claim_next_job()
+        if row is None:
+            _wake.wait(_POLL_INTERVAL)
+            _wake.clear()
+            continue
+        _run_job(row)
+
+
+def _recover_stale_jobs(conn: sqlite3.Connection) -> None:
+    """heartbeat가 끊긴 running 작업 → 대기열 (시도 횟수를 넘으면 failed)"""
+    cutoff = time.time() - JOBS_STALE_SECONDS
+    conn.execute(
+        "UPDATE jobs SET status = 'failed', finished_at = ?, message = '작업이 반복해서 중단되었습니다' "
+        "WHERE status = 'running' AND heartbeat_at < ? AND attempts >= ?",
+        (time.time(), cutoff, MAX_ATTEMPTS),
+    )
+    cur = conn.execute(
+        "UPDATE jobs SET status = CASE WHEN cancel_requested THEN 'cancelled' ELSE 'queued' END, "
+        "worker = NULL, message = '중단된 작업 다시 대기' WHERE status = 'running' AND heartbeat_at < ?",
+        (cutoff,),
+    )
+    if cur.rowcount:
+        _wake.set()
+
+
+def _supervisor_loop() -> None:
+    """실행 중인 작업 heartbeat 기록, 중단된 작업 복구, 오래된 기록 정리"""
+    last_purge = 0.0
+    while True:
+        try:
+            conn = _connect()
+            try:
+                with _running_lock:
+                    running = list(_running)
+                if running:
+                    marks = ",".join("?" for _ in running)
+                    conn.execute(f"UPDATE jobs SET heartbeat_at = ? WHERE id IN ({marks})", (time.time(), *running))
+                _recover_stale_jobs(conn)
+            finally:
+                conn.close()
+            if time.time() - last_purge >= 3600:
+                last_purge = time.time()
+                purge_finished_jobs()
+        except sqlite3.Error:
+            pass
+        time.sleep(_HEARTBEAT_INTERVAL)
+
+
+def start_job_workers(workers: int = None) -> int:
+    """
+    워커 스레드 시작 (프로세스당 1회, 이미 시작했으면 아무것도 하지 않음)
+
+    Args:
+        workers: 워커 수 (기본: JOBS_WORKERS, 0이면 시작하지 않음 — 별도 프로세스에서 실행)
+
+    Returns:
+        int: 이 프로세스의 워커 수
+    """
+    count = JOBS_WORKERS if workers is None else workers
+    with _start_lock:
+        if _workers or count <= 0:
+            return max(0, len(_workers) - 1)
+        supervisor = threading.Thread(target=_supervisor_loop, name="admin-jobs-supervisor", daemon=True)
+        supervisor.start()
+        _workers.append(supervisor)
+        for index in range(count):
+            thread = threading.Thread(target=_worker_loop, name=f"admin-jobs-worker-{index}", daemon=True)
+            thread.start()
+            _workers.append(thread)
+        return count
+
+
+def format_job_time(timestamp: Optional[float]) -> str:
+    """작업 시각(epoch 초) 표시용 문자열"""
+    if not timestamp:
+        return ""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def format_job_duration(job: Dict[str, Any]) -> str:
+    """실행 시간 표시 (실행 중이면 현재까지)"""
+    if not job.get("started_at"):
+        return ""
+    end = job.get("finished_at") or time.time()
+    return str(timedelta(seconds=int(end - job["started_at"])))
@@ -1,9 +1,13 @@
 """
 메뉴 시스템 관리
 """
-from typing import List, Dict, Optional
-from .config import COLLECTIONS
-from .translations import get_translation_by_id, get_translation_text
+import streamlit as st
+from typing import List, Dict, Optional, Tuple
+from google.cloud.firestore_v1 import FieldPath
+from .config import COLLECTIONS, SUPPORTED_LANGUAGES
+from .firebase import get_db
+from .translations import get_translation_text
+from .metrics import instrument
 
 
 def get_menu_items() -> List[Dict[str, str]]:
@@ -76,13 +80,65 @@ def get_menu_items() -> List[Dict[str, str]]:
             "label_en": "Settings",
             "page": "settings",
             "path": "pages/9_⚙️_설정.py"
+        },
+        {
+            "icon": "⏳",
+            "label": "작업 관리",
+            "label_en": "Background Jobs",
+            "page": "jobs",
+            "path": "pages/11_⏳_작업_관리.py"
         }
     ]
 
 
+# menu.* 문서 ID 범위 조회 상한 (접두어 뒤 모든 문자열 포함)
+_MENU_ID_PREFIX = "menu."
+_MENU_ID_PREFIX_END = "menu.\uf8ff"
+
+
+@instrument(COLLECTIONS["TRANSLATIONS"])
+@st.cache_data(ttl=3600)  # 번역 저장 시 무효화되므로 길게 유지
+def get_menu_catalog() -> Dict[Tuple[str, str], str]:
+    """
+    메뉴 라벨 카탈로그 (page, lang) → label (캐시됨)
+    
+    menu.* 번역 문서를 문서 ID 접두어 범위 조회 1회로 읽고,
+    get_menu_items 기본 라벨(ko/label, en/label_en)과 합칩니다.
+    
+    Returns:
+        Dict[Tuple[str, str], str]: {(page, lang): label}
+    """
+    catalog: Dict[Tuple[str, str], str] = {}
+    for item in get_menu_items():
+        catalog[(item["page"], "ko")] = item["label"]
+        catalog[(item["page"], "en")] = item.get("label_en", item["label"])
+
+    db = get_db()
+    if db is None:
+        return catalog
+    try:
+        translations_ref = db.collection(COLLECTIONS["TRANSLATIONS"])
+        # 문서 ID 범위 필터는 문서 참조로 비교
+        query = (
+            translations_ref
+            .where(FieldPath.document_id(), ">=", translations_ref.document(_MENU_ID_PREFIX))
+            .where(FieldPath.document_id(), "<=", translations_ref.document(_MENU_ID_PREFIX_END))
+        )
+        for doc in query.stream():
+            page = doc.id[len(_MENU_ID_PREFIX):]
+            trans_data = doc.to_dict() or {}
+            for lang_code in SUPPORTED_LANGUAGES:
+                text = get_translation_text(trans_data, lang_code)
+                if text:
+                    catalog[(page, lang_code)] = text
+    except Exception as e:
+        st.error(f"메뉴 번역 조회 실패: {e}")
+    return catalog
+
+
 def get_menu_translation(page: str, lang_code: str = "ko") -> Optional[str]:
     """
-    메뉴 번역 텍스트 가져오기
+    메뉴 번역 텍스트 가져오기 (카탈로그 조회, I/O 없음)
     
     Args:
         page: 메뉴 페이지 식별자 (예: "dashboard")
@@ -91,25 +147,13 @@ def get_menu_translation(page: str, lang_code: str = "ko") -> Optional[str]:
     Returns:
         str: 번역된 텍스트 또는 None
     """
-    # Firebase에서 번역 조회 시도
-    trans_id = f"menu.{page}"
-    trans_data = get_translation_by_id(trans_id)
-    
-    if trans_data:
-        # 번역 데이터에서 해당 언어 텍스트 가져오기
-        translated_text = get_translation_text(trans_data, lang_code)
-        if translated_text:
-            return translated_text
-    
-    # 번역이 없으면 기본값 반환
-    menu_items = get_menu_items()
-    for item in menu_items:
-        if item.get("page") == page:
-            if lang_code == "en":
-                return item.get("label_en", item.get("label"))
-            else:
-                return item.get("label")
-    
+    catalog = get_menu_catalog()
+    label = catalog.get((page, lang_code))
+    if label:
+        return label
+    # 번역이 없으면 기본값 (en은 영문 라벨, 그 외는 한국어 라벨)
+    if lang_code != "en":
+        return catalog.get((page, "ko"))
     return None
 
 
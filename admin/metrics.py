@@ -0,0 +1,375 @@
+"""
+데이터 접근 계측 (Firestore 읽기/쓰기 수, 캐시 hit/miss, 소요 시간)
+
+- admin/* 데이터 접근 함수에 @instrument(컬렉션)을 붙이면 호출마다 기록됩니다.
+  @st.cache_data 위에 붙여야 캐시 hit(본문 미실행)도 기록됩니다.
+- 캐시 hit/miss: 호출 중 get_db()가 불렸으면 miss (Firestore 접근), 아니면 hit
+- 읽기 수: record_reads()로 보고한 값 + 하위 계측 함수의 읽기 합계, 없으면 반환값의 문서 수 (miss일 때만)
+- 쓰기 수: record_writes()로 보고한 값, 없으면 성공(True 반환) 1건
+- 집계 범위: 프로세스 전체 / 세션 / rerun (render_page_header에서 rerun 경계 표시)
+- METRICS_LOG_PATH 지정 시 JSON Lines로 누적 (메모리에 모았다가 주기적으로 한 번에 기록, METRICS_LOG_MAX_BYTES 초과 시 .1로 교체)
+- 프로세스 집계는 지연 시간 히스토그램·컬렉션별 읽기/쓰기·캐시 항목 크기를 포함 (metrics_exporter)
+"""
+import os
+import json
+import atexit
+import pickle
+import time
+import threading
+import functools
+import contextvars
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import streamlit as st
+
+from .config import METRICS_ENABLED, METRICS_LOG_PATH, METRICS_LOG_MAX_BYTES, METRICS_EXPORTER_ENABLED
+
+_SESSION_KEY = "_data_access_metrics"
+
+# 현재 실행 중인 계측 프레임 스택 (중첩 호출 추적)
+_frames: contextvars.ContextVar = contextvars.ContextVar("data_access_frames", default=())
+
+# 지연 시간 히스토그램 버킷 상한 (ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# 프로세스 전체 함수별 집계 / 컬렉션별 읽기·쓰기 (최상위 호출 기준)
+_process_stats: Dict[str, Dict[str, Any]] = {}
+_collection_stats: Dict[str, Dict[str, int]] = {}
+_process_lock = threading.Lock()
+_log_lock = threading.Lock()
+# 호출 기록 버퍼 (호출마다 파일을 열지 않도록 모았다가 기록)
+_log_buffer: List[str] = []
+_log_flushed_at = time.monotonic()
+_LOG_FLUSH_RECORDS = 500
+_LOG_FLUSH_INTERVAL = 5.0
+
+
+class _Frame:
+    __slots__ = ("name", "collection", "kind", "own_db", "db", "child_reads", "child_writes", "reads", "writes")
+
+    def __init__(self, name: str, collection: Optional[str], kind: str):
+        self.name = name
+        self.collection = collection
+        self.kind = kind
+        self.own_db = False
+        self.db = False
+        self.child_reads = 0
+        self.child_writes = 0
+        self.reads: Optional[int] = None
+        self.writes: Optional[int] = None
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {"calls": 0, "hits": 0, "misses": 0, "reads": 0, "writes": 0, "ms": 0.0}
+
+
+def _add_stats(target: Dict[str, Any], record: Dict[str, Any]) -> None:
+    target["calls"] += 1
+    if record["cache"] == "hit":
+        target["hits"] += 1
+    elif record["cache"] == "miss":
+        target["misses"] += 1
+    target["reads"] += record["reads"]
+    target["writes"] += record["writes"]
+    target["ms"] += record["ms"]
+
+
+def _count_documents(result: Any) -> int:
+    """반환값 기준 읽은 문서 수 (get_all 결과의 None도 읽기 1회로 과금)"""
+    if isinstance(result, (list, tuple, set)):
+        return len(result)
+    if isinstance(result, dict):
+        if result and all(isinstance(v, dict) or v is None for v in result.values()):
+            return len(result)
+        return 1
+    if isinstance(result, (bool, int, float, str)):
+        return 0
+    return 1
+
+
+def note_db_access() -> None:
+    """get_db()에서 호출 — 현재 계측 프레임을 Firestore 접근(miss)으로 표시"""
+    frames = _frames.get()
+    if not frames:
+        return
+    frames[-1].own_db = True
+    for frame in frames:
+        frame.db = True
+
+
+def record_reads(count: int) -> None:
+    """반환값과 실제 Firestore 읽기 수가 다른 경우(디스크 스냅샷 등) 읽기 수 보고"""
+    frames = _frames.get()
+    if frames:
+        frame = frames[-1]
+        frame.reads = (frame.reads or 0) + int(count)
+
+
+def record_writes(count: int) -> None:
+    """batch 등 여러 건을 쓰는 함수에서 실제 쓰기 수 보고"""
+    frames = _frames.get()
+    if frames:
+        frame = frames[-1]
+        frame.writes = (frame.writes or 0) + int(count)
+
+
+def _session_metrics() -> Optional[Dict[str, Any]]:
+    """현재 세션의 집계 저장소 (Streamlit 실행 컨텍스트 밖이면 None)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        if get_script_run_ctx() is None:
+            return None
+        if _SESSION_KEY not in st.session_state:
+            st.session_state[_SESSION_KEY] = {
+                "rerun": 0,
+                "current": {"totals": _empty_stats(), "functions": {}, "collections": {}},
+                "last": None,
+                "session": {"totals": _empty_stats(), "functions": {}, "collections": {}},
+            }
+        return st.session_state[_SESSION_KEY]
+    except Exception:
+        return None
+
+
+def _aggregate(bucket: Dict[str, Any], record: Dict[str, Any]) -> None:
+    _add_stats(bucket["totals"], record)
+    _add_stats(bucket["functions"].setdefault(record["name"], _empty_stats()), record)
+    if record["collection"]:
+        _add_stats(bucket["collections"].setdefault(record["collection"], _empty_stats()), record)
+
+
+def flush_metrics_log() -> None:
+    """버퍼에 모인 호출 기록을 METRICS_LOG_PATH에 기록 (프로세스 종료 시 자동 호출)"""
+    global _log_flushed_at
+    with _log_lock:
+        lines = list(_log_buffer)
+        _log_buffer.clear()
+        _log_flushed_at = time.monotonic()
+        if not lines:
+            return
+        try:
+            os.makedirs(os.path.dirname(METRICS_LOG_PATH) or ".", exist_ok=True)
+            if os.path.exists(METRICS_LOG_PATH) and os.path.getsize(METRICS_LOG_PATH) > METRICS_LOG_MAX_BYTES:
+                os.replace(METRICS_LOG_PATH, f"{METRICS_LOG_PATH}.1")
+            with open(METRICS_LOG_PATH, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        except OSError:
+            pass
+
+
+def _append_log(record: Dict[str, Any]) -> None:
+    if not METRICS_LOG_PATH:
+        return
+    line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+    with _log_lock:
+        _log_buffer.append(line)
+        due = len(_log_buffer) >= _LOG_FLUSH_RECORDS or time.monotonic() - _log_flushed_at >= _LOG_FLUSH_INTERVAL
+    if due:
+        flush_metrics_log()
+
+
+if METRICS_LOG_PATH:
+    atexit.register(flush_metrics_log)
+
+
+def _finish(frame: _Frame, result: Any, elapsed_ms: float, error: Optional[str], cacheable: bool, depth: int) -> Dict[str, Any]:
+    reads = frame.child_reads
+    if frame.reads is not None:
+        reads += frame.reads
+    elif frame.own_db and reads == 0 and frame.kind == "read" and error is None:
+        reads = _count_documents(result)
+    writes = frame.child_writes
+    if frame.writes is not None:
+        writes += frame.writes
+    elif frame.kind == "write" and result is True:
+        writes += 1
+
+    if frame.kind == "read" and cacheable:
+        cache = "miss" if frame.db else "hit"
+    else:
+        cache = None
+    record = {
+        "name": frame.name,
+        "collection": frame.collection,
+        "kind": frame.kind,
+        "cache": cache,
+        "reads": reads,
+        "writes": writes,
+        "ms": round(elapsed_ms, 3),
+        "depth": depth,
+    }
+    if cache == "miss" and METRICS_EXPORTER_ENABLED:
+        record["bytes"] = _result_bytes(result)
+    if error:
+        record["error"] = error
+    return record
+
+
+# 결과 크기 추정 시 직렬화할 최대 항목 수 (전체 컬렉션을 miss마다 통째로 pickle하지 않음)
+_SIZE_SAMPLE_ITEMS = 32
+
+
+def _result_bytes(result: Any) -> Optional[int]:
+    """
+    캐시에 저장되는 값의 직렬화 크기 추정 (st.cache_data는 pickle로 저장)
+
+    항목이 _SIZE_SAMPLE_ITEMS개 이하이면 전체를, 그보다 많은 list/dict는 고르게 뽑은 항목만
+    직렬화해 평균 크기 × 항목 수로 추정합니다.
+    """
+    try:
+        if isinstance(result, (list, tuple, dict)) and len(result) > _SIZE_SAMPLE_ITEMS:
+            items = list(result.items()) if isinstance(result, dict) else result
+            step = len(items) / _SIZE_SAMPLE_ITEMS
+            sample = [items[int(i * step)] for i in range(_SIZE_SAMPLE_ITEMS)]
+            sample_bytes = len(pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL))
+            return int(sample_bytes * len(items) / _SIZE_SAMPLE_ITEMS)
+        return len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return None
+
+
+def _add_process_stats(record: Dict[str, Any]) -> None:
+    stats = _process_stats.get(record["name"])
+    if stats is None:
+        stats = _empty_stats()
+        stats.update({
+            "collection": record["collection"],
+            "kind": record["kind"],
+            "buckets": [0] * len(LATENCY_BUCKETS_MS),
+            "bytes": None,
+        })
+        _process_stats[record["name"]] = stats
+    _add_stats(stats, record)
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if record["ms"] <= bound:
+            stats["buckets"][i] += 1
+            break
+    if record.get("bytes") is not None:
+        stats["bytes"] = record["bytes"]
+
+
+def _record(record: Dict[str, Any], parent: Optional[_Frame]) -> None:
+    with _process_lock:
+        _add_process_stats(record)
+        if parent is None and record["collection"]:
+            counters = _collection_stats.setdefault(record["collection"], {"reads": 0, "writes": 0})
+            counters["reads"] += record["reads"]
+            counters["writes"] += record["writes"]
+
+    if parent is not None:
+        # 중첩 호출: 읽기/쓰기 수는 최상위 호출에서 한 번만 집계
+        parent.child_reads += record["reads"]
+        parent.child_writes += record["writes"]
+        return
+
+    session = _session_metrics()
+    if session is not None:
+        _aggregate(session["current"], record)
+        _aggregate(session["session"], record)
+        record["rerun"] = session["rerun"]
+    record["ts"] = datetime.now(timezone.utc).isoformat()
+    _append_log(record)
+
+
+def instrument(
+    collection: Optional[str] = None,
+    kind: Optional[str] = None,
+    name: Optional[str] = None,
+    cached: Optional[bool] = None,
+) -> Callable:
+    """
+    데이터 접근 함수 계측 데코레이터
+
+    Args:
+        collection: 대상 컬렉션 경로 (컬렉션별 집계용)
+        kind: "read" 또는 "write" (기본: 함수 이름이 get_/load로 시작하면 read)
+        name: 집계 이름 (기본: 모듈.함수)
+        cached: 캐시 hit/miss 기록 여부 (기본: st.cache_data 함수면 True)
+
+    Returns:
+        데코레이터 (st.cache_data / swr_cache 함수의 .clear, .version, .patch 유지)
+    """
+    def decorator(func: Callable) -> Callable:
+        func_name = getattr(func, "__name__", None) or getattr(getattr(func, "__wrapped__", None), "__name__", repr(func))
+        module = (getattr(func, "__module__", "") or "").rsplit(".", 1)[-1]
+        metric_name = name or f"{module}.{func_name}"
+        metric_kind = kind or ("read" if func_name.startswith(("get_", "load", "_load")) else "write")
+        cacheable = hasattr(func, "clear") if cached is None else cached
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS_ENABLED:
+                return func(*args, **kwargs)
+            frames = _frames.get()
+            frame = _Frame(metric_name, collection, metric_kind)
+            token = _frames.set(frames + (frame,))
+            start = time.perf_counter()
+            result, error = None, None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                _frames.reset(token)
+                record = _finish(frame, result, elapsed_ms, error, cacheable, len(frames))
+                _record(record, frames[-1] if frames else None)
+
+        # st.cache_data / swr_cache 함수의 .clear, .version, .patch 유지
+        for attr in ("clear", "version", "patch"):
+            if hasattr(func, attr):
+                setattr(wrapper, attr, getattr(func, attr))
+        return wrapper
+
+    return decorator
+
+
+def begin_rerun() -> None:
+    """rerun 경계 표시 (페이지 상단에서 호출) — 직전 rerun 집계를 last로 이동"""
+    session = _session_metrics()
+    if session is None:
+        return
+    if session["current"]["totals"]["calls"]:
+        session["last"] = session["current"]
+    session["current"] = {"totals": _empty_stats(), "functions": {}, "collections": {}}
+    session["rerun"] += 1
+
+
+def get_session_metrics() -> Optional[Dict[str, Any]]:
+    """현재 세션의 rerun/세션 집계 (디버그 패널용)"""
+    return _session_metrics()
+
+
+def get_process_metrics() -> Dict[str, Dict[str, Any]]:
+    """프로세스 전체 함수별 집계 스냅샷 (buckets: LATENCY_BUCKETS_MS 구간별 개수, 누적 아님)"""
+    with _process_lock:
+        return {
+            key: {**value, "buckets": list(value["buckets"])}
+            for key, value in _process_stats.items()
+        }
+
+
+def get_collection_metrics() -> Dict[str, Dict[str, int]]:
+    """프로세스 전체 컬렉션별 읽기/쓰기 수 스냅샷"""
+    with _process_lock:
+        return {key: dict(value) for key, value in _collection_stats.items()}
+
+
+def metrics_rows(functions: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """함수별 집계 → 표 행 (소요 시간 내림차순)"""
+    rows = []
+    for func_name, stats in functions.items():
+        rows.append({
+            "함수": func_name,
+            "호출": stats["calls"],
+            "hit": stats["hits"],
+            "miss": stats["misses"],
+            "읽기": stats["reads"],
+            "쓰기": stats["writes"],
+            "시간(ms)": round(stats["ms"], 1),
+        })
+    rows.sort(key=lambda r: r["시간(ms)"], reverse=True)
+    return rows
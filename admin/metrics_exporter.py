@@ -0,0 +1,165 @@
+"""
+데이터 접근 메트릭 내보내기 (Prometheus / OpenMetrics)
+
+admin.metrics의 프로세스 집계를 텍스트 형식으로 변환해
+- ADMIN_METRICS_PORT: 별도 HTTP 엔드포인트 (GET /metrics, Accept에 따라 OpenMetrics/Prometheus 형식)
+- ADMIN_METRICS_TEXTFILE: node_exporter textfile collector용 .prom 파일 (주기적으로 교체)
+으로 내보냅니다. admin_main.py / 페이지 헤더에서 start_metrics_exporter()를 호출하며 프로세스당 1회만 시작됩니다.
+
+메트릭:
+- admin_data_call_latency_seconds (histogram): 함수별 소요 시간 (function, collection, kind)
+- admin_firestore_reads_total / admin_firestore_writes_total (counter): 컬렉션별 문서 읽기/쓰기
+- admin_cache_requests_total (counter): st.cache_data 로더별 hit/miss
+- admin_cache_hit_ratio (gauge): 로더별 캐시 hit 비율
+- admin_cache_entry_bytes (gauge): 로더별 마지막 miss 결과의 직렬화 크기 (표본 항목으로 추정)
+"""
+import os
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+
+from .config import (
+    METRICS_EXPORTER_PORT, METRICS_EXPORTER_ADDRESS,
+    METRICS_TEXTFILE_PATH, METRICS_TEXTFILE_INTERVAL_SECONDS,
+)
+from .metrics import LATENCY_BUCKETS_MS, get_process_metrics, get_collection_metrics
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: Any) -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels.items() if value is not None]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metrics(openmetrics: bool = True) -> str:
+    """
+    현재 프로세스 집계를 텍스트 노출 형식으로 변환
+
+    Args:
+        openmetrics: True면 OpenMetrics 1.0, False면 Prometheus text 0.0.4 (textfile collector용)
+
+    Returns:
+        str: 노출 텍스트
+    """
+    functions = get_process_metrics()
+    collections = get_collection_metrics()
+    lines: List[str] = []
+
+    def _family(name: str, metric_type: str, help_text: str, counter: bool = False) -> None:
+        # OpenMetrics는 counter 패밀리 이름에서 _total을 뺌
+        family = name if (not counter or not openmetrics) else name[: -len("_total")]
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {metric_type}")
+
+    _family("admin_data_call_latency_seconds", "histogram", "Data-access call latency")
+    for func_name, stats in sorted(functions.items()):
+        labels = {"function": func_name, "collection": stats.get("collection"), "kind": stats.get("kind")}
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, stats["buckets"]):
+            cumulative += count
+            lines.append(f"admin_data_call_latency_seconds_bucket{_labels(**labels, le=bound / 1000)} {cumulative}")
+        lines.append(f'admin_data_call_latency_seconds_bucket{_labels(**labels, le="+Inf")} {stats["calls"]}')
+        lines.append(f"admin_data_call_latency_seconds_sum{_labels(**labels)} {_number(stats['ms'] / 1000)}")
+        lines.append(f"admin_data_call_latency_seconds_count{_labels(**labels)} {stats['calls']}")
+
+    _family("admin_firestore_reads_total", "counter", "Firestore documents read", counter=True)
+    for collection, counters in sorted(collections.items()):
+        lines.append(f"admin_firestore_reads_total{_labels(collection=collection)} {counters['reads']}")
+    _family("admin_firestore_writes_total", "counter", "Firestore documents written", counter=True)
+    for collection, counters in sorted(collections.items()):
+        lines.append(f"admin_firestore_writes_total{_labels(collection=collection)} {counters['writes']}")
+
+    cached = {name: stats for name, stats in sorted(functions.items()) if stats["hits"] or stats["misses"]}
+    _family("admin_cache_requests_total", "counter", "Cached loader lookups by result", counter=True)
+    for func_name, stats in cached.items():
+        lines.append(f"admin_cache_requests_total{_labels(function=func_name, result='hit')} {stats['hits']}")
+        lines.append(f"admin_cache_requests_total{_labels(function=func_name, result='miss')} {stats['misses']}")
+    _family("admin_cache_hit_ratio", "gauge", "Cached loader hit ratio")
+    for func_name, stats in cached.items():
+        ratio = stats["hits"] / (stats["hits"] + stats["misses"])
+        lines.append(f"admin_cache_hit_ratio{_labels(function=func_name)} {_number(round(ratio, 6))}")
+    _family("admin_cache_entry_bytes", "gauge", "Estimated serialized size of the last cached loader result (sampled)")
+    for func_name, stats in cached.items():
+        if stats.get("bytes") is not None:
+            lines.append(f"admin_cache_entry_bytes{_labels(function=func_name)} {stats['bytes']}")
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in (self.headers.get("Accept") or "")
+        body = render_metrics(openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프마다 stderr 로그를 남기지 않음
+        pass
+
+
+def write_metrics_textfile(path: str) -> None:
+    """textfile collector용 파일을 원자적으로 교체 (.prom)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_metrics(openmetrics=False))
+    os.replace(tmp_path, path)
+
+
+def _textfile_loop(path: str, interval: int) -> None:
+    while True:
+        try:
+            write_metrics_textfile(path)
+        except OSError:
+            pass
+        time.sleep(max(1, interval))
+
+
+@st.cache_resource
+def start_metrics_exporter() -> Dict[str, Optional[str]]:
+    """
+    메트릭 내보내기 시작 (프로세스당 1회, 설정이 없으면 아무것도 하지 않음)
+
+    Returns:
+        Dict: {"http": 수신 주소 또는 None, "textfile": 파일 경로 또는 None, "error": 오류 메시지}
+    """
+    status: Dict[str, Optional[str]] = {"http": None, "textfile": None, "error": None}
+    if METRICS_EXPORTER_PORT:
+        try:
+            server = ThreadingHTTPServer((METRICS_EXPORTER_ADDRESS, METRICS_EXPORTER_PORT), _MetricsHandler)
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="admin-metrics-http", daemon=True).start()
+            status["http"] = f"{METRICS_EXPORTER_ADDRESS}:{METRICS_EXPORTER_PORT}"
+        except OSError as e:
+            status["error"] = f"메트릭 포트 바인딩 실패: {e}"
+    if METRICS_TEXTFILE_PATH:
+        threading.Thread(
+            target=_textfile_loop,
+            args=(METRICS_TEXTFILE_PATH, METRICS_TEXTFILE_INTERVAL_SECONDS),
+            name="admin-metrics-textfile",
+            daemon=True,
+        ).start()
+        status["textfile"] = METRICS_TEXTFILE_PATH
+    return status
@@ -6,13 +6,17 @@ from firebase_admin import firestore
 from typing import List, Dict, Optional, Any
 from .firebase import get_db
 from .config import COLLECTIONS
-from .utils import convert_firestore_data
+from .utils import convert_firestore_data, with_timestamp_ms
+from .metrics import instrument
+from .swr_cache import swr_cache
+from .shared_cache import invalidate_collection, register_local_cache
 
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@instrument(COLLECTIONS["PAID_SERVICE_REQUESTS"])
+@swr_cache(ttl=300, error_message="유료 서비스 신청 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_paid_service_requests() -> List[Dict[str, Any]]:
     """
-    모든 유료 서비스 신청 조회 (캐시됨)
+    모든 유료 서비스 신청 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
         List[Dict]: 유료 서비스 신청 리스트
@@ -37,7 +41,7 @@ def get_all_paid_service_requests() -> List[Dict[str, Any]]:
         for doc in docs:
             req_data = doc.to_dict()
             req_data["id"] = doc.id
-            req_data = convert_firestore_data(req_data)
+            req_data = convert_firestore_data(with_timestamp_ms(req_data))
             requests.append(req_data)
         return requests
     except Exception as e:
@@ -49,14 +53,14 @@ def get_all_paid_service_requests() -> List[Dict[str, Any]]:
             for doc in docs:
                 req_data = doc.to_dict()
                 req_data["id"] = doc.id
-                req_data = convert_firestore_data(req_data)
+                req_data = convert_firestore_data(with_timestamp_ms(req_data))
                 requests.append(req_data)
             return requests
         except Exception as e2:
-            st.warning(f"유료 서비스 신청 조회 실패: {e}. 컬렉션 경로를 확인해주세요.")
-            return []
+            raise RuntimeError(f"{e}. 컬렉션 경로를 확인해주세요.") from e2
 
 
+@instrument(COLLECTIONS["PAID_SERVICE_REQUESTS"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_paid_service_request_by_id(request_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -86,7 +90,7 @@ def get_paid_service_request_by_id(request_id: str) -> Optional[Dict[str, Any]]:
                 if doc.exists:
                     req_data = doc.to_dict()
                     req_data["id"] = doc.id
-                    req_data = convert_firestore_data(req_data)
+                    req_data = convert_firestore_data(with_timestamp_ms(req_data))
                     return req_data
             except:
                 continue
@@ -97,6 +101,11 @@ def get_paid_service_request_by_id(request_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["PAID_SERVICE_REQUESTS"], get_all_paid_service_requests.clear, get_paid_service_request_by_id.clear)
+
+
+@instrument(COLLECTIONS["PAID_SERVICE_REQUESTS"])
 def update_paid_service_request(request_id: str, data: Dict[str, Any]) -> bool:
     """
     유료 서비스 신청 정보 업데이트
@@ -126,8 +135,7 @@ def update_paid_service_request(request_id: str, data: Dict[str, Any]) -> bool:
             try:
                 doc_ref.update(data)
                 # 캐시 무효화
-                get_all_paid_service_requests.clear()
-                get_paid_service_request_by_id.clear()
+                invalidate_collection(COLLECTIONS["PAID_SERVICE_REQUESTS"])
                 return True
             except:
                 continue
@@ -138,6 +146,7 @@ def update_paid_service_request(request_id: str, data: Dict[str, Any]) -> bool:
         return False
 
 
+@instrument(COLLECTIONS["PAID_SERVICE_REQUESTS"])
 def approve_paid_service_request(request_id: str) -> bool:
     """
     유료 서비스 신청 승인
@@ -154,6 +163,7 @@ def approve_paid_service_request(request_id: str) -> bool:
     })
 
 
+@instrument(COLLECTIONS["PAID_SERVICE_REQUESTS"])
 def reject_paid_service_request(request_id: str, reason: str = "") -> bool:
     """
     유료 서비스 신청 거부
@@ -172,6 +182,7 @@ def reject_paid_service_request(request_id: str, reason: str = "") -> bool:
     })
 
 
+@instrument(COLLECTIONS["PAID_SERVICE_REQUESTS"])
 def delete_paid_service_request(request_id: str) -> bool:
     """
     유료 서비스 신청 삭제
@@ -198,8 +209,7 @@ def delete_paid_service_request(request_id: str) -> bool:
             try:
                 doc_ref.delete()
                 # 캐시 무효화
-                get_all_paid_service_requests.clear()
-                get_paid_service_request_by_id.clear()
+                invalidate_collection(COLLECTIONS["PAID_SERVICE_REQUESTS"])
                 return True
             except:
                 continue
@@ -7,12 +7,17 @@ from typing import List, Dict, Optional, Any
 from .firebase import get_db
 from .config import COLLECTIONS
 from .utils import convert_firestore_data
+from .metrics import instrument
+from .swr_cache import swr_cache
+from .shared_cache import invalidate_collection, register_local_cache, shared_load
+from .snapshot_cache import load_collection, remove_snapshot_docs
 
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
+@swr_cache(ttl=300, error_message="공개 레시피 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_public_recipes() -> List[Dict[str, Any]]:
     """
-    모든 공개 레시피 조회 (캐시됨)
+    모든 공개 레시피 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
         List[Dict]: 공개 레시피 리스트
@@ -21,21 +26,13 @@ def get_all_public_recipes() -> List[Dict[str, Any]]:
     if db is None:
         return []
     
-    try:
-        recipes_ref = db.collection(COLLECTIONS["PUBLIC_RECIPES"])
-        docs = recipes_ref.stream()
-        recipes = []
-        for doc in docs:
-            recipe_data = doc.to_dict()
-            recipe_data["id"] = doc.id
-            recipe_data = convert_firestore_data(recipe_data)
-            recipes.append(recipe_data)
-        return recipes
-    except Exception as e:
-        st.error(f"공개 레시피 조회 실패: {e}")
-        return []
+    return shared_load(
+        COLLECTIONS["PUBLIC_RECIPES"], "all",
+        lambda: load_collection(COLLECTIONS["PUBLIC_RECIPES"], on_change=get_all_public_recipes.clear),
+    )
 
 
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_public_recipe_by_id(recipe_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -65,6 +62,11 @@ def get_public_recipe_by_id(recipe_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["PUBLIC_RECIPES"], get_all_public_recipes.clear, get_public_recipe_by_id.clear)
+
+
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
 def update_public_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
     """
     공개 레시피 정보 업데이트
@@ -85,14 +87,14 @@ def update_public_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.update(data)
         # 캐시 무효화
-        get_all_public_recipes.clear()
-        get_public_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["PUBLIC_RECIPES"])
         return True
     except Exception as e:
         st.error(f"공개 레시피 업데이트 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
 def create_public_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
     """
     새 공개 레시피 생성
@@ -114,14 +116,14 @@ def create_public_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.set(data)
         # 캐시 무효화
-        get_all_public_recipes.clear()
-        get_public_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["PUBLIC_RECIPES"])
         return True
     except Exception as e:
         st.error(f"공개 레시피 생성 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
 def delete_public_recipe(recipe_id: str) -> bool:
     """
     공개 레시피 삭제
@@ -139,15 +141,16 @@ def delete_public_recipe(recipe_id: str) -> bool:
     try:
         doc_ref = db.collection(COLLECTIONS["PUBLIC_RECIPES"]).document(recipe_id)
         doc_ref.delete()
+        remove_snapshot_docs(COLLECTIONS["PUBLIC_RECIPES"], [recipe_id])
         # 캐시 무효화
-        get_all_public_recipes.clear()
-        get_public_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["PUBLIC_RECIPES"])
         return True
     except Exception as e:
         st.error(f"공개 레시피 삭제 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
 def approve_public_recipe(recipe_id: str) -> bool:
     """
     공개 레시피 승인
@@ -161,6 +164,7 @@ def approve_public_recipe(recipe_id: str) -> bool:
     return update_public_recipe(recipe_id, {"status": "approved", "approvedAt": firestore.SERVER_TIMESTAMP})
 
 
+@instrument(COLLECTIONS["PUBLIC_RECIPES"])
 def reject_public_recipe(recipe_id: str, reason: str = "") -> bool:
     """
     공개 레시피 거부
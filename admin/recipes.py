@@ -7,12 +7,16 @@ from typing import List, Dict, Optional, Any
 from .firebase import get_db
 from .config import COLLECTIONS
 from .utils import convert_firestore_data
+from .metrics import instrument
+from .swr_cache import swr_cache
+from .shared_cache import invalidate_collection, register_local_cache, shared_load
 
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@instrument(COLLECTIONS["RECIPES"])
+@swr_cache(ttl=300, error_message="레시피 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_recipes() -> List[Dict[str, Any]]:
     """
-    모든 레시피 조회 (캐시됨)
+    모든 레시피 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
         List[Dict]: 레시피 리스트
@@ -21,21 +25,20 @@ def get_all_recipes() -> List[Dict[str, Any]]:
     if db is None:
         return []
     
-    try:
-        recipes_ref = db.collection(COLLECTIONS["RECIPES"])
-        docs = recipes_ref.stream()
+    def _load() -> List[Dict[str, Any]]:
         recipes = []
-        for doc in docs:
+        for doc in db.collection(COLLECTIONS["RECIPES"]).stream():
             recipe_data = doc.to_dict()
             recipe_data["id"] = doc.id
             recipe_data = convert_firestore_data(recipe_data)
             recipes.append(recipe_data)
         return recipes
-    except Exception as e:
-        st.error(f"레시피 조회 실패: {e}")
-        return []
 
+    # 인스턴스 공유 캐시에 현재 버전이 있으면 재조회하지 않음
+    return shared_load(COLLECTIONS["RECIPES"], "all", _load)
 
+
+@instrument(COLLECTIONS["RECIPES"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_recipe_by_id(recipe_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -65,6 +68,11 @@ def get_recipe_by_id(recipe_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["RECIPES"], get_all_recipes.clear, get_recipe_by_id.clear)
+
+
+@instrument(COLLECTIONS["RECIPES"])
 def update_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
     """
     레시피 정보 업데이트
@@ -85,14 +93,14 @@ def update_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.update(data)
         # 캐시 무효화
-        get_all_recipes.clear()
-        get_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["RECIPES"])
         return True
     except Exception as e:
         st.error(f"레시피 업데이트 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["RECIPES"])
 def create_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
     """
     새 레시피 생성
@@ -114,14 +122,14 @@ def create_recipe(recipe_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.set(data)
         # 캐시 무효화
-        get_all_recipes.clear()
-        get_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["RECIPES"])
         return True
     except Exception as e:
         st.error(f"레시피 생성 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["RECIPES"])
 def delete_recipe(recipe_id: str) -> bool:
     """
     레시피 삭제
@@ -140,14 +148,14 @@ def delete_recipe(recipe_id: str) -> bool:
         doc_ref = db.collection(COLLECTIONS["RECIPES"]).document(recipe_id)
         doc_ref.delete()
         # 캐시 무효화
-        get_all_recipes.clear()
-        get_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["RECIPES"])
         return True
     except Exception as e:
         st.error(f"레시피 삭제 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["RECIPES"])
 def approve_recipe(recipe_id: str) -> bool:
     """
     레시피 승인
@@ -161,6 +169,7 @@ def approve_recipe(recipe_id: str) -> bool:
     return update_recipe(recipe_id, {"status": "approved", "approvedAt": firestore.SERVER_TIMESTAMP})
 
 
+@instrument(COLLECTIONS["RECIPES"])
 def reject_recipe(recipe_id: str, reason: str = "") -> bool:
     """
     레시피 거부
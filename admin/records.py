@@ -0,0 +1,302 @@
+"""
+컬렉션 캐시용 압축 레코드 (ai-tools, users, tool_translations)
+
+목록 로더가 문서마다 dict를 두면 키 문자열·ISO 날짜 문자열·반복되는 상태값이 문서 수만큼 복제됩니다.
+여기의 레코드는
+- 자주 쓰는 필드를 __slots__에 보관 (문서별 키 해시 테이블 없음, 나머지 필드만 _extra dict)
+- 상태·언어·카테고리 같은 범주형 값은 sys.intern으로 한 객체를 공유
+- 타임스탬프는 epoch 마이크로초 정수로 보관하고 조회할 때 ISO 문자열로 변환
+  ({field}Ms 컬럼도 같은 값에서 계산, 원래 문자열로 복원되지 않는 값은 문자열 그대로 보관)
+- 거의 쓰지 않는 긴 텍스트 필드는 zlib 압축해 두고 조회할 때 풀어서 반환
+합니다. collections.abc.Mapping이라 .get / [] / in / dict(record) / pandas는 그대로 동작하고,
+admin.frozen과 같이 읽기 전용입니다 (copy.copy / copy.deepcopy는 일반 dict 반환).
+
+메모리 측정: python -m scripts.benchmarks.memory
+"""
+import sys
+import zlib
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .frozen import FrozenList, FrozenRecord, thaw
+from .utils import TIMESTAMP_MS_FIELDS, to_epoch_ms
+
+# 이 크기(UTF-8 바이트) 이상인 지연 필드·기타 필드 문자열만 압축
+LAZY_TEXT_MIN_BYTES = 512
+
+# 중첩 dict(번역 fields 등)에서 intern할 범주형 값의 키
+_NESTED_INTERNED_KEYS = frozenset({"status", "lang"})
+
+_MISSING = object()
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class _LazyText:
+    """압축된 긴 문자열 (조회 시 풀어서 반환)"""
+
+    __slots__ = ("blob",)
+
+    def __init__(self, blob: bytes):
+        self.blob = blob
+
+    def decode(self) -> str:
+        return zlib.decompress(self.blob).decode("utf-8")
+
+
+def _pack_text(value: Any) -> Any:
+    if isinstance(value, str) and len(value) * 4 >= LAZY_TEXT_MIN_BYTES:
+        raw = value.encode("utf-8")
+        if len(raw) >= LAZY_TEXT_MIN_BYTES:
+            blob = zlib.compress(raw)
+            if len(blob) < len(raw):
+                return _LazyText(blob)
+    return value
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return FrozenList(sys.intern(item) if isinstance(item, str) else _compact(item) for item in value)
+    return _compact(value)
+
+
+def _compact(value: Any) -> Any:
+    """중첩 값 읽기 전용 변환 (dict 키와 status/lang 값 intern)"""
+    if isinstance(value, (FrozenRecord, FrozenList, CompactRecord)):
+        return value
+    if isinstance(value, dict):
+        return FrozenRecord({
+            sys.intern(key) if isinstance(key, str) else key:
+                sys.intern(item) if key in _NESTED_INTERNED_KEYS and isinstance(item, str) else _compact(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return FrozenList(_compact(item) for item in value)
+    return value
+
+
+def _pack_timestamp(value: Any) -> Any:
+    """UTC ISO 문자열 → epoch 마이크로초 (ISO 문자열로 정확히 복원될 때만)"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+    if parsed.tzinfo is None or parsed.utcoffset() != timedelta(0):
+        return value
+    micros = (parsed - _EPOCH) // _ONE_MICROSECOND
+    return micros if _format_timestamp(micros) == value else value
+
+
+def _format_timestamp(micros: int) -> str:
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+def _micros_to_ms(micros: int) -> int:
+    # utils.to_epoch_ms와 같은 계산 (float 초 × 1000 후 버림)
+    return int((micros / 1_000_000) * 1000)
+
+
+class CompactRecord(Mapping):
+    """
+    __slots__ 기반 읽기 전용 문서 레코드 (하위 클래스가 __slots__에 필드를 선언)
+
+    하위 클래스 속성:
+        _INTERNED: intern할 범주형 필드 (문자열 또는 문자열 리스트)
+        _TIMESTAMPS: 정수 타임스탬프로 보관할 필드
+        _LAZY: 압축 보관할 긴 텍스트 필드 (_extra의 긴 문자열도 압축)
+    """
+
+    __slots__ = ("_extra",)
+
+    _INTERNED: frozenset = frozenset()
+    _TIMESTAMPS: frozenset = frozenset({"createdAt", "updatedAt"})
+    _LAZY: frozenset = frozenset()
+    _FIELDS: tuple = ()
+    _FIELD_SET: frozenset = frozenset()
+    _DERIVED: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = tuple(cls.__slots__)
+        cls._FIELD_SET = frozenset(cls._FIELDS)
+        # createdAtMs 등: 같은 타임스탬프 슬롯에서 계산 ({Ms 키: 원본 필드})
+        cls._DERIVED = {
+            f"{field}Ms": field for field in TIMESTAMP_MS_FIELDS
+            if field in cls._TIMESTAMPS and field in cls._FIELD_SET
+        }
+
+    def __init__(self, data: Dict[str, Any]):
+        cls = type(self)
+        extra = {}
+        for key, value in data.items():
+            if key in cls._TIMESTAMPS and not isinstance(value, str) and value is not None:
+                # 숫자 등으로 저장된 타임스탬프는 정수 타임스탬프와 구분되도록 그대로 보관
+                extra[key] = _compact(value)
+            elif key in cls._FIELD_SET:
+                if key in cls._TIMESTAMPS:
+                    value = _pack_timestamp(value)
+                elif key in cls._INTERNED:
+                    value = _intern(value)
+                elif key in cls._LAZY:
+                    value = _pack_text(_compact(value))
+                else:
+                    value = _compact(value)
+                object.__setattr__(self, key, value)
+            elif key not in cls._DERIVED:
+                extra[sys.intern(key) if isinstance(key, str) else key] = _pack_text(_compact(value))
+        # 계산값과 다른 {field}Ms(원본이 문자열이었던 경우 등)는 그대로 보관
+        for ms_key, field in cls._DERIVED.items():
+            if ms_key in data and (not hasattr(self, field) or self._derived(field) != data[ms_key]):
+                extra[ms_key] = data[ms_key]
+        object.__setattr__(self, "_extra", extra or None)
+
+    @classmethod
+    def from_docs(cls, docs: Iterable[Dict[str, Any]]) -> List["CompactRecord"]:
+        """
+        로더 결과(문서 dict 리스트)를 레코드 리스트로 변환
+
+        Args:
+            docs: convert_firestore_data + with_timestamp_ms를 거친 문서 리스트
+
+        Returns:
+            List[CompactRecord]: 레코드 리스트 (이미 레코드인 항목은 그대로)
+        """
+        return [doc if isinstance(doc, cls) else cls(doc) for doc in docs]
+
+    def _derived(self, field: str) -> Optional[int]:
+        value = getattr(self, field, None)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return _micros_to_ms(value)
+        return to_epoch_ms(value)
+
+    def _unpack(self, key: str, value: Any) -> Any:
+        if type(value) is _LazyText:
+            return value.decode()
+        if key in self._TIMESTAMPS and isinstance(value, int) and not isinstance(value, bool):
+            return _format_timestamp(value)
+        return value
+
+    def _lookup(self, key: str) -> Any:
+        extra = self._extra
+        if extra is not None and key in extra:
+            value = extra[key]
+            return value.decode() if type(value) is _LazyText else value
+        if key in self._FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING or value is None or type(value) is str:
+                return value
+            return self._unpack(key, value)
+        field = self._DERIVED.get(key)
+        if field is not None and hasattr(self, field):
+            return self._derived(field)
+        return _MISSING
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        field = self._DERIVED.get(key)
+        if field is not None and hasattr(self, field):
+            return True
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self._FIELDS:
+            if hasattr(self, field):
+                yield field
+        extra = self._extra or {}
+        for ms_key, field in self._DERIVED.items():
+            if ms_key not in extra and hasattr(self, field):
+                yield ms_key
+        yield from extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError(
+            f"{type(self).__name__}는 캐시 공유 객체라 수정할 수 없습니다. "
+            f"dict(...) 또는 copy.deepcopy(...)로 복사 후 수정하세요."
+        )
+
+    __delattr__ = __setattr__
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        # pickle 시 저장 형태(정수 타임스탬프·압축 텍스트) 그대로 복원
+        state = {field: getattr(self, field) for field in self._FIELDS if hasattr(self, field)}
+        state["_extra"] = self._extra
+        return (_restore_record, (type(self), state))
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        return thaw(self)
+
+
+def _restore_record(cls: type, state: Dict[str, Any]) -> CompactRecord:
+    record = cls.__new__(cls)
+    for field, value in state.items():
+        object.__setattr__(record, field, value)
+    return record
+
+
+class ToolRecord(CompactRecord):
+    """ai-tools 문서"""
+
+    __slots__ = (
+        "id", "name", "company", "shortDescription", "description", "intro", "pros", "cons",
+        "categories", "categoryDisplayNames", "primaryCategory", "primaryCategoryKr", "primaryCategoryEn",
+        "subCategoryKr", "subCategoryEn", "tags", "tagsKr", "tagsEn", "features", "featuresKr", "featuresEn",
+        "pricing", "rating", "reviewCount", "popularityScore", "featured", "verified", "status", "docStatus",
+        "source", "sourceUrl", "websiteUrl", "affiliateUrl", "imageUrl", "logoUrl", "logoFileName",
+        "createdAt", "updatedAt",
+    )
+
+    _INTERNED = frozenset({
+        "categories", "primaryCategory", "primaryCategoryKr", "primaryCategoryEn",
+        "subCategoryKr", "subCategoryEn", "tags", "tagsKr", "tagsEn",
+        "pricing", "status", "docStatus", "source",
+    })
+    # 목록·검색 화면에서 쓰지 않는 긴 소개 텍스트 (번역 원문 해시·상세 조회 때만 사용)
+    _LAZY = frozenset({"intro"})
+
+
+class UserRecord(CompactRecord):
+    """users 문서 (문서 ID는 uid)"""
+
+    __slots__ = (
+        "uid", "email", "displayName", "photoURL", "provider", "role", "memberType",
+        "country", "language", "custNo", "marketingConsent", "registeredDate",
+        "createdAt", "updatedAt", "lastLoginAt",
+    )
+
+    _INTERNED = frozenset({"provider", "role", "memberType", "country", "language"})
+    _TIMESTAMPS = frozenset({"createdAt", "updatedAt", "lastLoginAt", "registeredDate"})
+
+
+class ToolTranslationRecord(CompactRecord):
+    """tool_translations 문서 ({toolId}_{lang}, fields.{key}.status도 intern)"""
+
+    __slots__ = (
+        "id", "toolId", "lang", "fields", "sourceHashes",
+        "createdBy", "updatedBy", "createdAt", "updatedAt",
+    )
+
+    # toolId는 언어 수만큼 반복되므로 한 객체로 공유
+    _INTERNED = frozenset({"toolId", "lang", "createdBy", "updatedBy"})
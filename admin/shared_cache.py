@@ -0,0 +1,438 @@
+"""
+인스턴스 간 공유 캐시 (여러 Streamlit 인스턴스 수평 확장용)
+
+st.cache_data와 .clear()는 프로세스 안에서만 동작해, 로드밸런서 뒤 인스턴스가 여럿이면
+한 인스턴스에서 저장해도 나머지는 TTL(최대 5분) 동안 이전 데이터를 보여줍니다.
+ADMIN_SHARED_CACHE_URL을 지정하면
+- 컬렉션 전체 로더 결과를 공유 저장소에 한 벌만 보관 (키: {prefix}:data:s{schema}:{collection}:{name}:v{version},
+  값은 zlib 압축 JSON — 저장소에 쓸 수 있어도 어드민 프로세스에서 코드가 실행되지 않음)
+- 쓰기 시 invalidate_collection()이 컬렉션 버전을 올리고 pub/sub로 무효화 메시지를 발행
+  → 모든 인스턴스가 등록된 로컬 캐시(.clear)를 함께 비움, 이전 버전 키는 더 이상 읽히지 않음
+- 메시지를 놓친 경우 대비: 페이지 렌더링마다 sync_shared_cache()가 버전을 일괄 조회해 보정
+- 삭제 기록(tombstone): 인스턴스별 디스크 스냅샷은 updatedAt 워터마크로 삭제를 알 수 없으므로
+  record_deleted_docs()가 삭제한 문서 ID를 순번 키에 남기고, 다른 인스턴스는 get_deleted_docs()로 반영
+합니다.
+
+- redis://, rediss:// : Redis 호환 서버 (redis 패키지 필요)
+- memory:// : 프로세스 내부 대체 구현 (개발·테스트용, 같은 동작을 단일 프로세스에서 확인)
+- 빈 값 (기본): 공유 캐시 없이 기존처럼 로컬 캐시만 사용
+"""
+import json
+import time
+import uuid
+import zlib
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import streamlit as st
+
+from .config import (
+    SHARED_CACHE_URL, SHARED_CACHE_PREFIX, SHARED_CACHE_TTL_SECONDS,
+    SHARED_CACHE_SYNC_INTERVAL_SECONDS, SHARED_CACHE_LOCK_WAIT_SECONDS, SNAPSHOT_MAX_AGE_SECONDS,
+)
+from .metrics import record_reads
+
+# 인스턴스 식별자 (자기가 보낸 무효화 메시지는 무시)
+INSTANCE_ID = uuid.uuid4().hex
+
+# 공유 저장소 값 형식 버전 — 저장하는 결과 형태가 바뀌면 올려서 배포 중 이전 형식 값을 읽지 않도록 함
+SHARED_CACHE_SCHEMA_VERSION = 1
+
+# 로더 1건을 채우는 동안 다른 인스턴스가 같은 컬렉션을 중복 조회하지 않도록 잡는 잠금 유지 시간
+_FILL_LOCK_TTL_SECONDS = 60
+
+
+class LocalCacheBackend:
+    """프로세스 내부 대체 구현 (Redis 명령 중 사용하는 부분만 같은 의미로 구현)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, tuple] = {}  # {키: (값, 만료 시각 또는 None)}
+        self._subscribers: Dict[str, List[Callable[[str], None]]] = {}
+
+    def _alive(self, key: str) -> Optional[Any]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._values[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._alive(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        with self._lock:
+            return [self._alive(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None, nx: bool = False) -> bool:
+        with self._lock:
+            if nx and self._alive(key) is not None:
+                return False
+            self._values[key] = (value, time.time() + ttl if ttl else None)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._alive(key) or 0) + 1
+            self._values[key] = (str(value).encode(), None)
+            return value
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._lock:
+            callbacks = list(self._subscribers.get(channel, ()))
+        for callback in callbacks:
+            callback(message)
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(callback)
+
+
+class RedisCacheBackend:
+    """Redis 호환 서버 (redis-py)"""
+
+    def __init__(self, url: str):
+        import redis
+        self._client = redis.Redis.from_url(url, socket_timeout=5, socket_connect_timeout=5)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return self._client.mget(keys) if keys else []
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None, nx: bool = False) -> bool:
+        return bool(self._client.set(key, value, ex=ttl or None, nx=nx))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(key))
+
+    def publish(self, channel: str, message: str) -> None:
+        self._client.publish(channel, message)
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        threading.Thread(
+            target=self._listen, args=(channel, callback), name="shared-cache-subscriber", daemon=True,
+        ).start()
+
+    def _listen(self, channel: str, callback: Callable[[str], None]) -> None:
+        # 연결이 끊기면 다시 구독 (놓친 메시지는 sync_shared_cache가 버전 비교로 보정)
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(channel)
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        data = message["data"]
+                        callback(data.decode("utf-8") if isinstance(data, bytes) else data)
+            except Exception:
+                time.sleep(5)
+
+
+_backend_lock = threading.Lock()
+_backend: Optional[Any] = None
+_backend_ready = False
+_backend_error: Optional[str] = None
+
+_registry_lock = threading.Lock()
+# {컬렉션: [로컬 캐시 비우기 함수]} / {컬렉션: 마지막으로 반영한 버전}
+_local_clears: Dict[str, List[Callable[[], None]]] = {}
+_seen_versions: Dict[str, int] = {}
+_last_sync = 0.0
+
+
+def _key(*parts: Any) -> str:
+    return ":".join([SHARED_CACHE_PREFIX] + [str(part) for part in parts])
+
+
+def _channel() -> str:
+    return _key("invalidate")
+
+
+def _create_backend(url: str):
+    if url.startswith("memory://"):
+        return LocalCacheBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend(url)
+    raise ValueError(f"지원하지 않는 공유 캐시 주소: {url}")
+
+
+def get_shared_backend():
+    """
+    공유 캐시 백엔드 (프로세스당 1회 생성, 무효화 채널 구독 시작)
+
+    Returns:
+        LocalCacheBackend | RedisCacheBackend | None: 설정이 없거나 초기화 실패 시 None
+    """
+    global _backend, _backend_ready, _backend_error
+    if _backend_ready:
+        return _backend
+    with _backend_lock:
+        if not _backend_ready:
+            if SHARED_CACHE_URL:
+                try:
+                    backend = _create_backend(SHARED_CACHE_URL)
+                    backend.subscribe(_channel(), _on_message)
+                    _backend = backend
+                except Exception as e:
+                    # 공유 캐시 없이 로컬 캐시만으로 계속 동작 (설정 화면에 표시)
+                    _backend_error = f"공유 캐시 초기화 실패: {e}"
+            _backend_ready = True
+    return _backend
+
+
+def register_local_cache(collection: str, *clears: Callable[[], None]) -> None:
+    """
+    컬렉션 무효화 시 함께 비울 로컬 캐시 등록 (모듈 하단에서 1회 호출)
+
+    Args:
+        collection: 컬렉션 경로
+        clears: st.cache_data 함수의 .clear 또는 저장소 비우기 함수
+    """
+    with _registry_lock:
+        registered = _local_clears.setdefault(collection, [])
+        for clear in clears:
+            if clear not in registered:
+                registered.append(clear)
+
+
+def _clear_local(collection: str) -> None:
+    with _registry_lock:
+        clears = list(_local_clears.get(collection, ()))
+    for clear in clears:
+        clear()
+
+
+def _note_version(collection: str, version: int) -> bool:
+    """반영한 버전 기록, 이전에 본 버전과 다르면 True"""
+    with _registry_lock:
+        previous = _seen_versions.get(collection)
+        if previous is not None and version <= previous:
+            return False
+        _seen_versions[collection] = version
+        return previous is not None
+
+
+def _on_message(message: str) -> None:
+    try:
+        payload = json.loads(message)
+    except ValueError:
+        return
+    collection = payload.get("collection")
+    if not collection or payload.get("origin") == INSTANCE_ID:
+        return
+    _note_version(collection, int(payload.get("version") or 0))
+    _clear_local(collection)
+
+
+def _current_version(backend, collection: str) -> int:
+    return int(backend.get(_key("version", collection)) or 0)
+
+
+def _dumps(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _loads(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def shared_load(collection: str, name: str, loader: Callable[[], Any], ttl: int = SHARED_CACHE_TTL_SECONDS) -> Any:
+    """
+    컬렉션 로더 결과를 인스턴스 간 공유 (st.cache_data 로더 본문에서 호출)
+
+    공유 저장소에 현재 버전 결과가 있으면 그대로 반환하고, 없으면 한 인스턴스만 loader를 실행해
+    저장합니다 (다른 인스턴스는 SHARED_CACHE_LOCK_WAIT_SECONDS 동안 결과를 기다림).
+    공유 캐시가 없거나 오류가 나면 loader 결과를 그대로 반환합니다.
+    결과는 JSON으로 저장하므로 loader는 JSON 직렬화 가능한 값(convert_firestore_data 결과)을 반환해야 합니다.
+
+    Args:
+        collection: 컬렉션 경로 (버전 키)
+        name: 로더 이름 (같은 컬렉션의 로더 구분)
+        loader: 실제 조회 함수 (예외는 그대로 전달)
+        ttl: 공유 저장소 보관 시간(초)
+
+    Returns:
+        loader 결과
+    """
+    backend = get_shared_backend()
+    if backend is None:
+        return loader()
+    try:
+        version = _current_version(backend, collection)
+        _note_version(collection, version)
+        data_key = _key("data", f"s{SHARED_CACHE_SCHEMA_VERSION}", collection, name, f"v{version}")
+        blob = backend.get(data_key)
+        if blob is None:
+            lock_key = f"{data_key}:lock"
+            if not backend.set(lock_key, INSTANCE_ID.encode(), ttl=_FILL_LOCK_TTL_SECONDS, nx=True):
+                deadline = time.time() + SHARED_CACHE_LOCK_WAIT_SECONDS
+                while blob is None and time.time() < deadline:
+                    time.sleep(0.2)
+                    blob = backend.get(data_key)
+    except Exception:
+        return loader()
+    if blob is not None:
+        try:
+            value = _loads(blob)
+            record_reads(0)
+            return value
+        except (ValueError, zlib.error) as e:
+            # 형식이 맞지 않는 값은 덮어씀 (조용히 매번 재조회하지 않도록 경고)
+            st.warning(f"공유 캐시 값 해석 실패 ({collection}/{name}): {e}. 다시 조회해 저장합니다.")
+
+    value = loader()
+    try:
+        backend.set(data_key, _dumps(value), ttl=ttl)
+        backend.delete(f"{data_key}:lock")
+    except Exception:
+        pass
+    return value
+
+
+def invalidate_collection(collection: str, clear_local: bool = True) -> None:
+    """
+    쓰기 후 컬렉션 캐시 무효화 (모든 인스턴스)
+
+    Args:
+        collection: 컬렉션 경로
+        clear_local: False면 이 인스턴스의 로컬 캐시는 유지 (저장 직후 로컬 저장소를 직접 갱신한 경우)
+    """
+    if clear_local:
+        _clear_local(collection)
+    backend = get_shared_backend()
+    if backend is None:
+        return
+    try:
+        version = backend.incr(_key("version", collection))
+        _note_version(collection, version)
+        backend.publish(_channel(), json.dumps({
+            "collection": collection, "version": version, "origin": INSTANCE_ID,
+        }))
+    except Exception as e:
+        st.warning(f"공유 캐시 무효화 실패 ({collection}): {e}. 다른 인스턴스는 캐시 만료 후 반영됩니다.")
+
+
+def record_deleted_docs(collection: str, doc_ids: Iterable[str]) -> None:
+    """
+    삭제한 문서 ID를 공유 저장소에 기록 (invalidate_collection 전에 호출)
+
+    기록은 SNAPSHOT_MAX_AGE_SECONDS 동안 보관합니다. 그보다 오래된 스냅샷은 전체 조회로 교체되므로
+    이후에는 필요 없습니다.
+
+    Args:
+        collection: 컬렉션 경로
+        doc_ids: 삭제한 문서 ID
+    """
+    ids = [str(doc_id) for doc_id in doc_ids if doc_id]
+    backend = get_shared_backend()
+    if backend is None or not ids:
+        return
+    try:
+        seq = backend.incr(_key("tombstone_seq", collection))
+        payload = json.dumps({"ids": ids, "deletedAt": time.time()}).encode()
+        backend.set(_key("tombstone", collection, seq), payload, ttl=SNAPSHOT_MAX_AGE_SECONDS)
+    except Exception as e:
+        st.warning(f"삭제 기록 저장 실패 ({collection}): {e}. 다른 인스턴스는 스냅샷 만료 후 반영됩니다.")
+
+
+def get_tombstone_seq(collection: str) -> int:
+    """현재 삭제 기록 순번 (전체 조회 직전에 읽어 스냅샷에 저장, 공유 캐시가 없으면 0)"""
+    backend = get_shared_backend()
+    if backend is None:
+        return 0
+    try:
+        return int(backend.get(_key("tombstone_seq", collection)) or 0)
+    except Exception:
+        return 0
+
+
+def get_deleted_docs(collection: str, after_seq: int) -> Tuple[Dict[str, float], int]:
+    """
+    after_seq 이후 기록된 삭제 문서 조회
+
+    Args:
+        collection: 컬렉션 경로
+        after_seq: 마지막으로 반영한 삭제 기록 순번
+
+    Returns:
+        ({문서 ID: 삭제 시각(epoch 초)}, 다음에 넘길 순번) — 아직 저장 중인 기록이 있으면
+        그 앞 순번까지만 올려 다음 조회에서 다시 확인
+    """
+    backend = get_shared_backend()
+    if backend is None:
+        return {}, after_seq
+    try:
+        latest = int(backend.get(_key("tombstone_seq", collection)) or 0)
+        if latest <= after_seq:
+            return {}, after_seq
+        seqs = list(range(after_seq + 1, latest + 1))
+        blobs = backend.mget([_key("tombstone", collection, seq) for seq in seqs])
+    except Exception:
+        return {}, after_seq
+    deleted: Dict[str, float] = {}
+    next_seq = None
+    for seq, blob in zip(seqs, blobs):
+        if blob is None:
+            if next_seq is None:
+                next_seq = seq - 1
+            continue
+        payload = json.loads(blob)
+        for doc_id in payload.get("ids") or ():
+            deleted[doc_id] = max(deleted.get(doc_id, 0.0), float(payload.get("deletedAt") or 0))
+    return deleted, latest if next_seq is None else next_seq
+
+
+def sync_shared_cache(force: bool = False) -> List[str]:
+    """
+    놓친 무효화 메시지 보정: 등록된 컬렉션 버전을 한 번에 조회해 바뀐 컬렉션의 로컬 캐시를 비움
+    (페이지 헤더에서 호출, SHARED_CACHE_SYNC_INTERVAL_SECONDS 간격으로만 조회)
+
+    Returns:
+        List[str]: 로컬 캐시를 비운 컬렉션 목록
+    """
+    global _last_sync
+    backend = get_shared_backend()
+    if backend is None:
+        return []
+    now = time.time()
+    if not force and now - _last_sync < SHARED_CACHE_SYNC_INTERVAL_SECONDS:
+        return []
+    _last_sync = now
+    with _registry_lock:
+        collections = sorted(_local_clears)
+    try:
+        versions = backend.mget([_key("version", collection) for collection in collections])
+    except Exception:
+        return []
+    changed = []
+    for collection, raw in zip(collections, versions):
+        if _note_version(collection, int(raw or 0)):
+            _clear_local(collection)
+            changed.append(collection)
+    return changed
+
+
+def get_shared_cache_status() -> Dict[str, Any]:
+    """설정 화면 표시용 상태"""
+    backend = get_shared_backend()
+    with _registry_lock:
+        versions = dict(_seen_versions)
+    return {
+        "enabled": backend is not None,
+        "backend": type(backend).__name__ if backend is not None else None,
+        "instance": INSTANCE_ID[:8],
+        "versions": versions,
+        "error": _backend_error,
+    }
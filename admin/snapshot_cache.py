@@ -0,0 +1,349 @@
+"""
+컬렉션 스냅샷 디스크 캐시 (SQLite, 재시작·재배포 후에도 유지)
+
+st.cache_data는 프로세스 메모리에만 있어 재배포 직후 첫 조회가 컬렉션 전체를 다시 읽습니다.
+대형 컬렉션 로더는 load_collection()을 거쳐
+- 스냅샷이 있으면 디스크에서 바로 반환하고 updatedAt 워터마크 이후 변경분만 Firestore에서 조회해 반영
+  (프로세스 첫 조회는 백그라운드 스레드로, 이후 조회는 동기로 — 저장 직후 변경이 바로 보이도록)
+- 스냅샷이 없거나 SNAPSHOT_MAX_AGE_SECONDS를 넘으면 전체 조회 후 스냅샷 교체 (외부 삭제·updatedAt 없는 변경 정리)
+- 스냅샷을 반환하기 전에 다른 인스턴스·스크립트가 남긴 삭제 기록(shared_cache tombstone)을 반영
+합니다. 컬렉션별 테이블에 문서 1건당 zlib 압축 JSON 한 행을 저장합니다.
+"""
+import re
+import json
+import time
+import zlib
+import sqlite3
+import threading
+import os
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .config import SNAPSHOT_CACHE_ENABLED, SNAPSHOT_CACHE_PATH, SNAPSHOT_MAX_AGE_SECONDS
+from .firebase import get_db
+from .metrics import instrument, record_reads
+from .shared_cache import get_deleted_docs, get_tombstone_seq, record_deleted_docs
+from .utils import convert_firestore_data, with_timestamp_ms
+
+WATERMARK_FIELD = "updatedAt"
+
+_write_lock = threading.Lock()
+_state_lock = threading.Lock()
+# 프로세스에서 한 번이라도 변경분 반영을 마친 컬렉션 / 백그라운드 반영 중인 컬렉션
+_synced: set = set()
+_syncing: set = set()
+
+
+def _table(collection: str) -> str:
+    return "snap_" + re.sub(r"\W", "_", collection)
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(SNAPSHOT_CACHE_PATH) or ".", exist_ok=True)
+    conn = sqlite3.connect(SNAPSHOT_CACHE_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS snapshot_meta ("
+        "collection TEXT PRIMARY KEY, watermark_ms INTEGER, full_sync_at REAL)"
+    )
+    # 마지막으로 반영한 공유 삭제 기록 순번
+    conn.execute("CREATE TABLE IF NOT EXISTS snapshot_tombstones (collection TEXT PRIMARY KEY, seq INTEGER)")
+    return conn
+
+
+def _ensure_table(conn: sqlite3.Connection, collection: str) -> str:
+    table = _table(collection)
+    conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (id TEXT PRIMARY KEY, data BLOB NOT NULL)')
+    return table
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _decode(blob: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _to_record(doc, id_field: str) -> Dict[str, Any]:
+    data = doc.to_dict() or {}
+    data[id_field] = doc.id
+    return convert_firestore_data(with_timestamp_ms(data))
+
+
+def _record_watermark(record: Dict[str, Any]) -> int:
+    return record.get(f"{WATERMARK_FIELD}Ms") or 0
+
+
+def _read_meta(collection: str) -> Optional[tuple]:
+    """(watermark_ms, full_sync_at) 또는 None (스냅샷 없음)"""
+    try:
+        conn = _connect()
+        try:
+            return conn.execute(
+                "SELECT watermark_ms, full_sync_at FROM snapshot_meta WHERE collection = ?", (collection,)
+            ).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def _read_snapshot(collection: str) -> Optional[Dict[str, Any]]:
+    """{"docs": [...], "watermark_ms", "full_sync_at", "tombstone_seq"} 또는 None (스냅샷 없음)"""
+    try:
+        conn = _connect()
+        try:
+            meta = conn.execute(
+                "SELECT watermark_ms, full_sync_at FROM snapshot_meta WHERE collection = ?", (collection,)
+            ).fetchone()
+            if meta is None:
+                return None
+            table = _ensure_table(conn, collection)
+            docs = [_decode(row[0]) for row in conn.execute(f'SELECT data FROM "{table}"')]
+            tombstone = conn.execute(
+                "SELECT seq FROM snapshot_tombstones WHERE collection = ?", (collection,)
+            ).fetchone()
+            return {
+                "docs": docs, "watermark_ms": meta[0] or 0, "full_sync_at": meta[1] or 0.0,
+                "tombstone_seq": tombstone[0] if tombstone else 0,
+            }
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError, ValueError, zlib.error):
+        return None
+
+
+def _write_snapshot(
+    collection: str,
+    id_field: str,
+    records: Iterable[Dict[str, Any]],
+    watermark_ms: int,
+    replace: bool,
+    tombstone_seq: int = 0,
+) -> None:
+    """스냅샷 저장 (replace=True면 전체 교체 + full_sync_at·삭제 기록 순번 갱신, False면 변경분 upsert)"""
+    with _write_lock:
+        conn = _connect()
+        try:
+            with conn:
+                table = _ensure_table(conn, collection)
+                if replace:
+                    conn.execute(f'DELETE FROM "{table}"')
+                conn.executemany(
+                    f'INSERT OR REPLACE INTO "{table}" (id, data) VALUES (?, ?)',
+                    ((str(r[id_field]), _encode(r)) for r in records),
+                )
+                if replace:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO snapshot_meta (collection, watermark_ms, full_sync_at) VALUES (?, ?, ?)",
+                        (collection, watermark_ms, time.time()),
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO snapshot_tombstones (collection, seq) VALUES (?, ?)",
+                        (collection, tombstone_seq),
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE snapshot_meta SET watermark_ms = MAX(COALESCE(watermark_ms, 0), ?) WHERE collection = ?",
+                        (watermark_ms, collection),
+                    )
+        finally:
+            conn.close()
+
+
+def upsert_snapshot_docs(collection: str, records: Iterable[Dict[str, Any]], id_field: str = "id") -> None:
+    """
+    저장 직후 스냅샷 문서 갱신 (write-through, 워터마크는 유지)
+    updatedAt을 바꾸지 않는 쓰기(상태 표시 등)도 스냅샷에 반영되도록 사용
+    """
+    records = [r for r in records if r.get(id_field)]
+    if not SNAPSHOT_CACHE_ENABLED or not records or _read_meta(collection) is None:
+        return
+    try:
+        _write_snapshot(collection, id_field, records, 0, replace=False)
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _delete_rows(collection: str, doc_ids: List[str], tombstone_seq: Optional[int] = None) -> None:
+    """스냅샷에서 문서 제거 (tombstone_seq를 주면 반영한 삭제 기록 순번도 저장)"""
+    with _write_lock:
+        conn = _connect()
+        try:
+            with conn:
+                table = _ensure_table(conn, collection)
+                conn.executemany(f'DELETE FROM "{table}" WHERE id = ?', [(doc_id,) for doc_id in doc_ids])
+                if tombstone_seq is not None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO snapshot_tombstones (collection, seq) VALUES (?, ?)",
+                        (collection, tombstone_seq),
+                    )
+        finally:
+            conn.close()
+
+
+def remove_snapshot_docs(collection: str, doc_ids: Iterable[str]) -> None:
+    """
+    삭제 함수에서 호출 (invalidate_collection 전) — 스냅샷에서도 문서 제거 (워터마크로는 삭제를 감지할 수 없음)
+    다른 인스턴스의 스냅샷도 정리되도록 공유 저장소에 삭제 기록을 남김
+    """
+    ids = [str(doc_id) for doc_id in doc_ids if doc_id]
+    if not ids:
+        return
+    record_deleted_docs(collection, ids)
+    if not SNAPSHOT_CACHE_ENABLED:
+        return
+    try:
+        _delete_rows(collection, ids)
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _apply_tombstones(collection: str, id_field: str, docs: List[Dict[str, Any]], after_seq: int) -> List[Dict[str, Any]]:
+    """
+    다른 인스턴스·스크립트의 삭제 기록을 스냅샷 결과에 반영
+
+    삭제 이후 같은 ID로 다시 만들어진 문서(updatedAt이 삭제 시각보다 늦음)는 유지합니다.
+    """
+    deleted, next_seq = get_deleted_docs(collection, after_seq)
+    if next_seq == after_seq:
+        return docs
+    removed = [
+        d.get(id_field) for d in docs
+        if d.get(id_field) in deleted and _record_watermark(d) / 1000 <= deleted[d.get(id_field)]
+    ]
+    try:
+        _delete_rows(collection, [str(doc_id) for doc_id in removed], tombstone_seq=next_seq)
+    except (sqlite3.Error, OSError):
+        pass
+    if not removed:
+        return docs
+    removed_ids = set(removed)
+    return [d for d in docs if d.get(id_field) not in removed_ids]
+
+
+def clear_snapshots() -> None:
+    """스냅샷 전체 삭제 (다음 조회 시 전체 조회로 다시 생성)"""
+    with _write_lock, _state_lock:
+        try:
+            os.remove(SNAPSHOT_CACHE_PATH)
+        except OSError:
+            pass
+        _synced.clear()
+
+
+def _fetch_changes(db, collection: str, id_field: str, watermark_ms: int) -> List[Dict[str, Any]]:
+    since = datetime.fromtimestamp(watermark_ms / 1000, tz=timezone.utc)
+    docs = db.collection(collection).where(WATERMARK_FIELD, ">", since).stream()
+    return [_to_record(doc, id_field) for doc in docs]
+
+
+def _reconcile(collection: str, id_field: str, watermark_ms: int, on_change: Optional[Callable[[], None]]) -> int:
+    """워터마크 이후 변경분 반영, 반영 건수 반환"""
+    db = get_db()
+    if db is None:
+        return 0
+    changes = instrument(collection, kind="read", name="snapshot_cache.reconcile")(_fetch_changes)(
+        db, collection, id_field, watermark_ms
+    )
+    if changes:
+        new_watermark = max([watermark_ms] + [_record_watermark(r) for r in changes])
+        _write_snapshot(collection, id_field, changes, new_watermark, replace=False)
+        if on_change:
+            on_change()
+    return len(changes)
+
+
+def _background_reconcile(collection: str, id_field: str, watermark_ms: int, on_change: Optional[Callable[[], None]]) -> None:
+    try:
+        _reconcile(collection, id_field, watermark_ms, on_change)
+        with _state_lock:
+            _synced.add(collection)
+    except Exception:
+        # 다음 조회에서 다시 시도
+        pass
+    finally:
+        with _state_lock:
+            _syncing.discard(collection)
+
+
+def _merge(docs: List[Dict[str, Any]], changes: List[Dict[str, Any]], id_field: str) -> List[Dict[str, Any]]:
+    if not changes:
+        return docs
+    by_id = {d.get(id_field): d for d in docs}
+    for record in changes:
+        by_id[record.get(id_field)] = record
+    return list(by_id.values())
+
+
+def load_collection(
+    collection: str,
+    id_field: str = "id",
+    on_change: Optional[Callable[[], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    스냅샷 우선 컬렉션 전체 조회 (st.cache_data 로더 본문에서 호출)
+
+    Args:
+        collection: 컬렉션 경로
+        id_field: 문서 ID를 담을 키 (users는 "uid")
+        on_change: 백그라운드 반영으로 변경이 생겼을 때 호출 (로더 캐시 .clear 등)
+
+    Returns:
+        List[Dict]: 문서 리스트 (convert_firestore_data + createdAtMs/updatedAtMs)
+
+    Raises:
+        Firestore 조회 예외 (호출하는 로더의 기존 오류 처리 사용)
+    """
+    snapshot = _read_snapshot(collection) if SNAPSHOT_CACHE_ENABLED else None
+    if snapshot is not None and time.time() - snapshot["full_sync_at"] < SNAPSHOT_MAX_AGE_SECONDS:
+        with _state_lock:
+            first_load = collection not in _synced
+            start_background = first_load and collection not in _syncing
+            if start_background:
+                _syncing.add(collection)
+        record_reads(0)
+        if start_background:
+            # 재시작 직후: 디스크 스냅샷을 바로 반환하고 변경분은 백그라운드로 반영
+            threading.Thread(
+                target=_background_reconcile,
+                args=(collection, id_field, snapshot["watermark_ms"], on_change),
+                name=f"snapshot-reconcile-{collection}",
+                daemon=True,
+            ).start()
+            return _apply_tombstones(collection, id_field, snapshot["docs"], snapshot["tombstone_seq"])
+        if first_load:
+            return _apply_tombstones(collection, id_field, snapshot["docs"], snapshot["tombstone_seq"])
+        # 같은 프로세스의 재조회(저장 후 캐시 무효화 등): 변경분을 동기로 반영
+        db = get_db()
+        if db is None:
+            return _apply_tombstones(collection, id_field, snapshot["docs"], snapshot["tombstone_seq"])
+        changes = _fetch_changes(db, collection, id_field, snapshot["watermark_ms"])
+        record_reads(len(changes))
+        if changes:
+            new_watermark = max([snapshot["watermark_ms"]] + [_record_watermark(r) for r in changes])
+            try:
+                _write_snapshot(collection, id_field, changes, new_watermark, replace=False)
+            except (sqlite3.Error, OSError):
+                pass
+        # 변경분 반영 후 삭제 기록 적용 (삭제 후 다시 만든 문서는 updatedAt으로 구분)
+        return _apply_tombstones(collection, id_field, _merge(snapshot["docs"], changes, id_field), snapshot["tombstone_seq"])
+
+    db = get_db()
+    if db is None:
+        return snapshot["docs"] if snapshot else []
+    # 전체 조회 전에 읽은 순번까지의 삭제는 조회 결과에 이미 반영됨
+    tombstone_seq = get_tombstone_seq(collection) if SNAPSHOT_CACHE_ENABLED else 0
+    records = [_to_record(doc, id_field) for doc in db.collection(collection).stream()]
+    record_reads(len(records))
+    if not SNAPSHOT_CACHE_ENABLED:
+        return records
+    watermark_ms = max([0] + [_record_watermark(r) for r in records])
+    try:
+        _write_snapshot(collection, id_field, records, watermark_ms, replace=True, tombstone_seq=tombstone_seq)
+        with _state_lock:
+            _synced.add(collection)
+    except (sqlite3.Error, OSError):
+        pass
+    return records
@@ -0,0 +1,288 @@
+"""
+stale-while-revalidate 로더 캐시
+
+st.cache_data(ttl=300)은 TTL이 지나면 다음 조회가 컬렉션 전체를 다시 읽는 동안 화면이 멈춥니다.
+컬렉션 로더는 @swr_cache로 감싸
+- TTL 이내: 캐시 반환 (조회마다 복사하지 않고 같은 불변 객체 — admin.frozen)
+- TTL 경과: 마지막 정상 결과를 바로 반환하고 백그라운드 스레드에서 다시 조회
+- 캐시 없음 / .clear() 직후: 동기 조회 (저장 직후 변경이 바로 보이도록)
+합니다. 백그라운드 조회가 실패하면 이전 결과를 유지하고 오류를 상태에 기록합니다.
+render_refresh_status()(components)가 마지막 갱신 시각과 갱신 중 여부를 사이드바에 표시합니다.
+
+결과가 바뀔 때마다 로더의 version()이 올라가며, @versioned_view는 이 버전이 같으면
+파생 결과(카테고리 통계 등)를 다시 계산하지 않습니다.
+"""
+import time
+import threading
+import functools
+from typing import Any, Callable, Dict, List, Optional
+
+import streamlit as st
+
+from .metrics import instrument
+from .frozen import freeze
+from .utils import DateIndex
+
+_registry_lock = threading.Lock()
+_registry: List["SWRLoader"] = []
+
+
+def _make_key(args: tuple, kwargs: Dict[str, Any]) -> tuple:
+    return args + tuple(sorted(kwargs.items()))
+
+
+class SWRLoader:
+    """@swr_cache로 감싼 로더 (호출, .clear(), 상태 조회)"""
+
+    def __init__(self, func: Callable, ttl: int, error_message: str, default_factory: Callable[[], Any]):
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._ttl = ttl
+        self._error_message = error_message
+        self._default_factory = default_factory
+        self._lock = threading.Lock()
+        self._fill_lock = threading.Lock()
+        self._entries: Dict[tuple, Dict[str, Any]] = {}
+        # .clear()·.patch()마다 증가 — 그 전에 시작한 조회 결과는 저장하지 않음
+        self._generation = 0
+        # 저장·삭제마다 증가 — 파생 결과 캐시 키 (versioned_view)
+        self._version = 0
+        self.display_name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        self._refresh = instrument(kind="read", name=f"{self.display_name}.background_refresh")(func)
+
+    def __call__(self, *args, **kwargs):
+        key = _make_key(args, kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generation
+            start_refresh = False
+            if entry is not None:
+                if time.time() - entry["loaded_at"] >= self._ttl and not entry["refreshing"]:
+                    entry["refreshing"] = True
+                    start_refresh = True
+                value = entry["value"]
+        if entry is not None:
+            if start_refresh:
+                threading.Thread(
+                    target=self._background_refresh, args=(key, args, kwargs, generation),
+                    name=f"swr-refresh-{self.display_name}", daemon=True,
+                ).start()
+            return value
+
+        with self._fill_lock:
+            # 다른 세션이 먼저 채웠으면 그 결과 사용
+            with self._lock:
+                entry = self._entries.get(key)
+                generation = self._generation
+            if entry is not None:
+                return entry["value"]
+            try:
+                value = freeze(self._func(*args, **kwargs))
+            except Exception as e:
+                st.error(f"{self._error_message}: {e}")
+                return self._default_factory()
+            self._store(key, value, generation)
+            return value
+
+    def _store(self, key: tuple, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._version += 1
+            self._entries[key] = {"value": value, "loaded_at": time.time(), "refreshing": False, "error": None}
+
+    def _background_refresh(self, key: tuple, args: tuple, kwargs: Dict[str, Any], generation: int) -> None:
+        try:
+            value = freeze(self._refresh(*args, **kwargs))
+        except Exception as e:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    # 이전 결과 유지, TTL 경과 후 다시 시도
+                    entry["refreshing"] = False
+                    entry["loaded_at"] = time.time()
+                    entry["error"] = str(e)
+            return
+        self._store(key, value, generation)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["refreshing"] = False
+
+    def clear(self) -> None:
+        """캐시 삭제 (다음 조회는 동기로 다시 읽음)"""
+        with self._lock:
+            self._generation += 1
+            self._version += 1
+            self._entries.clear()
+
+    def patch(self, update: Callable[[Any], Any]) -> bool:
+        """
+        저장 직후 캐시된 결과를 다시 조회하지 않고 갱신 (일괄 수정 등)
+
+        Args:
+            update: 현재 결과 → 새 결과 (읽기 전용 결과를 받으므로 새 객체를 만들어 반환)
+
+        Returns:
+            bool: 갱신한 항목이 있는지 (없으면 다음 조회가 새로 읽음)
+        """
+        with self._lock:
+            if not self._entries:
+                return False
+            for entry in self._entries.values():
+                entry["value"] = freeze(update(entry["value"]))
+                # 저장 전에 시작한 백그라운드 조회 결과는 버림 (TTL 경과 후 다시 조회)
+                entry["refreshing"] = False
+            self._generation += 1
+            self._version += 1
+            return True
+
+    def version(self) -> int:
+        """현재 결과 버전 (새 결과 저장·.clear()·.patch()마다 증가)"""
+        with self._lock:
+            return self._version
+
+    def status(self) -> List[Dict[str, Any]]:
+        """항목별 {"loaded_at", "refreshing", "error", "stale"}"""
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    "loaded_at": entry["loaded_at"],
+                    "refreshing": entry["refreshing"],
+                    "error": entry["error"],
+                    "stale": now - entry["loaded_at"] >= self._ttl,
+                }
+                for entry in self._entries.values()
+            ]
+
+
+def swr_cache(
+    ttl: int = 300,
+    error_message: str = "데이터 조회 실패",
+    default_factory: Callable[[], Any] = list,
+) -> Callable[[Callable], SWRLoader]:
+    """
+    stale-while-revalidate 캐시 데코레이터 (컬렉션 로더용, @instrument 아래에 둠)
+
+    감싼 함수는 조회 실패 시 예외를 그대로 올려야 합니다.
+    동기 조회 실패는 st.error(f"{error_message}: {e}") 후 default_factory() 반환,
+    백그라운드 조회 실패는 이전 결과를 유지합니다.
+
+    Args:
+        ttl: 이 시간(초)이 지나면 다음 조회 때 백그라운드로 다시 조회
+        error_message: 동기 조회 실패 시 표시할 메시지
+        default_factory: 동기 조회 실패 시 반환값 생성 함수
+
+    Returns:
+        데코레이터
+    """
+    def decorator(func: Callable) -> SWRLoader:
+        loader = SWRLoader(func, ttl, error_message, default_factory)
+        with _registry_lock:
+            _registry.append(loader)
+        return loader
+
+    return decorator
+
+
+def versioned_view(*sources: Callable) -> Callable[[Callable], Callable]:
+    """
+    swr_cache 로더에서 파생한 결과 캐시 (원본 로더 버전이 같으면 다시 계산하지 않음)
+
+    결과는 불변 객체로 공유되며, 원본이 갱신되면 다음 호출에서 다시 계산합니다.
+
+    Args:
+        sources: 인자 없는 swr_cache 로더 (version() 제공)
+
+    Returns:
+        데코레이터 (.clear() 제공)
+    """
+    def decorator(func: Callable) -> Callable:
+        lock = threading.Lock()
+        views: Dict[tuple, tuple] = {}  # {인자 키: (원본 버전들, 결과)}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            for source in sources:
+                source()  # 원본이 비어 있으면 먼저 채움 (버전 확정)
+            versions = tuple(source.version() for source in sources)
+            with lock:
+                cached = views.get(key)
+            if cached is not None and cached[0] == versions:
+                return cached[1]
+            value = freeze(func(*args, **kwargs))
+            # 계산 도중 원본이 바뀌었으면 저장하지 않음 (다음 호출에서 다시 계산)
+            if tuple(source.version() for source in sources) == versions:
+                with lock:
+                    views[key] = (versions, value)
+            return value
+
+        def clear() -> None:
+            with lock:
+                views.clear()
+
+        wrapper.clear = clear
+        return wrapper
+
+    return decorator
+
+
+_date_index_views: Dict[Callable, Callable] = {}
+
+
+def get_date_index(loader: Callable, field: str = "createdAt") -> DateIndex:
+    """
+    swr_cache 로더 결과의 날짜 인덱스 (filter_by_date_range의 index 인자)
+
+    로더 버전이 같으면 epoch ms 컬럼·정렬 순서를 다시 만들지 않습니다.
+
+    Args:
+        loader: 인자 없는 swr_cache 로더
+        field: 기준 필드 (createdAt/updatedAt)
+
+    Returns:
+        DateIndex
+    """
+    with _registry_lock:
+        view = _date_index_views.get(loader)
+        if view is None:
+            view = versioned_view(loader)(lambda index_field: DateIndex(loader(), index_field))
+            _date_index_views[loader] = view
+    return view(field)
+
+
+def clear_all_loaders() -> None:
+    """등록된 모든 swr_cache 로더 캐시 삭제 (전체 캐시 초기화·벤치마크 콜드 측정용)"""
+    with _registry_lock:
+        loaders = list(_registry)
+    for loader in loaders:
+        loader.clear()
+
+
+def get_refresh_status() -> List[Dict[str, Any]]:
+    """
+    캐시된 로더별 갱신 상태 (사이드바 표시용)
+
+    Returns:
+        List[Dict]: {"name", "loaded_at", "refreshing", "error", "stale"} — 조회된 적 없는 로더는 제외
+    """
+    with _registry_lock:
+        loaders = list(_registry)
+    rows = []
+    for loader in loaders:
+        for entry in loader.status():
+            rows.append({"name": loader.display_name, **entry})
+    return rows
+
+
+def is_refreshing() -> bool:
+    """백그라운드 갱신 중인 로더가 있는지"""
+    return any(row["refreshing"] for row in get_refresh_status())
+
+
+def last_refreshed_at() -> Optional[float]:
+    """조회된 로더 중 가장 오래된 갱신 시각 (epoch 초)"""
+    times = [row["loaded_at"] for row in get_refresh_status()]
+    return min(times) if times else None
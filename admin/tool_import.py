@@ -0,0 +1,393 @@
+"""
+AI 도구 일괄 등록 (CSV / Parquet)
+
+스프레드시트에서 내보낸 파일을 한 행씩 읽어 검증한 뒤 BATCH_WRITE_LIMIT건씩 batch로 저장합니다.
+- 열 이름은 ai-tools 문서 필드 이름 (대소문자 무시, 모르는 열은 무시)
+- 필수: name, description / URL은 validate_url / primaryCategory는 CATEGORIES 이름 또는 ID
+- 문서 ID: id 열이 있으면 그 값, 없으면 normalize_tool_id(name)
+- 기존 문서 판별: 시작할 때 ai-tools 문서 ID만 1회 조회 (파일 안 중복 ID는 오류)
+- 기존 도구는 on_existing="update"면 값이 있는 셀만 병합 저장, "skip"이면 건너뜀
+- dry_run이면 검증·판별만 하고 저장하지 않음
+
+파일 전체를 메모리에 올리지 않으며(CSV는 행 단위, Parquet은 row group 배치 단위),
+저장이 끝나면 도구 캐시를 한 번만 무효화합니다.
+"""
+import csv
+import io
+import os
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from firebase_admin import firestore
+
+from .firebase import get_db
+from .config import COLLECTIONS
+from .categories import resolve_category
+from .metrics import instrument, record_reads, record_writes
+from .shared_cache import invalidate_collection
+from .tools import TOOL_STATUSES, TOOL_TEXT_FIELDS, build_tool_document, normalize_tool_id
+from .utils import validate_url
+
+IMPORT_FORMATS = ("csv", "parquet")
+IMPORT_EXISTING_MODES = ("update", "skip")
+
+# Firestore batch 최대 500건 (여유 두고 450)
+BATCH_WRITE_LIMIT = 450
+# Parquet 1회 읽기 행 수
+PARQUET_BATCH_ROWS = 1000
+
+IMPORT_FIELDS = ("id",) + TOOL_TEXT_FIELDS + (
+    "rating", "reviewCount", "verified", "featured", "status",
+    "tagsKr", "tagsEn", "featuresKr", "featuresEn",
+)
+REQUIRED_FIELDS = ("name", "description")
+URL_FIELDS = ("websiteUrl", "affiliateUrl")
+
+_FIELD_BY_LOWER = {field.lower(): field for field in IMPORT_FIELDS}
+
+
+def detect_import_format(filename: str) -> Optional[str]:
+    """
+    파일 이름 확장자로 형식 판별
+
+    Args:
+        filename: 파일 이름
+
+    Returns:
+        str: "csv" / "parquet" 또는 None
+    """
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if ext in ("csv", "txt"):
+        return "csv"
+    if ext in ("parquet", "pq"):
+        return "parquet"
+    return None
+
+
+def get_import_template() -> bytes:
+    """일괄 등록 CSV 양식 (헤더 + 예시 1행, Excel 호환 UTF-8 BOM)"""
+    example = {
+        "name": "Example AI",
+        "company": "Example Inc.",
+        "websiteUrl": "https://example.com",
+        "description": "도구 설명",
+        "primaryCategory": "text-generation",
+        "rating": "4.5",
+        "reviewCount": "0",
+        "verified": "false",
+        "featured": "false",
+        "status": "active",
+        "tagsKr": "글쓰기, 요약",
+        "featuresKr": "기능 1\n기능 2",
+    }
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=IMPORT_FIELDS)
+    writer.writeheader()
+    writer.writerow(example)
+    return buffer.getvalue().encode("utf-8-sig")
+
+
+def _map_columns(columns: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """파일 열 → 문서 필드 ({열: 필드}, 무시한 열)"""
+    mapping, ignored = {}, []
+    for column in columns:
+        field = _FIELD_BY_LOWER.get(str(column or "").strip().lower())
+        if field and field not in mapping.values():
+            mapping[column] = field
+        else:
+            ignored.append(str(column))
+    return mapping, ignored
+
+
+def _open_binary(source: Union[str, BinaryIO]) -> BinaryIO:
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb")
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _read_columns(source: Union[str, BinaryIO], fmt: str) -> List[str]:
+    """헤더(열 이름)만 읽기"""
+    f = _open_binary(source)
+    try:
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            return list(pq.ParquetFile(f).schema_arrow.names)
+        text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+        try:
+            return next(csv.reader(text), [])
+        finally:
+            text.detach()
+    finally:
+        if isinstance(source, (str, os.PathLike)):
+            f.close()
+
+
+def iter_import_rows(source: Union[str, BinaryIO], fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    파일의 행을 순서대로 반환 (전체를 메모리에 올리지 않음)
+
+    Args:
+        source: 파일 경로 또는 바이너리 파일 객체 (Streamlit UploadedFile 등)
+        fmt: "csv" 또는 "parquet"
+
+    Yields:
+        Dict: {열 이름: 값} (CSV 값은 문자열)
+    """
+    f = _open_binary(source)
+    try:
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(f).iter_batches(batch_size=PARQUET_BATCH_ROWS):
+                yield from batch.to_pylist()
+        else:
+            text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+            try:
+                yield from csv.DictReader(text)
+            finally:
+                text.detach()
+    finally:
+        if isinstance(source, (str, os.PathLike)):
+            f.close()
+
+
+def _is_blank(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and value != value:  # NaN (Parquet 빈 셀)
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+def validate_import_row(row: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any], List[str]]:
+    """
+    행 검증 및 문서 데이터 변환
+
+    Args:
+        row: {문서 필드: 값} (열 매핑 후, 빈 셀 제외)
+
+    Returns:
+        (문서 ID 또는 None, 문서 데이터(파일에 있는 필드만), 오류 메시지 리스트)
+    """
+    errors = []
+    for field in REQUIRED_FIELDS:
+        if _is_blank(row.get(field)):
+            errors.append(f"{field} 필수")
+
+    for field in URL_FIELDS:
+        if not _is_blank(row.get(field)) and not validate_url(str(row[field]).strip()):
+            errors.append(f"{field} URL 형식 오류: {row[field]}")
+
+    values = dict(row)
+    if not _is_blank(row.get("primaryCategory")):
+        category = resolve_category(row["primaryCategory"])
+        if category is None:
+            errors.append(f"알 수 없는 카테고리: {row['primaryCategory']}")
+        else:
+            values["primaryCategory"] = category
+
+    try:
+        if float(row.get("rating") or 0) < 0 or float(row.get("rating") or 0) > 5:
+            errors.append("rating은 0~5")
+    except (TypeError, ValueError):
+        errors.append(f"rating 숫자 아님: {row.get('rating')}")
+    try:
+        review_count = float(row.get("reviewCount") or 0)
+        if review_count < 0 or review_count != int(review_count):
+            errors.append("reviewCount는 0 이상 정수")
+    except (TypeError, ValueError):
+        errors.append(f"reviewCount 숫자 아님: {row.get('reviewCount')}")
+
+    if not _is_blank(row.get("status")) and str(row["status"]).strip() not in TOOL_STATUSES:
+        errors.append(f"status는 {'/'.join(TOOL_STATUSES)}: {row['status']}")
+
+    if not _is_blank(row.get("id")):
+        doc_id = str(row["id"]).strip()
+        if "/" in doc_id:
+            errors.append(f"ID에 '/' 사용 불가: {doc_id}")
+            doc_id = None
+    else:
+        doc_id = normalize_tool_id(row.get("name")) or None
+        if doc_id is None and not _is_blank(row.get("name")):
+            errors.append("이름으로 ID를 만들 수 없습니다 (영문·숫자 없음, id 열 지정 필요)")
+
+    if errors:
+        return doc_id, {}, errors
+    values.pop("id", None)
+    return doc_id, build_tool_document(values, for_update=True), []
+
+
+def _fetch_existing_ids(db) -> set:
+    """ai-tools 문서 ID 1회 조회 (필드 없이 ID만)"""
+    ids = {doc.id for doc in db.collection(COLLECTIONS["AI_TOOLS"]).select([]).stream()}
+    record_reads(len(ids))
+    return ids
+
+
+@instrument(COLLECTIONS["AI_TOOLS"])
+def import_tools(
+    source: Union[str, BinaryIO],
+    fmt: str,
+    dry_run: bool = True,
+    on_existing: str = "update",
+    progress: Optional[Callable[[int], None]] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    CSV / Parquet 파일로 도구 일괄 등록·수정
+
+    Args:
+        source: 파일 경로 또는 바이너리 파일 객체
+        fmt: "csv" 또는 "parquet"
+        dry_run: True면 검증·판별 결과만 반환하고 저장하지 않음
+        on_existing: 이미 있는 도구 처리 ("update": 값이 있는 셀만 병합, "skip": 건너뜀)
+        progress: 진행 콜백 (처리한 행 수)
+
+    Returns:
+        (오류 행 없이 끝났는지, 결과)
+        결과: {"dryRun", "total", "created", "updated", "skipped", "errors",
+               "ignoredColumns", "message", "rows": [{"row", "id", "name", "action", "error"}]}
+        action: create / update / skip / error (dry_run이면 저장 예정 동작)
+    """
+    report: Dict[str, Any] = {
+        "dryRun": dry_run, "total": 0, "created": 0, "updated": 0, "skipped": 0, "errors": 0,
+        "ignoredColumns": [], "message": "", "rows": [],
+    }
+    if fmt not in IMPORT_FORMATS:
+        report["message"] = f"지원하지 않는 형식입니다: {fmt}"
+        return False, report
+    if on_existing not in IMPORT_EXISTING_MODES:
+        report["message"] = f"알 수 없는 기존 도구 처리 방식입니다: {on_existing}"
+        return False, report
+
+    try:
+        columns = _read_columns(source, fmt)
+    except ImportError:
+        report["message"] = "Parquet 가져오기에는 pyarrow가 필요합니다 (pip install pyarrow)."
+        return False, report
+    except Exception as e:
+        report["message"] = f"파일 읽기 실패: {e}"
+        return False, report
+    mapping, report["ignoredColumns"] = _map_columns(columns)
+    missing = [field for field in REQUIRED_FIELDS if field not in mapping.values()]
+    if missing:
+        report["message"] = f"필수 열이 없습니다: {', '.join(missing)}"
+        return False, report
+
+    db = get_db()
+    if db is None:
+        report["message"] = "Firestore에 연결할 수 없습니다."
+        return False, report
+
+    try:
+        existing_ids = _fetch_existing_ids(db)
+    except Exception as e:
+        report["message"] = f"기존 도구 ID 조회 실패: {e}"
+        return False, report
+
+    collection = db.collection(COLLECTIONS["AI_TOOLS"])
+    seen_ids = set()
+    read_failed = False
+    pending: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = []
+
+    def _count(action: str) -> None:
+        key = {"create": "created", "update": "updated", "skip": "skipped", "error": "errors"}[action]
+        report[key] += 1
+
+    def _flush() -> None:
+        if not pending:
+            return
+        if not dry_run:
+            try:
+                batch = db.batch()
+                for entry, doc_id, data in pending:
+                    if entry["action"] == "create":
+                        batch.set(collection.document(doc_id), data)
+                    else:
+                        batch.set(collection.document(doc_id), data, merge=True)
+                batch.commit()
+                record_writes(len(pending))
+            except Exception as e:
+                for entry, _, _ in pending:
+                    entry["action"], entry["error"] = "error", f"저장 실패: {e}"
+        for entry, _, _ in pending:
+            _count(entry["action"])
+        pending.clear()
+
+    try:
+        for row_number, raw in enumerate(iter_import_rows(source, fmt), start=2 if fmt == "csv" else 1):
+            row = {
+                mapping[column]: value for column, value in raw.items()
+                if column in mapping and not _is_blank(value)
+            }
+            doc_id, data, errors = validate_import_row(row)
+            entry = {"row": row_number, "id": doc_id, "name": row.get("name"), "action": "", "error": ""}
+            report["rows"].append(entry)
+            report["total"] += 1
+
+            if not errors and doc_id in seen_ids:
+                errors.append(f"파일 안에서 ID 중복: {doc_id}")
+            if doc_id:
+                seen_ids.add(doc_id)
+
+            if errors:
+                entry["action"], entry["error"] = "error", "; ".join(errors)
+                _count("error")
+            elif doc_id in existing_ids:
+                if on_existing == "skip":
+                    entry["action"] = "skip"
+                    _count("skip")
+                else:
+                    entry["action"] = "update"
+                    data["updatedAt"] = firestore.SERVER_TIMESTAMP
+                    pending.append((entry, doc_id, data))
+            else:
+                entry["action"] = "create"
+                data = {**build_tool_document({}), **data}
+                data["createdAt"] = firestore.SERVER_TIMESTAMP
+                data["updatedAt"] = firestore.SERVER_TIMESTAMP
+                pending.append((entry, doc_id, data))
+
+            if len(pending) >= BATCH_WRITE_LIMIT:
+                _flush()
+            if progress:
+                progress(report["total"])
+        _flush()
+    except Exception as e:
+        # 이미 저장한 batch는 유지 (다시 실행하면 기존 도구로 판별)
+        _flush()
+        read_failed = True
+        report["message"] = f"{report['total']}행 처리 후 파일 읽기 실패: {e}"
+    finally:
+        if not dry_run and (report["created"] or report["updated"]):
+            invalidate_collection(COLLECTIONS["AI_TOOLS"])
+
+    if not dry_run and report["updated"]:
+        # 원문이 바뀐 도구의 번역을 stale로 표시 (update_tool과 같은 처리, 도구별 호출 대신 1회 검사)
+        from .translation_freshness import sweep_stale_translations
+        sweep_stale_translations()
+
+    if not report["message"]:
+        verb = "저장 예정" if dry_run else "저장"
+        report["message"] = (
+            f"{report['total']:,}행 중 생성 {report['created']:,} · 수정 {report['updated']:,} · "
+            f"건너뜀 {report['skipped']:,} · 오류 {report['errors']:,} ({verb})"
+        )
+    return not read_failed and report["errors"] == 0 and report["total"] > 0, report
+
+
+def import_report_rows(report: Dict[str, Any], errors_only: bool = False) -> List[Dict[str, Any]]:
+    """
+    결과 표·CSV 다운로드용 행 리스트
+
+    Args:
+        report: import_tools 결과
+        errors_only: True면 오류 행만
+
+    Returns:
+        List[Dict]: [{"행", "ID", "이름", "처리", "오류"}]
+    """
+    return [
+        {"행": r["row"], "ID": r["id"] or "", "이름": r["name"] or "", "처리": r["action"], "오류": r["error"]}
+        for r in report.get("rows", [])
+        if not errors_only or r["action"] == "error"
+    ]
@@ -0,0 +1,360 @@
+"""
+AI 도구 콘텐츠 일괄 번역 (tool_translations)
+
+- 대상 도구 × 대상 언어에서 누락/stale 필드만 골라 번역 공급자에 전달합니다.
+- 공급자는 교체 가능 (stub: 로컬 테스트용, mymemory: MyMemory 무료 API)
+- 요청 배치·동시 실행 수 제한·재시도 후, ensure_tool_translation_fields_shape 형태로
+  status "ai_generated" + sourceHashes를 기록해 batch 커밋(최대 450건)합니다.
+"""
+import json
+import time
+import threading
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import streamlit as st
+from firebase_admin import firestore
+
+from .firebase import get_db
+from .config import COLLECTIONS
+from .translations import (
+    TOOL_TRANSLATION_FIELD_KEYS, ensure_tool_translation_fields_shape,
+    get_all_tool_translations, clear_tool_translation_caches, patch_tool_translation_store,
+)
+from .tools import get_all_tools
+from .translation_freshness import SOURCE_FIELD_MAP, compute_source_hashes
+from .metrics import instrument, record_writes
+
+# 원문 언어 (ai-tools 문서는 한국어 기준)
+SOURCE_LANGUAGE = "ko"
+# 재번역 대상 상태
+RETRANSLATE_STATUSES = ("stale", "error")
+# Firestore batch 1회 최대 쓰기 수
+BATCH_WRITE_LIMIT = 450
+MAX_RETRIES = 3
+RETRY_BACKOFF_SEC = 1.0
+
+
+class TranslationProvider:
+    """
+    번역 공급자 인터페이스
+
+    Attributes:
+        name: 공급자 이름
+        max_batch_size: 요청 1회에 보낼 최대 문자열 수
+        max_concurrency: 동시에 실행할 요청 수
+    """
+    name = "base"
+    max_batch_size = 20
+    max_concurrency = 4
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        문자열 목록 번역 (입력과 같은 순서·길이로 반환, 실패 시 예외)
+
+        Args:
+            texts: 원문 목록
+            source_lang: 원문 언어 코드
+            target_lang: 대상 언어 코드
+
+        Returns:
+            List[str]: 번역 결과
+        """
+        raise NotImplementedError
+
+
+class StubTranslationProvider(TranslationProvider):
+    """로컬 테스트용 공급자: "[lang] 원문" 형태로 즉시 반환 (네트워크 없음)"""
+    name = "stub"
+    max_batch_size = 50
+    max_concurrency = 8
+
+    def __init__(self, fail_every: int = 0):
+        # fail_every > 0 이면 n번째 호출마다 실패 (재시도 동작 확인용)
+        self.fail_every = fail_every
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        with self._lock:
+            self._calls += 1
+            calls = self._calls
+        if self.fail_every and calls % self.fail_every == 0:
+            raise RuntimeError("stub provider: simulated failure")
+        return [f"[{target_lang}] {text}" for text in texts]
+
+
+class MyMemoryTranslationProvider(TranslationProvider):
+    """MyMemory 무료 API (문자열 단위 요청, rate limit 고려해 동시 실행 수를 낮게 유지)"""
+    name = "mymemory"
+    max_batch_size = 10
+    max_concurrency = 2
+    chunk_size = 450
+    rate_delay_sec = 0.35
+
+    # MyMemory 언어 코드 (일부만 다름)
+    LANG_CODES = {"zh": "zh-CN"}
+
+    def _translate_one(self, text: str, source_lang: str, target_lang: str) -> str:
+        if not text or not text.strip():
+            return text
+        src = self.LANG_CODES.get(source_lang, source_lang)
+        tgt = self.LANG_CODES.get(target_lang, target_lang)
+        text = text.strip()
+        if len(text) > self.chunk_size:
+            parts = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+            return "".join(self._translate_one(part, source_lang, target_lang) for part in parts)
+        url = (
+            "https://api.mymemory.translated.net/get?q=" + urllib.parse.quote(text)
+            + f"&langpair={src}|{tgt}"
+        )
+        req = urllib.request.Request(url, headers={"User-Agent": "AicuratorhubAdmin/1.0"})
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            data = json.loads(resp.read().decode())
+        time.sleep(self.rate_delay_sec)
+        translated = (data.get("responseData") or {}).get("translatedText")
+        if data.get("responseStatus") != 200 or not translated:
+            raise RuntimeError(f"MyMemory 응답 오류: {data.get('responseDetails') or data.get('responseStatus')}")
+        return translated.strip()
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        return [self._translate_one(text, source_lang, target_lang) for text in texts]
+
+
+TRANSLATION_PROVIDERS: Dict[str, Callable[[], TranslationProvider]] = {
+    "stub": StubTranslationProvider,
+    "mymemory": MyMemoryTranslationProvider,
+}
+
+
+def get_translation_provider(name: str) -> TranslationProvider:
+    """이름으로 공급자 생성 (없으면 ValueError)"""
+    factory = TRANSLATION_PROVIDERS.get(name)
+    if factory is None:
+        raise ValueError(f"알 수 없는 번역 공급자: {name}")
+    return factory()
+
+
+def _field_needs_translation(field_data: Any, include_stale: bool) -> bool:
+    if not isinstance(field_data, dict):
+        return True
+    text = field_data.get("text")
+    if text is None or (isinstance(text, (str, list)) and len(text) == 0):
+        return True
+    if isinstance(text, str) and not text.strip():
+        return True
+    return include_stale and field_data.get("status") in RETRANSLATE_STATUSES
+
+
+def plan_tool_translations(
+    tool_ids: Optional[Iterable[str]],
+    langs: Iterable[str],
+    include_stale: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    번역 작업 계획: (도구, 언어)별로 누락/stale 필드만 추림
+
+    Args:
+        tool_ids: 대상 도구 ID (None이면 전체 도구)
+        langs: 대상 언어 코드
+        include_stale: stale/error 필드도 재번역할지 여부
+
+    Returns:
+        List[Dict]: [{toolId, lang, existing, sources: {field: text|list}}]
+    """
+    tools = {t["id"]: t for t in get_all_tools() if t.get("id")}
+    targets = list(tools.keys()) if tool_ids is None else [tid for tid in tool_ids if tid in tools]
+    existing_by_key = {
+        (t.get("toolId"), t.get("lang")): t for t in get_all_tool_translations()
+    }
+
+    plan = []
+    for tool_id in targets:
+        tool = tools[tool_id]
+        for lang in langs:
+            if lang == SOURCE_LANGUAGE:
+                continue
+            existing = existing_by_key.get((tool_id, lang))
+            existing_fields = (existing or {}).get("fields") or {}
+            sources = {}
+            for key in TOOL_TRANSLATION_FIELD_KEYS:
+                source = tool.get(SOURCE_FIELD_MAP[key])
+                if not source or (isinstance(source, str) and not source.strip()):
+                    continue
+                if _field_needs_translation(existing_fields.get(key), include_stale):
+                    sources[key] = source
+            if sources:
+                plan.append({"toolId": tool_id, "lang": lang, "existing": existing, "sources": sources})
+    return plan
+
+
+def _build_segments(plan: List[Dict[str, Any]]) -> Dict[str, List[Tuple[int, str, int, str]]]:
+    """계획 → 언어별 문자열 목록 [(plan 인덱스, 필드, 리스트 위치 또는 -1, 원문)]"""
+    segments: Dict[str, List[Tuple[int, str, int, str]]] = {}
+    for plan_idx, item in enumerate(plan):
+        lang_segments = segments.setdefault(item["lang"], [])
+        for key, source in item["sources"].items():
+            if isinstance(source, list):
+                for pos, value in enumerate(source):
+                    if str(value).strip():
+                        lang_segments.append((plan_idx, key, pos, str(value)))
+            else:
+                lang_segments.append((plan_idx, key, -1, str(source)))
+    return segments
+
+
+def _translate_with_retry(
+    provider: TranslationProvider,
+    texts: List[str],
+    lang: str,
+) -> List[str]:
+    last_error: Optional[Exception] = None
+    for attempt in range(MAX_RETRIES):
+        try:
+            results = provider.translate_batch(texts, SOURCE_LANGUAGE, lang)
+            if len(results) != len(texts):
+                raise RuntimeError("번역 결과 수가 요청과 다릅니다.")
+            return results
+        except Exception as e:
+            last_error = e
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(RETRY_BACKOFF_SEC * (2 ** attempt))
+    raise last_error
+
+
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"])
+def run_tool_translation_batch(
+    tool_ids: Optional[Iterable[str]],
+    langs: Iterable[str],
+    provider: TranslationProvider,
+    include_stale: bool = True,
+    dry_run: bool = False,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> Tuple[bool, Dict[str, int]]:
+    """
+    일괄 번역 실행
+
+    Args:
+        tool_ids: 대상 도구 ID (None이면 전체)
+        langs: 대상 언어 코드
+        provider: 번역 공급자
+        include_stale: stale/error 필드 재번역 여부
+        dry_run: True면 계획만 세우고 번역·저장하지 않음
+        progress_callback: (완료 요청 수, 전체 요청 수) 콜백
+        should_cancel: True를 반환하면 남은 요청을 취소하고 완료된 번역만 저장 (백그라운드 작업 취소)
+
+    Returns:
+        (성공 여부, 통계 {docs, fields, strings, requests, failedRequests, written, cancelled}
+         + 실패 시 error — 스크립트 컨텍스트가 없는 작업 워커에서도 오류 내용을 남김)
+    """
+    langs = list(langs)
+    plan = plan_tool_translations(tool_ids, langs, include_stale)
+    segments = _build_segments(plan)
+    stats = {
+        "docs": len(plan),
+        "fields": sum(len(item["sources"]) for item in plan),
+        "strings": sum(len(v) for v in segments.values()),
+        "requests": 0,
+        "failedRequests": 0,
+        "written": 0,
+        "cancelled": False,
+    }
+
+    requests: List[Tuple[str, List[Tuple[int, str, int, str]]]] = []
+    for lang, lang_segments in segments.items():
+        for start in range(0, len(lang_segments), provider.max_batch_size):
+            requests.append((lang, lang_segments[start:start + provider.max_batch_size]))
+    stats["requests"] = len(requests)
+    if dry_run or not requests:
+        return True, stats
+
+    # 번역 결과: {(plan 인덱스, 필드): {리스트 위치: 번역}} / 실패 필드
+    translated: Dict[Tuple[int, str], Dict[int, str]] = {}
+    failed: set = set()
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, provider.max_concurrency)) as pool:
+        futures = {
+            pool.submit(_translate_with_retry, provider, [seg[3] for seg in chunk], lang): chunk
+            for lang, chunk in requests
+        }
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                results = future.result()
+                for (plan_idx, key, pos, _), text in zip(chunk, results):
+                    translated.setdefault((plan_idx, key), {})[pos] = text
+            except Exception as e:
+                stats["failedRequests"] += 1
+                stats.setdefault("error", f"번역 요청 실패: {e}")
+                failed.update((seg[0], seg[1]) for seg in chunk)
+            done += 1
+            if progress_callback:
+                progress_callback(done, len(requests))
+            if should_cancel and should_cancel():
+                for pending in futures:
+                    pending.cancel()
+                stats["cancelled"] = True
+                break
+
+    db = get_db()
+    if db is None:
+        return False, stats
+
+    tools = {t["id"]: t for t in get_all_tools() if t.get("id")}
+    writes = []
+    for plan_idx, item in enumerate(plan):
+        new_fields = {}
+        for key, source in item["sources"].items():
+            parts = translated.get((plan_idx, key))
+            if (plan_idx, key) in failed or parts is None:
+                continue
+            if isinstance(source, list):
+                text = [parts.get(pos, "") for pos in range(len(source)) if str(source[pos]).strip()]
+            else:
+                text = parts.get(-1, "")
+            new_fields[key] = {"text": text, "status": "ai_generated"}
+        if not new_fields:
+            continue
+        existing = item["existing"] or {}
+        merged_fields = ensure_tool_translation_fields_shape({**(existing.get("fields") or {}), **new_fields})
+        current_hashes = compute_source_hashes(tools.get(item["toolId"], {}))
+        source_hashes = dict(existing.get("sourceHashes") or {})
+        source_hashes.update({k: current_hashes[k] for k in new_fields if k in current_hashes})
+        payload = {
+            "toolId": item["toolId"],
+            "lang": item["lang"],
+            "fields": merged_fields,
+            "translatedFrom": SOURCE_LANGUAGE,
+            "sourceHashes": source_hashes,
+            "updatedAt": firestore.SERVER_TIMESTAMP,
+            "updatedBy": f"batch:{provider.name}",
+        }
+        if not existing:
+            payload["docStatus"] = "ai_generated"
+            payload["createdAt"] = firestore.SERVER_TIMESTAMP
+            payload["createdBy"] = f"batch:{provider.name}"
+        writes.append((f"{item['toolId']}_{item['lang']}", payload))
+
+    collection = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"])
+    try:
+        for start in range(0, len(writes), BATCH_WRITE_LIMIT):
+            batch = db.batch()
+            for doc_id, payload in writes[start:start + BATCH_WRITE_LIMIT]:
+                batch.set(collection.document(doc_id), payload, merge=True)
+            batch.commit()
+            stats["written"] += len(writes[start:start + BATCH_WRITE_LIMIT])
+            record_writes(len(writes[start:start + BATCH_WRITE_LIMIT]))
+    except Exception as e:
+        stats["error"] = f"일괄 번역 저장 실패: {e}"
+        st.error(stats["error"])
+        clear_tool_translation_caches()
+        return False, stats
+
+    from .translation_coverage import apply_tool_translation_change
+    for doc_id, payload in writes:
+        patch_tool_translation_store(doc_id, payload)
+        apply_tool_translation_change(payload["toolId"], payload["lang"], payload["fields"], replace=True)
+    return stats["failedRequests"] == 0 and not stats["cancelled"], stats
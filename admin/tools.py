@@ -3,40 +3,42 @@ AI 도구 관련 CRUD 함수
 """
 import streamlit as st
 from firebase_admin import firestore
-from typing import List, Dict, Optional, Any
-from .firebase import get_db
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Any, Tuple
+from .firebase import get_db, get_documents_by_ids
 from .config import COLLECTIONS
-from .utils import convert_firestore_data, normalize_id
+from .utils import convert_firestore_data, normalize_id, with_timestamp_ms
+from .metrics import instrument, record_writes
+from .swr_cache import swr_cache
+from .shared_cache import invalidate_collection, register_local_cache, shared_load
+from .snapshot_cache import load_collection, remove_snapshot_docs, upsert_snapshot_docs
+from .records import ToolRecord
 
+# Firestore batch 최대 500건 (여유 두고 450)
+BATCH_WRITE_LIMIT = 450
 
-@st.cache_data(ttl=300)  # 5분 캐시
+
+@instrument(COLLECTIONS["AI_TOOLS"])
+@swr_cache(ttl=300, error_message="도구 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_tools() -> List[Dict[str, Any]]:
     """
-    모든 도구 조회 (캐시됨)
+    모든 도구 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
-        List[Dict]: 도구 리스트
+        List[Dict]: 도구 리스트 (읽기 전용 ToolRecord)
     """
     db = get_db()
     if db is None:
         return []
     
-    try:
-        tools_ref = db.collection(COLLECTIONS["AI_TOOLS"])
-        docs = tools_ref.stream()
-        tools = []
-        for doc in docs:
-            tool_data = doc.to_dict()
-            tool_data["id"] = doc.id
-            # Firestore 데이터 변환
-            tool_data = convert_firestore_data(tool_data)
-            tools.append(tool_data)
-        return tools
-    except Exception as e:
-        st.error(f"도구 조회 실패: {e}")
-        return []
+    # 인스턴스 공유 캐시 → 디스크 스냅샷 + updatedAt 이후 변경분 (재시작 직후 전체 조회 방지)
+    return ToolRecord.from_docs(shared_load(
+        COLLECTIONS["AI_TOOLS"], "all",
+        lambda: load_collection(COLLECTIONS["AI_TOOLS"], on_change=get_all_tools.clear),
+    ))
 
 
+@instrument(COLLECTIONS["AI_TOOLS"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_tool_by_id(tool_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -67,6 +69,120 @@ def get_tool_by_id(tool_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+@instrument(COLLECTIONS["AI_TOOLS"])
+@st.cache_data(ttl=60)  # 1분 캐시
+def get_tools_by_ids(tool_ids: Tuple[str, ...]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    여러 도구를 한 번에 조회 (레시피·즐겨찾기 등 toolIds 조인용)
+    
+    Args:
+        tool_ids: 도구 ID 튜플 (캐시 키로 쓰이므로 tuple)
+        
+    Returns:
+        Dict[str, Optional[Dict]]: {도구 ID: 도구 데이터 또는 None}
+    """
+    return get_documents_by_ids(COLLECTIONS["AI_TOOLS"], tool_ids)
+
+
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["AI_TOOLS"], get_all_tools.clear, get_tool_by_id.clear, get_tools_by_ids.clear)
+
+
+def format_tool_names(
+    tool_ids: List[str],
+    tools: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+) -> List[str]:
+    """
+    toolIds → "이름 (ID)" 목록 (get_all 1회 조회, 없는 도구는 ID만 표시)
+    
+    Args:
+        tool_ids: 도구 ID 리스트
+        tools: 미리 조회한 get_tools_by_ids 결과 (여러 목록을 표시할 때 한 번에 조회해 전달)
+        
+    Returns:
+        List[str]: 표시용 문자열 리스트
+    """
+    if not tool_ids:
+        return []
+    if isinstance(tool_ids, str):
+        tool_ids = [tool_ids]
+    if tools is None:
+        tools = get_tools_by_ids(tuple(str(t) for t in tool_ids if t))
+    labels = []
+    for tool_id in tool_ids:
+        tool = tools.get(str(tool_id))
+        labels.append(f"{tool.get('name', tool_id)} ({tool_id})" if tool else f"{tool_id} (삭제됨)")
+    return labels
+
+
+# 등록·수정 폼과 일괄 등록에서 입력받는 텍스트 필드 (빈 값은 None으로 저장)
+TOOL_TEXT_FIELDS = (
+    "name", "company", "websiteUrl", "affiliateUrl", "description",
+    "primaryCategory", "primaryCategoryKr", "primaryCategoryEn", "subCategoryKr", "subCategoryEn",
+)
+TOOL_STATUSES = ("active", "inactive")
+_TRUE_VALUES = ("true", "1", "yes", "y", "o", "예")
+
+
+def _split_values(value: Any, separator: str) -> List[str]:
+    if value is None:
+        return []
+    items = value if isinstance(value, (list, tuple)) else str(value).split(separator)
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_VALUES
+    return bool(value)
+
+
+def build_tool_document(values: Dict[str, Any], for_update: bool = False) -> Dict[str, Any]:
+    """
+    폼·파일 입력값을 ai-tools 문서 필드로 변환
+    (빈 문자열 → None, 태그는 쉼표·기능은 줄바꿈으로 구분한 문자열 또는 리스트)
+    
+    Args:
+        values: 입력값 (문서 필드 이름 기준)
+        for_update: True면 values에 있는 필드만 포함, False면 생성용 기본값(tags, categories 등) 포함
+        
+    Returns:
+        Dict: 문서 데이터
+        
+    Raises:
+        ValueError: rating / reviewCount가 숫자가 아닌 경우
+    """
+    def _has(key: str) -> bool:
+        return not for_update or key in values
+    
+    data: Dict[str, Any] = {}
+    for key in TOOL_TEXT_FIELDS:
+        if _has(key):
+            text = values.get(key)
+            text = str(text).strip() if text is not None else ""
+            data[key] = text or None
+    if _has("rating"):
+        data["rating"] = float(values.get("rating") or 0)
+    if _has("reviewCount"):
+        data["reviewCount"] = int(float(values.get("reviewCount") or 0))
+    for key in ("verified", "featured"):
+        if _has(key):
+            data[key] = _to_bool(values.get(key, False))
+    if _has("status"):
+        data["status"] = str(values.get("status") or "active").strip()
+    for key in ("tagsKr", "tagsEn"):
+        if _has(key):
+            data[key] = _split_values(values.get(key), ",")
+    for key in ("featuresKr", "featuresEn"):
+        if _has(key):
+            data[key] = _split_values(values.get(key), "\n")
+    if not for_update:
+        data.setdefault("tags", [])
+        data.setdefault("categories", [])
+    return data
+
+
+@instrument(COLLECTIONS["AI_TOOLS"])
 def update_tool(tool_id: str, data: Dict[str, Any]) -> bool:
     """
     도구 정보 업데이트
@@ -87,14 +203,91 @@ def update_tool(tool_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.update(data)
         # 캐시 무효화
-        get_all_tools.clear()
-        get_tool_by_id.clear()
+        invalidate_collection(COLLECTIONS["AI_TOOLS"])
+        # 원문 필드가 바뀌었으면 해당 도구 번역의 변경 필드를 stale로 표시
+        from .translation_freshness import mark_stale_translations_for_tool
+        mark_stale_translations_for_tool(tool_id, data)
         return True
     except Exception as e:
         st.error(f"도구 업데이트 실패: {e}")
         return False
 
 
+def _patch_tool_caches(changes: Dict[str, Dict[str, Any]], updated_at: str) -> None:
+    """일괄 수정 직후 도구 목록 캐시·스냅샷을 한 번에 갱신 (전체 다시 조회 없음)"""
+    patched = []
+
+    def _apply(tools):
+        result = []
+        for tool in tools:
+            fields = changes.get(tool.get("id"))
+            if fields is None:
+                result.append(tool)
+                continue
+            record = with_timestamp_ms({**dict(tool), **fields, "updatedAt": updated_at})
+            patched.append(record)
+            result.append(ToolRecord(record))
+        return result
+
+    get_all_tools.patch(_apply)
+    get_tool_by_id.clear()
+    get_tools_by_ids.clear()
+    upsert_snapshot_docs(COLLECTIONS["AI_TOOLS"], patched)
+    # 로컬 목록은 위에서 갱신했으므로 다른 인스턴스만 무효화
+    invalidate_collection(COLLECTIONS["AI_TOOLS"], clear_local=False)
+
+
+@instrument(COLLECTIONS["AI_TOOLS"])
+def bulk_update_tools(changes: Dict[str, Dict[str, Any]]) -> Tuple[bool, Dict[str, int]]:
+    """
+    여러 도구를 batch로 한 번에 수정 (도구 목록 일괄 편집)
+    
+    Args:
+        changes: {도구 ID: 수정할 필드}
+        
+    Returns:
+        (성공 여부, {"updated": 저장한 도구 수, "failed": 저장하지 못한 도구 수})
+    """
+    changes = {tool_id: dict(fields) for tool_id, fields in changes.items() if tool_id and fields}
+    stats = {"updated": 0, "failed": 0}
+    if not changes:
+        return True, stats
+    db = get_db()
+    if db is None:
+        stats["failed"] = len(changes)
+        return False, stats
+    
+    collection = db.collection(COLLECTIONS["AI_TOOLS"])
+    items = list(changes.items())
+    saved: Dict[str, Dict[str, Any]] = {}
+    error = None
+    try:
+        for start in range(0, len(items), BATCH_WRITE_LIMIT):
+            chunk = items[start:start + BATCH_WRITE_LIMIT]
+            batch = db.batch()
+            for tool_id, fields in chunk:
+                batch.update(collection.document(tool_id), {**fields, "updatedAt": firestore.SERVER_TIMESTAMP})
+            batch.commit()
+            saved.update(chunk)
+            record_writes(len(chunk))
+    except Exception as e:
+        error = e
+    
+    stats["updated"] = len(saved)
+    stats["failed"] = len(changes) - len(saved)
+    if saved:
+        _patch_tool_caches(saved, datetime.now(timezone.utc).isoformat())
+        # 원문 필드가 바뀐 도구는 번역의 변경 필드를 stale로 표시 (update_tool과 동일)
+        from .translation_freshness import mark_stale_translations_for_tool
+        for tool_id, fields in saved.items():
+            mark_stale_translations_for_tool(tool_id, fields)
+    if error is not None:
+        st.error(f"도구 일괄 수정 실패 ({stats['failed']}개 미저장): {error}")
+        return False, stats
+    return True, stats
+
+
+@instrument(COLLECTIONS["AI_TOOLS"])
 def create_tool(tool_id: str, data: Dict[str, Any]) -> bool:
     """
     새 도구 생성
@@ -116,14 +309,14 @@ def create_tool(tool_id: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.set(data)
         # 캐시 무효화
-        get_all_tools.clear()
-        get_tool_by_id.clear()
+        invalidate_collection(COLLECTIONS["AI_TOOLS"])
         return True
     except Exception as e:
         st.error(f"도구 생성 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["AI_TOOLS"])
 def delete_tool(tool_id: str) -> bool:
     """
     도구 삭제
@@ -141,9 +334,9 @@ def delete_tool(tool_id: str) -> bool:
     try:
         doc_ref = db.collection(COLLECTIONS["AI_TOOLS"]).document(tool_id)
         doc_ref.delete()
+        remove_snapshot_docs(COLLECTIONS["AI_TOOLS"], [tool_id])
         # 캐시 무효화
-        get_all_tools.clear()
-        get_tool_by_id.clear()
+        invalidate_collection(COLLECTIONS["AI_TOOLS"])
         return True
     except Exception as e:
         st.error(f"도구 삭제 실패: {e}")
@@ -0,0 +1,259 @@
+"""
+AI 도구 번역 커버리지 매트릭스 (tools × 언어 × 필드)
+
+get_all_tools / get_all_tool_translations 결과로 필드별 상태 코드를 담은
+NumPy uint8 배열을 만들고, 번역 저장 시 해당 칸만 갱신합니다.
+도구 목록(get_all_tools 버전)이 바뀌거나 컬렉션이 무효화되면 다음 조회 때 다시 만듭니다.
+누락/stale/검토 필요 조회와 히트맵 렌더링은 Firestore 접근 없이 배열 연산으로 처리합니다.
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import streamlit as st
+
+from .config import COLLECTIONS, SUPPORTED_LANGUAGES, REQUIRED_LANGUAGES, ORIGIN_LANGUAGES
+from .shared_cache import register_local_cache
+from .translations import TOOL_TRANSLATION_FIELD_KEYS, get_all_tool_translations
+from .tools import get_all_tools
+
+# 필드 상태 코드 (uint8)
+STATUS_MISSING = 0
+STATUS_AI_GENERATED = 1
+STATUS_EDITED = 2
+STATUS_REVIEWED = 3
+STATUS_STALE = 4
+STATUS_ERROR = 5
+
+STATUS_CODES = {
+    "ai_generated": STATUS_AI_GENERATED,
+    "edited": STATUS_EDITED,
+    "reviewed": STATUS_REVIEWED,
+    "stale": STATUS_STALE,
+    "error": STATUS_ERROR,
+}
+STATUS_LABELS = {
+    STATUS_MISSING: "missing",
+    STATUS_AI_GENERATED: "ai_generated",
+    STATUS_EDITED: "edited",
+    STATUS_REVIEWED: "reviewed",
+    STATUS_STALE: "stale",
+    STATUS_ERROR: "error",
+}
+# 번역 완료로 보는 상태
+DONE_CODES = (STATUS_AI_GENERATED, STATUS_EDITED, STATUS_REVIEWED)
+# 사람 검토가 필요한 상태
+REVIEW_CODES = (STATUS_AI_GENERATED, STATUS_STALE, STATUS_ERROR)
+
+
+def _field_status_code(field_data: Any) -> int:
+    """fields.{key} 값 → 상태 코드 (텍스트가 비어 있으면 missing)"""
+    if isinstance(field_data, dict):
+        text = field_data.get("text")
+        status = field_data.get("status", "ai_generated")
+    else:
+        text, status = field_data, "ai_generated"
+    if text is None or (isinstance(text, (str, list)) and len(text) == 0):
+        return STATUS_MISSING
+    if isinstance(text, str) and not text.strip():
+        return STATUS_MISSING
+    return STATUS_CODES.get(status, STATUS_AI_GENERATED)
+
+
+class TranslationCoverage:
+    """
+    tools × 언어 × 필드 상태 매트릭스
+
+    Attributes:
+        tool_ids: 행 순서의 도구 ID 리스트
+        langs: 열 순서의 언어 코드 리스트
+        fields: 필드 키 리스트
+        matrix: shape (len(tool_ids), len(langs), len(fields)) uint8 배열
+    """
+
+    def __init__(
+        self,
+        tool_ids: Iterable[str],
+        langs: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ):
+        self.tool_ids: List[str] = list(dict.fromkeys(tool_ids))
+        self.langs: List[str] = list(langs or SUPPORTED_LANGUAGES.keys())
+        self.fields: List[str] = list(fields or TOOL_TRANSLATION_FIELD_KEYS)
+        self._tool_index = {tool_id: i for i, tool_id in enumerate(self.tool_ids)}
+        self._lang_index = {lang: i for i, lang in enumerate(self.langs)}
+        self._field_index = {key: i for i, key in enumerate(self.fields)}
+        self.matrix = np.zeros((len(self.tool_ids), len(self.langs), len(self.fields)), dtype=np.uint8)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_data(cls, tools: List[Dict[str, Any]], translations: List[Dict[str, Any]]) -> "TranslationCoverage":
+        """도구 목록과 tool_translations 문서로 매트릭스 생성 (목록에 없는 도구의 번역은 제외)"""
+        coverage = cls(t.get("id") for t in tools if t.get("id"))
+        for trans in translations:
+            tool_id, lang = trans.get("toolId"), trans.get("lang")
+            # 삭제된 도구의 번역은 행을 만들지 않음 (행마다 배열을 다시 잇지 않도록)
+            if tool_id in coverage._tool_index and lang:
+                coverage.apply(tool_id, lang, trans.get("fields") or {}, replace=True)
+        return coverage
+
+    def _ensure_tool_row(self, tool_id: str) -> int:
+        row = self._tool_index.get(tool_id)
+        if row is None:
+            row = len(self.tool_ids)
+            self.tool_ids.append(tool_id)
+            self._tool_index[tool_id] = row
+            empty = np.zeros((1, len(self.langs), len(self.fields)), dtype=np.uint8)
+            self.matrix = np.concatenate([self.matrix, empty], axis=0)
+        return row
+
+    def apply(self, tool_id: str, lang: str, fields: Dict[str, Any], replace: bool = False) -> None:
+        """
+        (도구, 언어) 한 칸 갱신
+
+        Args:
+            tool_id: 도구 ID
+            lang: 언어 코드
+            fields: tool_translations fields (일부 키만 있어도 됨)
+            replace: True면 전달되지 않은 필드를 missing으로 초기화
+        """
+        col = self._lang_index.get(lang)
+        if col is None:
+            return
+        with self._lock:
+            row = self._ensure_tool_row(tool_id)
+            if replace:
+                self.matrix[row, col, :] = STATUS_MISSING
+            for key, field_data in (fields or {}).items():
+                idx = self._field_index.get(key)
+                if idx is not None:
+                    self.matrix[row, col, idx] = _field_status_code(field_data)
+
+    def set_status(self, tool_id: str, lang: str, field_keys: Iterable[str], status: str) -> None:
+        """텍스트는 그대로 두고 필드 상태만 변경 (예: stale 표시)"""
+        col = self._lang_index.get(lang)
+        row = self._tool_index.get(tool_id)
+        if col is None or row is None:
+            return
+        code = STATUS_CODES.get(status, STATUS_AI_GENERATED)
+        with self._lock:
+            for key in field_keys:
+                idx = self._field_index.get(key)
+                if idx is not None and self.matrix[row, col, idx] != STATUS_MISSING:
+                    self.matrix[row, col, idx] = code
+
+    def _lang_cols(self, langs: Optional[Iterable[str]]) -> List[int]:
+        return [self._lang_index[l] for l in (langs or self.langs) if l in self._lang_index]
+
+    def _cells(self, mask: np.ndarray, cols: List[int]) -> List[Dict[str, Any]]:
+        """(tools, cols, fields) 불리언 마스크 → [{toolId, lang, fields}]"""
+        result = []
+        cell_mask = mask.any(axis=2)
+        for row, col_pos in zip(*np.nonzero(cell_mask)):
+            result.append({
+                "toolId": self.tool_ids[row],
+                "lang": self.langs[cols[col_pos]],
+                "fields": [self.fields[i] for i in np.nonzero(mask[row, col_pos])[0]],
+            })
+        return result
+
+    def query(self, codes: Iterable[int], langs: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """지정한 상태 코드를 가진 (도구, 언어, 필드) 조회"""
+        cols = self._lang_cols(langs)
+        sub = self.matrix[:, cols, :]
+        return self._cells(np.isin(sub, list(codes)), cols)
+
+    def missing(self, langs: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """누락 필드 (기본: REQUIRED_LANGUAGES)"""
+        return self.query([STATUS_MISSING], langs or REQUIRED_LANGUAGES)
+
+    def stale(self, langs: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """원문 변경으로 재번역이 필요한 필드 (stale/error)"""
+        return self.query([STATUS_STALE, STATUS_ERROR], langs)
+
+    def needs_review(self, langs: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """사람 검토가 필요한 필드 (ai_generated/stale/error)"""
+        return self.query(REVIEW_CODES, langs)
+
+    def completion_matrix(self, langs: Optional[Iterable[str]] = None) -> np.ndarray:
+        """도구 × 언어 완료율 (0.0~1.0, 완료 상태 필드 비율)"""
+        cols = self._lang_cols(langs)
+        sub = self.matrix[:, cols, :]
+        if not self.fields:
+            return np.zeros(sub.shape[:2], dtype=np.float32)
+        return np.isin(sub, DONE_CODES).mean(axis=2, dtype=np.float32)
+
+    def status_counts(self, langs: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """언어별 상태 코드 개수 {lang: {status: count}}"""
+        cols = self._lang_cols(langs)
+        counts = {}
+        for col in cols:
+            values = np.bincount(self.matrix[:, col, :].ravel(), minlength=len(STATUS_LABELS))
+            counts[self.langs[col]] = {STATUS_LABELS[code]: int(values[code]) for code in STATUS_LABELS}
+        return counts
+
+
+@st.cache_resource
+def _coverage_holder() -> Dict[str, Any]:
+    """프로세스 공용 커버리지 엔진 보관 (세션 간 공유)"""
+    return {"engine": None, "tools_version": None, "lock": threading.Lock()}
+
+
+def get_translation_coverage(rebuild: bool = False) -> TranslationCoverage:
+    """
+    커버리지 엔진 조회 (도구 목록이 바뀔 때만 전체 데이터로 생성, 그 사이에는 저장 시 증분 갱신)
+
+    Args:
+        rebuild: True면 캐시된 도구/번역 데이터로 다시 생성
+
+    Returns:
+        TranslationCoverage
+    """
+    holder = _coverage_holder()
+    tools = get_all_tools()
+    # 도구 생성·가져오기·승인·삭제는 get_all_tools 버전을 올림 → 도구 ID가 바뀌었을 때만 행 구성을 다시 만듦
+    # (백그라운드 갱신처럼 내용이 같은 새 결과는 버전만 기록)
+    tools_version = get_all_tools.version()
+    with holder["lock"]:
+        engine = holder["engine"]
+        if engine is not None and not rebuild and holder["tools_version"] != tools_version:
+            tool_ids = {t.get("id") for t in tools if t.get("id")}
+            if tool_ids != set(engine.tool_ids):
+                engine = None
+            holder["tools_version"] = tools_version
+        if engine is None or rebuild:
+            engine = TranslationCoverage.from_data(tools, get_all_tool_translations())
+            holder["engine"] = engine
+            holder["tools_version"] = tools_version
+        return engine
+
+
+def clear_translation_coverage() -> None:
+    """커버리지 엔진 폐기 (다음 조회 시 다시 생성)"""
+    holder = _coverage_holder()
+    with holder["lock"]:
+        holder["engine"] = None
+        holder["tools_version"] = None
+
+
+register_local_cache(COLLECTIONS["AI_TOOLS"], clear_translation_coverage)
+register_local_cache(COLLECTIONS["TOOL_TRANSLATIONS"], clear_translation_coverage)
+
+
+def apply_tool_translation_change(tool_id: str, lang: str, fields: Dict[str, Any], replace: bool = False) -> None:
+    """번역 저장 후 호출 — 엔진이 이미 만들어져 있으면 해당 칸만 갱신"""
+    engine = _coverage_holder()["engine"]
+    if engine is not None:
+        engine.apply(tool_id, lang, fields, replace=replace)
+
+
+def apply_tool_translation_status(tool_id: str, lang: str, field_keys: Iterable[str], status: str) -> None:
+    """필드 상태만 바뀐 경우 (stale 표시 등) 엔진 갱신"""
+    engine = _coverage_holder()["engine"]
+    if engine is not None:
+        engine.set_status(tool_id, lang, field_keys, status)
+
+
+def get_default_coverage_langs() -> List[str]:
+    """히트맵 기본 열: 오리진 언어 제외"""
+    return [lang for lang in SUPPORTED_LANGUAGES if lang not in ORIGIN_LANGUAGES]
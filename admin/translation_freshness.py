@@ -0,0 +1,221 @@
+"""
+AI 도구 번역 원문 변경 감지 (stale 표시)
+
+- 도구(ai-tools) 원문 필드별 콘텐츠 해시를 계산해 tool_translations 문서의
+  sourceHashes와 비교하고, 원문이 바뀐 필드만 fields.{key}.status = "stale"로 표시합니다.
+- sourceHashes가 없는 문서는 현재 원문 해시를 기준선으로 기록합니다 (stale 표시 없음).
+- update_tool 저장 시 해당 도구만 증분 검사, 전체 카탈로그 일괄 검사도 지원합니다.
+"""
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import streamlit as st
+from firebase_admin import firestore
+
+from .firebase import get_db
+from .config import COLLECTIONS
+from .translations import (
+    TOOL_TRANSLATION_FIELD_KEYS, TOOL_TRANSLATION_FIELD_OPTIONAL_KEYS,
+    get_all_tool_translations, get_tool_translations_by_tool_id,
+    clear_tool_translation_caches, patch_tool_translation_store,
+)
+from .tools import get_all_tools, get_tool_by_id
+from .metrics import instrument, record_writes
+
+# 번역 필드 → 원문(ai-tools) 필드
+SOURCE_FIELD_MAP = {key: key for key in TOOL_TRANSLATION_FIELD_KEYS + TOOL_TRANSLATION_FIELD_OPTIONAL_KEYS}
+
+# Firestore batch 1회 최대 쓰기 수 (한도 500에 여유)
+BATCH_WRITE_LIMIT = 450
+
+# 이미 재번역 대상이거나 내용이 없는 상태는 다시 표시하지 않음
+_SKIP_STATUSES = ("stale", "error")
+
+
+def _normalize_source_text(value: Any) -> str:
+    """해시 계산용 원문 정규화 (리스트는 줄 단위, 앞뒤 공백 제거)"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "\n".join(str(item).strip() for item in value if str(item).strip())
+    return str(value).strip()
+
+
+def compute_source_hashes(tool: Dict[str, Any]) -> Dict[str, str]:
+    """
+    도구 원문 필드별 콘텐츠 해시
+
+    Args:
+        tool: ai-tools 도구 데이터 (일부 필드만 있어도 됨)
+
+    Returns:
+        Dict[str, str]: {번역 필드 키: sha1 앞 16자} (원문이 없는 필드는 제외)
+    """
+    hashes = {}
+    for field_key, source_key in SOURCE_FIELD_MAP.items():
+        if source_key not in tool:
+            continue
+        text = _normalize_source_text(tool.get(source_key))
+        if text:
+            hashes[field_key] = hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+    return hashes
+
+
+def refresh_source_hashes(
+    recorded: Optional[Dict[str, str]],
+    current: Dict[str, str],
+    fields: Dict[str, Any],
+) -> Dict[str, str]:
+    """
+    번역 저장 시 sourceHashes 갱신: stale/error가 아닌 필드는 현재 원문 해시로 맞춤
+
+    Args:
+        recorded: 문서에 기록된 sourceHashes
+        current: compute_source_hashes(현재 도구)
+        fields: 저장할 fields
+
+    Returns:
+        Dict[str, str]: 새 sourceHashes
+    """
+    hashes = dict(recorded or {})
+    for key, field_data in (fields or {}).items():
+        status = field_data.get("status") if isinstance(field_data, dict) else None
+        if status in _SKIP_STATUSES:
+            continue
+        if key in current:
+            hashes[key] = current[key]
+    return hashes
+
+
+def detect_stale_fields(
+    translation: Dict[str, Any],
+    current_hashes: Dict[str, str],
+) -> Tuple[List[str], Dict[str, str]]:
+    """
+    번역 문서 1건의 stale 필드 계산
+
+    Args:
+        translation: tool_translations 문서
+        current_hashes: compute_source_hashes(원문 도구)
+
+    Returns:
+        (stale로 바꿀 필드 목록, 기준선으로 기록할 필드 해시 — sourceHashes에 없는 필드)
+    """
+    recorded = translation.get("sourceHashes")
+    if not isinstance(recorded, dict) or not recorded:
+        return [], dict(current_hashes)
+
+    fields = translation.get("fields") or {}
+    stale = []
+    baseline = {}
+    for key, new_hash in current_hashes.items():
+        old_hash = recorded.get(key)
+        if not old_hash:
+            # 해시가 없는 필드는 이후 변경을 감지할 수 있도록 현재 원문을 기준선으로 기록
+            baseline[key] = new_hash
+            continue
+        if old_hash == new_hash:
+            continue
+        field_data = fields.get(key)
+        if not isinstance(field_data, dict):
+            continue
+        text = field_data.get("text")
+        if not text or field_data.get("status") in _SKIP_STATUSES:
+            continue
+        stale.append(key)
+    return stale, baseline
+
+
+def _apply_staleness(
+    tools_by_id: Dict[str, Dict[str, Any]],
+    translations: List[Dict[str, Any]],
+) -> Tuple[bool, Dict[str, int]]:
+    """stale 표시·기준선 기록을 batch로 저장"""
+    stats = {"checked": 0, "staleDocs": 0, "staleFields": 0, "baselined": 0}
+    db = get_db()
+    if db is None:
+        return False, stats
+
+    updates: List[Tuple[Dict[str, Any], Dict[str, Any], List[str]]] = []
+    for trans in translations:
+        tool = tools_by_id.get(trans.get("toolId"))
+        if not tool or not trans.get("id"):
+            continue
+        stats["checked"] += 1
+        current = compute_source_hashes(tool)
+        stale_fields, baseline = detect_stale_fields(trans, current)
+        if not stale_fields and not baseline:
+            continue
+        payload = {}
+        if stale_fields:
+            payload.update({f"fields.{key}.status": "stale" for key in stale_fields})
+            payload["staleDetectedAt"] = firestore.SERVER_TIMESTAMP
+            stats["staleDocs"] += 1
+            stats["staleFields"] += len(stale_fields)
+        if baseline:
+            recorded = trans.get("sourceHashes")
+            if isinstance(recorded, dict) and recorded:
+                # 일부 필드만 빠진 경우 해당 필드 해시만 추가
+                payload.update({f"sourceHashes.{key}": value for key, value in baseline.items()})
+            else:
+                payload["sourceHashes"] = baseline
+            stats["baselined"] += 1
+        updates.append((trans, payload, stale_fields))
+
+    if not updates:
+        record_writes(0)
+        return True, stats
+
+    collection = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"])
+    try:
+        for start in range(0, len(updates), BATCH_WRITE_LIMIT):
+            batch = db.batch()
+            for trans, payload, _ in updates[start:start + BATCH_WRITE_LIMIT]:
+                batch.update(collection.document(trans["id"]), payload)
+            batch.commit()
+            record_writes(len(updates[start:start + BATCH_WRITE_LIMIT]))
+    except Exception as e:
+        stats["error"] = f"번역 stale 표시 실패: {e}"
+        st.error(stats["error"])
+        clear_tool_translation_caches()
+        return False, stats
+
+    from .translation_coverage import apply_tool_translation_status
+    for trans, payload, stale_fields in updates:
+        patch_tool_translation_store(trans["id"], payload)
+        if stale_fields:
+            apply_tool_translation_status(trans["toolId"], trans.get("lang"), stale_fields, "stale")
+    return True, stats
+
+
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"])
+def mark_stale_translations_for_tool(tool_id: str, changed: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """
+    도구 1건 수정 후 증분 검사 (update_tool에서 호출)
+
+    Args:
+        tool_id: 도구 ID
+        changed: update_tool에 전달된 변경 필드 (원문 필드가 없으면 검사 생략)
+
+    Returns:
+        Dict[str, int]: 처리 통계
+    """
+    if changed is not None and not any(key in changed for key in SOURCE_FIELD_MAP.values()):
+        return {"checked": 0, "staleDocs": 0, "staleFields": 0, "baselined": 0}
+    tool = get_tool_by_id(tool_id)
+    if not tool:
+        return {"checked": 0, "staleDocs": 0, "staleFields": 0, "baselined": 0}
+    _, stats = _apply_staleness({tool_id: tool}, get_tool_translations_by_tool_id(tool_id))
+    return stats
+
+
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"])
+def sweep_stale_translations() -> Tuple[bool, Dict[str, int]]:
+    """
+    전체 카탈로그 일괄 검사 (원문 변경 누락분 보정·기준선 기록)
+
+    Returns:
+        (성공 여부, 처리 통계)
+    """
+    tools_by_id = {t["id"]: t for t in get_all_tools() if t.get("id")}
+    return _apply_staleness(tools_by_id, get_all_tool_translations())
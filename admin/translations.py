@@ -9,11 +9,20 @@ tool_translations 저장 형식 (A1: 프론트 병합 규칙과 일치):
 - 프론트 mergeToolWithTranslation이 읽는 키와 동일하게 저장해야 함.
 """
 import streamlit as st
+import copy
+import threading
+import time
+from datetime import datetime
 from firebase_admin import firestore
 from typing import List, Dict, Optional, Any
 from .firebase import get_db
 from .config import COLLECTIONS, SUPPORTED_LANGUAGES, TRANSLATION_TYPES, ORIGIN_LANGUAGES, REQUIRED_LANGUAGES
-from .utils import convert_firestore_data
+from .utils import convert_firestore_data, with_timestamp_ms
+from .metrics import instrument
+from .swr_cache import swr_cache
+from .snapshot_cache import load_collection, upsert_snapshot_docs
+from .shared_cache import invalidate_collection, register_local_cache, shared_load
+from .records import ToolTranslationRecord
 
 # tool_translations fields 키 (프론트 DBManager 병합 규칙과 동일)
 TOOL_TRANSLATION_FIELD_KEYS = ["shortDescription", "description", "intro", "pros", "cons"]
@@ -49,10 +58,11 @@ def ensure_tool_translation_fields_shape(fields: Dict[str, Any]) -> Dict[str, Di
     return result
 
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@instrument(COLLECTIONS["TRANSLATIONS"])
+@swr_cache(ttl=300, error_message="번역 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_translations() -> List[Dict[str, Any]]:
     """
-    모든 번역 데이터 조회 (캐시됨)
+    모든 번역 데이터 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
         List[Dict]: 번역 리스트
@@ -61,21 +71,18 @@ def get_all_translations() -> List[Dict[str, Any]]:
     if db is None:
         return []
     
-    try:
-        translations_ref = db.collection(COLLECTIONS["TRANSLATIONS"])
-        docs = translations_ref.stream()
-        translations = []
-        for doc in docs:
-            trans_data = doc.to_dict()
-            trans_data["id"] = doc.id
-            trans_data = convert_firestore_data(trans_data)
-            translations.append(trans_data)
-        return translations
-    except Exception as e:
-        st.error(f"번역 조회 실패: {e}")
-        return []
-
-
+    translations_ref = db.collection(COLLECTIONS["TRANSLATIONS"])
+    docs = translations_ref.stream()
+    translations = []
+    for doc in docs:
+        trans_data = doc.to_dict()
+        trans_data["id"] = doc.id
+        trans_data = convert_firestore_data(with_timestamp_ms(trans_data))
+        translations.append(trans_data)
+    return translations
+
+
+@instrument(COLLECTIONS["TRANSLATIONS"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_translation_by_id(trans_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -105,6 +112,25 @@ def get_translation_by_id(trans_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _clear_menu_catalog() -> None:
+    from .menu import get_menu_catalog
+    get_menu_catalog.clear()
+
+
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시 (다른 인스턴스는 메뉴 번역 캐시까지 비움)
+register_local_cache(COLLECTIONS["TRANSLATIONS"], get_all_translations.clear, get_translation_by_id.clear, _clear_menu_catalog)
+
+
+def _clear_ui_translation_caches(trans_id: str) -> None:
+    """UI 텍스트 번역 캐시 무효화 (menu.* 문서면 메뉴 번역 캐시도 함께)"""
+    get_all_translations.clear()
+    get_translation_by_id.clear()
+    if trans_id.startswith("menu."):
+        _clear_menu_catalog()
+    invalidate_collection(COLLECTIONS["TRANSLATIONS"], clear_local=False)
+
+
+@instrument(COLLECTIONS["TRANSLATIONS"])
 def update_translation(trans_id: str, data: Dict[str, Any]) -> bool:
     """
     번역 정보 업데이트
@@ -126,14 +152,14 @@ def update_translation(trans_id: str, data: Dict[str, Any]) -> bool:
         data["updatedBy"] = "admin"  # TODO: 실제 사용자 ID로 변경
         doc_ref.update(data)
         # 캐시 무효화
-        get_all_translations.clear()
-        get_translation_by_id.clear()
+        _clear_ui_translation_caches(trans_id)
         return True
     except Exception as e:
         st.error(f"번역 업데이트 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["TRANSLATIONS"])
 def create_translation(trans_id: str, data: Dict[str, Any]) -> bool:
     """
     새 번역 생성
@@ -157,14 +183,14 @@ def create_translation(trans_id: str, data: Dict[str, Any]) -> bool:
         data["updatedBy"] = "admin"
         doc_ref.set(data)
         # 캐시 무효화
-        get_all_translations.clear()
-        get_translation_by_id.clear()
+        _clear_ui_translation_caches(trans_id)
         return True
     except Exception as e:
         st.error(f"번역 생성 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["TRANSLATIONS"])
 def delete_translation(trans_id: str) -> bool:
     """
     번역 삭제
@@ -183,8 +209,7 @@ def delete_translation(trans_id: str) -> bool:
         doc_ref = db.collection(COLLECTIONS["TRANSLATIONS"]).document(trans_id)
         doc_ref.delete()
         # 캐시 무효화
-        get_all_translations.clear()
-        get_translation_by_id.clear()
+        _clear_ui_translation_caches(trans_id)
         return True
     except Exception as e:
         st.error(f"번역 삭제 실패: {e}")
@@ -247,34 +272,119 @@ def format_translation_for_display(trans_data: Dict[str, Any], max_length: int =
 # AI 도구 콘텐츠 번역 (tool_translations) 관련 함수
 # ============================================================================
 
-@st.cache_data(ttl=300)  # 5분 캐시
+# tool_translations 저장소: 컬렉션을 한 번 읽어 (toolId, lang) / toolId / lang 인덱스로 보관
+# 쓰기 함수가 저장 직후 로컬 문서를 갱신하므로 조회마다 Firestore를 다시 읽지 않음 (조회 함수는 복사 없이 불변 레코드를 반환)
+TOOL_TRANSLATION_STORE_TTL = 300  # 5분 (다른 경로의 변경 반영 주기)
+
+
+@st.cache_resource
+def _tool_translation_store() -> Dict[str, Any]:
+    """프로세스 공용 tool_translations 저장소 (세션 간 공유)"""
+    return {
+        "lock": threading.RLock(),
+        "docs": None,       # {문서 ID: 번역 데이터}
+        "by_tool": {},      # {toolId: {문서 ID}}
+        "by_lang": {},      # {lang: {문서 ID}}
+        "loaded_at": 0.0,
+    }
+
+
+def _index_tool_translation(store: Dict[str, Any], doc_id: str, data: Dict[str, Any]) -> None:
+    # 조회 함수가 복사 없이 그대로 넘기므로 읽기 전용 압축 레코드로 보관
+    if not isinstance(data, ToolTranslationRecord):
+        data = ToolTranslationRecord(data)
+    store["docs"][doc_id] = data
+    if data.get("toolId"):
+        store["by_tool"].setdefault(data["toolId"], set()).add(doc_id)
+    if data.get("lang"):
+        store["by_lang"].setdefault(data["lang"], set()).add(doc_id)
+
+
+def _unindex_tool_translation(store: Dict[str, Any], doc_id: str) -> None:
+    old = store["docs"].pop(doc_id, None)
+    if not old:
+        return
+    store["by_tool"].get(old.get("toolId"), set()).discard(doc_id)
+    store["by_lang"].get(old.get("lang"), set()).discard(doc_id)
+
+
+def _load_tool_translation_store() -> Dict[str, Any]:
+    """저장소가 비었거나 TTL이 지나면 컬렉션 1회 조회로 다시 채움"""
+    store = _tool_translation_store()
+    with store["lock"]:
+        if store["docs"] is not None and time.time() - store["loaded_at"] < TOOL_TRANSLATION_STORE_TTL:
+            return store
+        db = get_db()
+        if db is None:
+            return store
+        try:
+            docs = shared_load(
+                COLLECTIONS["TOOL_TRANSLATIONS"], "store",
+                lambda: load_collection(COLLECTIONS["TOOL_TRANSLATIONS"], on_change=clear_tool_translation_caches),
+            )
+            store["docs"], store["by_tool"], store["by_lang"] = {}, {}, {}
+            for trans_data in docs:
+                _index_tool_translation(store, trans_data["id"], trans_data)
+            store["loaded_at"] = time.time()
+        except Exception as e:
+            st.error(f"AI 도구 번역 조회 실패: {e}")
+        return store
+
+
+def _local_write_value(value: Any) -> Any:
+    """로컬 저장소 반영용 값 (SERVER_TIMESTAMP → 현재 시각)"""
+    if value is firestore.SERVER_TIMESTAMP:
+        return datetime.now().isoformat()
+    if isinstance(value, dict):
+        return {k: _local_write_value(v) for k, v in value.items()}
+    return convert_firestore_data(value)
+
+
+def patch_tool_translation_store(doc_id: str, data: Dict[str, Any], replace: bool = False) -> None:
+    """
+    Firestore 저장 직후 로컬 저장소 문서 갱신 (update/set 결과와 동일하게 반영)
+
+    Args:
+        doc_id: 문서 ID ({toolId}_{lang})
+        data: 저장한 데이터 ("fields.x.status" 같은 점 경로 지원)
+        replace: True면 문서 전체 교체 (set), False면 병합 (update / set merge)
+    """
+    store = _tool_translation_store()
+    with store["lock"]:
+        if store["docs"] is None:
+            return
+        current = {} if replace else copy.deepcopy(store["docs"].get(doc_id) or {})
+        for key, value in data.items():
+            target = current
+            parts = key.split(".")
+            for part in parts[:-1]:
+                if not isinstance(target.get(part), dict):
+                    target[part] = {}
+                target = target[part]
+            target[parts[-1]] = _local_write_value(value)
+        current["id"] = doc_id
+        with_timestamp_ms(current)
+        _unindex_tool_translation(store, doc_id)
+        _index_tool_translation(store, doc_id, current)
+    upsert_snapshot_docs(COLLECTIONS["TOOL_TRANSLATIONS"], [current])
+    # 로컬 저장소는 위에서 갱신했으므로 다른 인스턴스만 무효화
+    invalidate_collection(COLLECTIONS["TOOL_TRANSLATIONS"], clear_local=False)
+
+
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"], cached=True)
 def get_all_tool_translations() -> List[Dict[str, Any]]:
     """
-    모든 AI 도구 번역 데이터 조회 (tool_translations 컬렉션)
+    모든 AI 도구 번역 데이터 조회 (tool_translations 컬렉션, 저장소에서 조회)
     
     Returns:
         List[Dict]: 번역 리스트
     """
-    db = get_db()
-    if db is None:
-        return []
-    
-    try:
-        translations_ref = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"])
-        docs = translations_ref.stream()
-        translations = []
-        for doc in docs:
-            trans_data = doc.to_dict()
-            trans_data["id"] = doc.id
-            trans_data = convert_firestore_data(trans_data)
-            translations.append(trans_data)
-        return translations
-    except Exception as e:
-        st.error(f"AI 도구 번역 조회 실패: {e}")
-        return []
+    store = _load_tool_translation_store()
+    with store["lock"]:
+        return list((store["docs"] or {}).values())
 
 
-@st.cache_data(ttl=60)  # 1분 캐시
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"], cached=True)
 def get_tool_translation_by_id(tool_id: str, lang: str) -> Optional[Dict[str, Any]]:
     """
     특정 도구의 특정 언어 번역 조회
@@ -286,27 +396,13 @@ def get_tool_translation_by_id(tool_id: str, lang: str) -> Optional[Dict[str, An
     Returns:
         Dict: 번역 데이터 또는 None
     """
-    db = get_db()
-    if db is None:
-        return None
-    
-    try:
+    store = _load_tool_translation_store()
+    with store["lock"]:
         # 문서 ID 형식: {toolId}_{lang}
-        doc_id = f"{tool_id}_{lang}"
-        doc_ref = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"]).document(doc_id)
-        doc = doc_ref.get()
-        if doc.exists:
-            trans_data = doc.to_dict()
-            trans_data["id"] = doc.id
-            trans_data = convert_firestore_data(trans_data)
-            return trans_data
-        return None
-    except Exception as e:
-        st.error(f"AI 도구 번역 조회 실패: {e}")
-        return None
+        return (store["docs"] or {}).get(f"{tool_id}_{lang}")
 
 
-@st.cache_data(ttl=60)  # 1분 캐시
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"], cached=True)
 def get_tool_translations_by_tool_id(tool_id: str) -> List[Dict[str, Any]]:
     """
     특정 도구의 모든 언어 번역 조회
@@ -317,27 +413,13 @@ def get_tool_translations_by_tool_id(tool_id: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: 번역 리스트
     """
-    db = get_db()
-    if db is None:
-        return []
-    
-    try:
-        translations_ref = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"])
-        query = translations_ref.where("toolId", "==", tool_id)
-        docs = query.stream()
-        translations = []
-        for doc in docs:
-            trans_data = doc.to_dict()
-            trans_data["id"] = doc.id
-            trans_data = convert_firestore_data(trans_data)
-            translations.append(trans_data)
-        return translations
-    except Exception as e:
-        st.error(f"AI 도구 번역 조회 실패: {e}")
-        return []
+    store = _load_tool_translation_store()
+    with store["lock"]:
+        docs = store["docs"] or {}
+        return [docs[doc_id] for doc_id in sorted(store["by_tool"].get(tool_id, ()))]
 
 
-@st.cache_data(ttl=60)  # 1분 캐시
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"], cached=True)
 def get_tool_translations_by_language(lang: str) -> List[Dict[str, Any]]:
     """
     특정 언어의 모든 도구 번역 조회
@@ -348,26 +430,25 @@ def get_tool_translations_by_language(lang: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: 번역 리스트
     """
-    db = get_db()
-    if db is None:
-        return []
-    
-    try:
-        translations_ref = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"])
-        query = translations_ref.where("lang", "==", lang)
-        docs = query.stream()
-        translations = []
-        for doc in docs:
-            trans_data = doc.to_dict()
-            trans_data["id"] = doc.id
-            trans_data = convert_firestore_data(trans_data)
-            translations.append(trans_data)
-        return translations
-    except Exception as e:
-        st.error(f"AI 도구 번역 조회 실패: {e}")
-        return []
+    store = _load_tool_translation_store()
+    with store["lock"]:
+        docs = store["docs"] or {}
+        return [docs[doc_id] for doc_id in sorted(store["by_lang"].get(lang, ()))]
+
+
+def clear_tool_translation_caches() -> None:
+    """tool_translations 저장소 무효화 (다음 조회 시 컬렉션 재조회)"""
+    store = _tool_translation_store()
+    with store["lock"]:
+        store["docs"] = None
+        store["by_tool"], store["by_lang"] = {}, {}
+        store["loaded_at"] = 0.0
 
 
+register_local_cache(COLLECTIONS["TOOL_TRANSLATIONS"], clear_tool_translation_caches)
+
+
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"])
 def update_tool_translation(tool_id: str, lang: str, data: Dict[str, Any]) -> bool:
     """
     AI 도구 번역 정보 업데이트.
@@ -385,17 +466,18 @@ def update_tool_translation(tool_id: str, lang: str, data: Dict[str, Any]) -> bo
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         data["updatedBy"] = "admin"  # TODO: 실제 사용자 ID로 변경
         doc_ref.update(data)
-        # 캐시 무효화
-        get_all_tool_translations.clear()
-        get_tool_translation_by_id.clear()
-        get_tool_translations_by_tool_id.clear()
-        get_tool_translations_by_language.clear()
+        patch_tool_translation_store(doc_id, data)
+        if "fields" in data:
+            from .translation_coverage import apply_tool_translation_change
+            # Firestore update는 fields 맵 전체를 교체하므로 엔진도 해당 칸을 교체
+            apply_tool_translation_change(tool_id, lang, data["fields"], replace=True)
         return True
     except Exception as e:
         st.error(f"AI 도구 번역 업데이트 실패: {e}")
         return False
 
 
+@instrument(COLLECTIONS["TOOL_TRANSLATIONS"])
 def create_tool_translation(tool_id: str, lang: str, data: Dict[str, Any]) -> bool:
     """
     새 AI 도구 번역 생성.
@@ -418,11 +500,9 @@ def create_tool_translation(tool_id: str, lang: str, data: Dict[str, Any]) -> bo
         data["createdBy"] = "admin"  # TODO: 실제 사용자 ID로 변경
         data["updatedBy"] = "admin"
         doc_ref.set(data)
-        # 캐시 무효화
-        get_all_tool_translations.clear()
-        get_tool_translation_by_id.clear()
-        get_tool_translations_by_tool_id.clear()
-        get_tool_translations_by_language.clear()
+        patch_tool_translation_store(doc_id, data, replace=True)
+        from .translation_coverage import apply_tool_translation_change
+        apply_tool_translation_change(tool_id, lang, data.get("fields") or {}, replace=True)
         return True
     except Exception as e:
         st.error(f"AI 도구 번역 생성 실패: {e}")
@@ -8,10 +8,12 @@ import os
 import json
 from typing import Tuple
 
-from .config import SUPPORTED_LANGUAGES, FRONT_LANG_JSON_DIR
+from .config import COLLECTIONS, SUPPORTED_LANGUAGES, FRONT_LANG_JSON_DIR
 from .translations import get_all_translations, get_translation_by_id, update_translation, create_translation
+from .metrics import instrument
 
 
+@instrument(COLLECTIONS["TRANSLATIONS"], kind="read")
 def export_ui_translations_to_json(front_lang_dir: str = None) -> Tuple[bool, str]:
     """
     translations 컬렉션 데이터를 프론트 public/lang/{lang}.json 형식으로 내보냅니다.
@@ -62,6 +64,7 @@ def export_ui_translations_to_json(front_lang_dir: str = None) -> Tuple[bool, st
         return False, f"내보내기 실패: {e}"
 
 
+@instrument(COLLECTIONS["TRANSLATIONS"])
 def import_ui_translations_from_json(front_lang_dir: str = None) -> Tuple[bool, str]:
     """
     프론트 public/lang/{lang}.json 파일을 읽어 Firestore translations 컬렉션에 반영합니다.
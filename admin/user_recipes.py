@@ -7,8 +7,10 @@ from typing import List, Dict, Optional, Any
 from .firebase import get_db
 from .config import COLLECTIONS
 from .utils import convert_firestore_data
+from .metrics import instrument
 
 
+@instrument(COLLECTIONS["RECIPES"])
 @st.cache_data(ttl=300)  # 5분 캐시
 def get_user_recipes(uid: str) -> List[Dict[str, Any]]:
     """
@@ -52,6 +54,7 @@ def get_user_recipes(uid: str) -> List[Dict[str, Any]]:
         return []
 
 
+@instrument(COLLECTIONS["RECIPES"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_user_recipe_by_id(uid: str, recipe_id: str) -> Optional[Dict[str, Any]]:
     """
@@ -7,35 +7,36 @@ from typing import List, Dict, Optional, Any
 from .firebase import get_db
 from .config import COLLECTIONS
 from .utils import convert_firestore_data
+from .metrics import instrument, record_writes
+from .swr_cache import swr_cache
+from .shared_cache import invalidate_collection, register_local_cache, shared_load
+from .snapshot_cache import load_collection, remove_snapshot_docs
+from .records import UserRecord
 
+# users/{uid} 아래 서브컬렉션
+USER_SUBCOLLECTIONS = ("favorites", "reviews", "my-ai-sets")
 
-@st.cache_data(ttl=300)  # 5분 캐시
+
+@instrument(COLLECTIONS["USERS"])
+@swr_cache(ttl=300, error_message="사용자 조회 실패")  # 5분 후 백그라운드 갱신
 def get_all_users() -> List[Dict[str, Any]]:
     """
-    모든 사용자 조회 (캐시됨)
+    모든 사용자 조회 (캐시됨, 만료 후에는 이전 결과를 반환하며 백그라운드 갱신)
     
     Returns:
-        List[Dict]: 사용자 리스트
+        List[Dict]: 사용자 리스트 (읽기 전용 UserRecord)
     """
     db = get_db()
     if db is None:
         return []
     
-    try:
-        users_ref = db.collection(COLLECTIONS["USERS"])
-        docs = users_ref.stream()
-        users = []
-        for doc in docs:
-            user_data = doc.to_dict()
-            user_data["uid"] = doc.id
-            user_data = convert_firestore_data(user_data)
-            users.append(user_data)
-        return users
-    except Exception as e:
-        st.error(f"사용자 조회 실패: {e}")
-        return []
+    return UserRecord.from_docs(shared_load(
+        COLLECTIONS["USERS"], "all",
+        lambda: load_collection(COLLECTIONS["USERS"], id_field="uid", on_change=get_all_users.clear),
+    ))
 
 
+@instrument(COLLECTIONS["USERS"])
 @st.cache_data(ttl=60)  # 1분 캐시
 def get_user_by_id(uid: str) -> Optional[Dict[str, Any]]:
     """
@@ -65,6 +66,11 @@ def get_user_by_id(uid: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# 저장 시 모든 인스턴스에서 함께 비울 로컬 캐시
+register_local_cache(COLLECTIONS["USERS"], get_all_users.clear, get_user_by_id.clear)
+
+
+@instrument(COLLECTIONS["USERS"])
 def get_user_favorites(uid: str) -> List[Dict[str, Any]]:
     """
     사용자의 즐겨찾기 목록 조회
@@ -94,6 +100,7 @@ def get_user_favorites(uid: str) -> List[Dict[str, Any]]:
         return []
 
 
+@instrument(COLLECTIONS["USERS"])
 def get_user_reviews(uid: str) -> List[Dict[str, Any]]:
     """
     사용자의 리뷰 목록 조회
@@ -123,6 +130,7 @@ def get_user_reviews(uid: str) -> List[Dict[str, Any]]:
         return []
 
 
+@instrument(COLLECTIONS["USERS"])
 def get_user_ai_sets(uid: str) -> List[Dict[str, Any]]:
     """
     사용자의 AI 세트 목록 조회
@@ -152,6 +160,7 @@ def get_user_ai_sets(uid: str) -> List[Dict[str, Any]]:
         return []
 
 
+@instrument(COLLECTIONS["USERS"])
 def update_user(uid: str, data: Dict[str, Any]) -> bool:
     """
     사용자 정보 업데이트
@@ -172,20 +181,21 @@ def update_user(uid: str, data: Dict[str, Any]) -> bool:
         data["updatedAt"] = firestore.SERVER_TIMESTAMP
         doc_ref.update(data)
         # 캐시 무효화
-        get_all_users.clear()
-        get_user_by_id.clear()
+        invalidate_collection(COLLECTIONS["USERS"])
         return True
     except Exception as e:
         st.error(f"사용자 업데이트 실패: {e}")
         return False
 
 
-def delete_user(uid: str) -> bool:
+@instrument(COLLECTIONS["USERS"])
+def delete_user(uid: str, raise_errors: bool = False) -> bool:
     """
     사용자 삭제 (주의: 서브컬렉션도 함께 삭제해야 함)
     
     Args:
         uid: 사용자 UID
+        raise_errors: True면 st.error 대신 예외를 그대로 올림 (백그라운드 작업 — 오류 내용을 작업 기록에 저장)
         
     Returns:
         bool: 성공 여부
@@ -196,21 +206,25 @@ def delete_user(uid: str) -> bool:
     
     try:
         # 서브컬렉션 삭제 (favorites, reviews, my-ai-sets)
-        subcollections = ["favorites", "reviews", "my-ai-sets"]
-        for subcol in subcollections:
+        deleted = 0
+        for subcol in USER_SUBCOLLECTIONS:
             subcol_ref = db.collection(COLLECTIONS["USERS"]).document(uid).collection(subcol)
             docs = subcol_ref.stream()
             for doc in docs:
                 doc.reference.delete()
+                deleted += 1
         
         # 사용자 문서 삭제
         doc_ref = db.collection(COLLECTIONS["USERS"]).document(uid)
         doc_ref.delete()
+        record_writes(deleted + 1)
+        remove_snapshot_docs(COLLECTIONS["USERS"], [uid])
         
         # 캐시 무효화
-        get_all_users.clear()
-        get_user_by_id.clear()
+        invalidate_collection(COLLECTIONS["USERS"])
         return True
     except Exception as e:
+        if raise_errors:
+            raise
         st.error(f"사용자 삭제 실패: {e}")
         return False
@@ -3,9 +3,15 @@
 """
 import json
 import re
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import datetime, date, time, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+# 목록 로더가 epoch ms 컬럼을 함께 저장하는 타임스탬프 필드 ({field}Ms)
+TIMESTAMP_MS_FIELDS = ("createdAt", "updatedAt")
+
 
 def normalize_id(name: str) -> str:
     """
@@ -36,7 +42,7 @@ def convert_firestore_data(data: Any) -> Any:
     Returns:
         변환된 데이터
     """
-    if isinstance(data, dict):
+    if isinstance(data, Mapping):  # dict, 캐시 레코드(admin.records)
         converted = {}
         for key, value in data.items():
             converted[key] = convert_firestore_data(value)
@@ -130,3 +136,129 @@ def format_datetime(dt: Any, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
         except:
             return str(dt)
     return str(dt)
+
+
+def to_epoch_ms(value: Any) -> Optional[int]:
+    """
+    datetime / ISO 문자열 → epoch 밀리초 (timezone 없는 값은 UTC로 간주)
+    
+    Args:
+        value: Firestore 타임스탬프, datetime 또는 ISO 문자열
+        
+    Returns:
+        int: epoch ms 또는 None (변환 불가)
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def with_timestamp_ms(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    createdAt/updatedAt 옆에 epoch ms 컬럼(createdAtMs/updatedAtMs) 추가
+    convert_firestore_data 전에 호출하면 원본 datetime에서 바로 계산 (문자열 재파싱 없음)
+    
+    Args:
+        data: 문서 데이터
+        
+    Returns:
+        Dict: 같은 dict (ms 컬럼 추가됨)
+    """
+    for field in TIMESTAMP_MS_FIELDS:
+        if field in data:
+            data[f"{field}Ms"] = to_epoch_ms(data[field])
+    return data
+
+
+def _item_epoch_ms(item: Dict[str, Any], field: str, ms_key: str) -> float:
+    """ms 컬럼 우선, 없으면 원본 필드 파싱 (변환 불가 시 NaN)"""
+    value = item.get(ms_key)
+    if value is None:
+        value = to_epoch_ms(item.get(field))
+    return np.nan if value is None else float(value)
+
+
+def _date_bound_ms(day: date) -> int:
+    return int(datetime.combine(day, time.min, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _epoch_ms_column(items: List[Dict[str, Any]], field: str) -> np.ndarray:
+    ms_key = f"{field}Ms"
+    return np.fromiter(
+        (_item_epoch_ms(item, field, ms_key) for item in items),
+        dtype=np.float64,
+        count=len(items),
+    )
+
+
+class DateIndex:
+    """
+    목록의 epoch ms 컬럼과 정렬 순서 (같은 목록을 반복 필터링할 때 재사용)
+
+    Attributes:
+        items: 인덱스를 만든 목록 (filter_by_date_range는 같은 객체일 때만 사용)
+        field: 기준 필드
+        sorted_ms: 날짜가 있는 항목의 epoch ms (오름차순)
+        order: sorted_ms 순서의 원래 목록 위치
+    """
+
+    __slots__ = ("items", "field", "sorted_ms", "order")
+
+    def __init__(self, items: List[Dict[str, Any]], field: str = "createdAt"):
+        values = _epoch_ms_column(items, field)
+        valid = np.flatnonzero(~np.isnan(values))
+        self.items = items
+        self.field = field
+        self.order = valid[np.argsort(values[valid], kind="stable")]
+        self.sorted_ms = values[self.order]
+
+    def select(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> List[Dict[str, Any]]:
+        """범위 내 항목 (양 끝 날짜 포함, 원래 목록 순서 유지)"""
+        start, end = 0, len(self.sorted_ms)
+        if date_from is not None:
+            start = int(np.searchsorted(self.sorted_ms, _date_bound_ms(date_from), side="left"))
+        if date_to is not None:
+            end = int(np.searchsorted(self.sorted_ms, _date_bound_ms(date_to + timedelta(days=1)), side="left"))
+        return [self.items[i] for i in np.sort(self.order[start:end])]
+
+
+def filter_by_date_range(
+    items: List[Dict[str, Any]],
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    field: str = "createdAt",
+    index: Optional[DateIndex] = None,
+) -> List[Dict[str, Any]]:
+    """
+    날짜 범위 필터 (epoch ms 컬럼에 대한 벡터 마스크, 양 끝 날짜 포함)
+    
+    Args:
+        items: 목록 데이터
+        date_from: 시작 날짜 (None이면 제한 없음)
+        date_to: 종료 날짜 (None이면 제한 없음)
+        field: 기준 필드 (createdAt/updatedAt)
+        index: items로 만든 DateIndex (swr_cache.get_date_index) — 있으면 정렬 순서로 이진 탐색
+        
+    Returns:
+        List[Dict]: 범위 내 항목 (날짜가 없는 항목은 제외)
+    """
+    if not items or (date_from is None and date_to is None):
+        return list(items)
+    if index is not None and index.items is items and index.field == field:
+        return index.select(date_from, date_to)
+    values = _epoch_ms_column(items, field)
+    mask = ~np.isnan(values)
+    if date_from is not None:
+        mask &= values >= _date_bound_ms(date_from)
+    if date_to is not None:
+        mask &= values < _date_bound_ms(date_to + timedelta(days=1))
+    return [items[i] for i in np.flatnonzero(mask)]
@@ -21,6 +21,8 @@ if "FIREBASE_SERVICE_ACCOUNT_KEY_JSON" not in os.environ and "FIREBASE_SERVICE_A
 
 from admin.firebase import get_db
 from admin.components import render_header, render_language_selector
+from admin.metrics_exporter import start_metrics_exporter
+from admin.jobs import start_job_workers
 from admin.i18n import t
 from admin.menu import get_current_language
 
@@ -32,6 +34,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 메트릭 내보내기 시작 (ADMIN_METRICS_PORT / ADMIN_METRICS_TEXTFILE 설정 시, 프로세스당 1회)
+start_metrics_exporter()
+
+# 백그라운드 작업 워커 시작 (ADMIN_JOBS_WORKERS개, 프로세스당 1회 — 0이면 scripts/run_jobs.py에서 실행)
+start_job_workers()
+
 # 세션 상태 초기화
 if "db" not in st.session_state:
     st.session_state.db = None
@@ -21,11 +21,16 @@ from admin.config import (
 )
 from admin.banners import (
     get_all_banners, get_banners_by_spot, get_banner_by_id,
-    update_banner, create_banner, delete_banner, update_banner_priority,
-    get_banner_status, get_banner_slot_setting, upsert_banner_slot_setting,
-    get_all_banner_slot_settings,
+    delete_banner, update_banner_priority,
+    get_banner_status, get_banner_slot_setting, commit_banner_group, reorder_banners,
+    filter_banners_for_page, BANNER_PRIORITY_STEP,
+)
+from admin.banner_manifest import publish_banner_manifests
+from admin.images import (
+    get_image_meta, fetch_images, validate_banner_image, summarize_image_meta, format_image_meta,
 )
 from admin.utils import convert_firestore_data, format_datetime
+from admin.shared_cache import invalidate_collection
 
 
 def _parse_banner_datetime(value, default=None):
@@ -81,9 +86,9 @@ def _clear_banner_form_widget_state():
 
 
 def _get_banner_group(spot_id: str, page_id: str, max_count: int) -> List[Dict[str, Any]]:
-    """슬롯+페이지 기준 배너 그룹 (우선순위 순, 최대 max_count)"""
+    """슬롯+페이지 기준 배너 그룹 (우선순위 순, 최대 max_count — 칸 #k는 k번째 배너)"""
     spot_banners = get_banners_by_spot(spot_id)
-    page_banners = _filter_banners_for_page(spot_banners, page_id)
+    page_banners = filter_banners_for_page(spot_banners, page_id)
     page_banners = sorted(page_banners, key=lambda x: int(x.get("priority", 999)))
     return page_banners[:max_count]
 
@@ -110,22 +115,24 @@ def _save_single_slot(
     common_data: Dict[str, Any],
     slot_content: Dict[str, Any],
 ) -> tuple:
-    """단일 슬롯(우선순위) 배너 등록/수정"""
+    """단일 칸 배너 등록/수정 (칸 #k = 우선순위 순 k번째 배너, 새 칸은 마지막 배너 뒤에 추가)"""
     import uuid
-    existing_all = _filter_banners_for_page(get_banners_by_spot(spot_id), page_id)
-    existing_banner = next(
-        (b for b in existing_all if int(b.get("priority", -1)) == priority),
-        None,
-    )
+    group = _get_banner_group(spot_id, page_id, form_max)
+    existing_banner = group[priority - 1] if priority <= len(group) else None
     if existing_banner is None and slot_content.get("id"):
         existing_banner = get_banner_by_id(slot_content["id"])
+    if existing_banner is not None:
+        slot_priority = int(existing_banner.get("priority", priority))
+    else:
+        # 순서 변경으로 우선순위 사이가 벌어져 있을 수 있으므로 마지막 배너 기준
+        slot_priority = int(group[-1].get("priority", 0)) + BANNER_PRIORITY_STEP if group else priority
 
     base_title = (common_data.get("title") or "배너").strip()
     slot_payload = {
         **common_data,
         "spotId": spot_id,
         "pageId": page_id,
-        "priority": priority,
+        "priority": slot_priority,
         "title": base_title if form_max == 1 else f"{base_title} #{priority}",
         "webImageUrl": (slot_content.get("webImageUrl") or "").strip(),
         "webLinkUrl": (slot_content.get("webLinkUrl") or "").strip(),
@@ -136,22 +143,33 @@ def _save_single_slot(
     if not _slot_has_content(slot_payload):
         return False, None, "웹 또는 모바일 이미지 URL을 입력하세요."
 
+    # 이미지 규격 검증 (웹/모바일 동시 조회) — 경고는 저장을 막지 않고 문서에 기록
+    layout_id = common_data.get("displayLayout", "single")
+    metas = fetch_images([slot_payload["webImageUrl"], slot_payload["mobileImageUrl"]])
+    image_warnings: List[str] = []
+    for device, key in (("web", "webImageUrl"), ("mobile", "mobileImageUrl")):
+        meta = metas.get(slot_payload[key])
+        slot_payload[f"{device}ImageMeta"] = summarize_image_meta(meta)
+        image_warnings.extend(
+            f"[{device}] {w}" for w in validate_banner_image(meta, layout_id, device)
+        )
+    slot_payload["imageWarnings"] = image_warnings
+
+    # 그룹 저장과 같은 경로로 커밋 (캐시 무효화·매니페스트 갱신 1회)
     if existing_banner and existing_banner.get("id"):
-        ok = update_banner(existing_banner["id"], slot_payload)
-        return ok, existing_banner["id"], None
+        banner_id = existing_banner["id"]
+        ok = commit_banner_group(spot_id, page_id, updates={banner_id: slot_payload})
+        return ok, banner_id, None
 
     new_id = f"banner_{uuid.uuid4().hex[:8]}"
-    ok = create_banner(new_id, slot_payload)
+    ok = commit_banner_group(spot_id, page_id, creates={new_id: slot_payload})
     return ok, new_id if ok else None, None
 
 
 def _delete_single_slot(spot_id: str, page_id: str, priority: int) -> bool:
-    """단일 슬롯 배너 삭제"""
-    existing_all = _filter_banners_for_page(get_banners_by_spot(spot_id), page_id)
-    existing_banner = next(
-        (b for b in existing_all if int(b.get("priority", -1)) == priority),
-        None,
-    )
+    """단일 칸 배너 삭제 (칸 #k = 우선순위 순 k번째 배너)"""
+    group = _get_banner_group(spot_id, page_id, priority)
+    existing_banner = group[priority - 1] if priority <= len(group) else None
     if existing_banner and existing_banner.get("id"):
         return delete_banner(existing_banner["id"])
     return False
@@ -166,79 +184,28 @@ def _save_group_common(
     """등록된 배너 그룹에 일정·상태·타겟팅 공통 적용"""
     group = _get_banner_group(spot_id, page_id, form_max)
     base_title = (common_data.get("title") or "배너").strip()
-    updated = 0
-    for b in group:
+    updates: Dict[str, Dict[str, Any]] = {}
+    for slot_idx, b in enumerate(group, 1):
         if not b.get("id"):
             continue
         payload = dict(common_data)
         if form_max > 1:
-            priority = int(b.get("priority", 1))
-            payload["title"] = f"{base_title} #{priority}"
-        if update_banner(b["id"], payload):
-            updated += 1
-    return updated
-
-
-def _save_banner_group(
-    spot_id: str,
-    page_id: str,
-    form_max: int,
-    common_data: Dict[str, Any],
-    content_slots: List[Dict[str, Any]],
-) -> tuple:
-    """레이아웃 슬롯 수만큼 배너 일괄 생성/수정 (일정·타겟팅 공통)"""
-    import uuid
-    existing_all = _filter_banners_for_page(get_banners_by_spot(spot_id), page_id)
-    saved_ids: List[str] = []
-    base_title = (common_data.get("title") or "배너").strip()
-
-    for slot in content_slots:
-        priority = int(slot["priority"])
-        existing_banner = next(
-            (b for b in existing_all if int(b.get("priority", -1)) == priority),
-            None,
-        )
-        if not existing_banner and slot.get("id"):
-            existing_banner = get_banner_by_id(slot["id"])
-
-        slot_payload = {
-            **common_data,
-            "spotId": spot_id,
-            "pageId": page_id,
-            "priority": priority,
-            "title": base_title if form_max == 1 else f"{base_title} #{priority}",
-            "webImageUrl": (slot.get("webImageUrl") or "").strip(),
-            "webLinkUrl": (slot.get("webLinkUrl") or "").strip(),
-            "mobileImageUrl": (slot.get("mobileImageUrl") or "").strip(),
-            "mobileLinkUrl": (slot.get("mobileLinkUrl") or "").strip(),
-        }
-
-        if _slot_has_content(slot_payload):
-            if existing_banner and existing_banner.get("id"):
-                if update_banner(existing_banner["id"], slot_payload):
-                    saved_ids.append(existing_banner["id"])
-            else:
-                new_id = f"banner_{uuid.uuid4().hex[:8]}"
-                if create_banner(new_id, slot_payload):
-                    saved_ids.append(new_id)
-        elif existing_banner and existing_banner.get("id"):
-            delete_banner(existing_banner["id"])
-
-    for b in existing_all:
-        if int(b.get("priority", 0)) > form_max and b.get("id"):
-            delete_banner(b["id"])
-
-    return bool(saved_ids), saved_ids
+            payload["title"] = f"{base_title} #{slot_idx}"
+            # 여러 칸이면 칸 순서(우선순위)는 유지 — 우선순위 입력은 단일 레이아웃에서만 표시
+            payload.pop("priority", None)
+        updates[b["id"]] = payload
+    if updates and commit_banner_group(spot_id, page_id, updates=updates):
+        return len(updates)
+    return 0
 
 
 def _delete_banner_group(spot_id: str, page_id: str) -> int:
     """슬롯+페이지 배너 그룹 전체 삭제"""
-    group = _filter_banners_for_page(get_banners_by_spot(spot_id), page_id)
-    deleted = 0
-    for b in group:
-        if b.get("id") and delete_banner(b["id"]):
-            deleted += 1
-    return deleted
+    group = filter_banners_for_page(get_banners_by_spot(spot_id), page_id)
+    ids = [b["id"] for b in group if b.get("id")]
+    if ids and commit_banner_group(spot_id, page_id, deletes=ids):
+        return len(ids)
+    return 0
 
 
 def _start_new_banner():
@@ -255,14 +222,30 @@ def _handle_add_new_banner_click():
     st.rerun()
 
 
-def _render_image_preview(url: str, max_width: int = 300, caption: str = "미리보기"):
-    """직접 접근 가능한 이미지 URL 미리보기 (st.image 대신 HTML img 사용)"""
+def _render_image_preview(
+    url: str,
+    max_width: int = 300,
+    caption: str = "미리보기",
+    layout_id: str = None,
+    device: str = "web",
+):
+    """
+    이미지 URL 미리보기 (로컬 썸네일 캐시 사용, 실패 시 HTML img 폴백)
+    layout_id 지정 시 레이아웃 권장 크기·용량 검증 결과도 표시
+    """
     url = (url or "").strip()
     if not url:
         return
     if not url.startswith(("http://", "https://")):
         st.warning("URL은 `http://` 또는 `https://` 로 시작해야 합니다.")
         return
+    meta = get_image_meta(url)
+    if meta.get("ok") and os.path.isfile(meta.get("thumbPath", "")):
+        st.image(meta["thumbPath"], width=max_width, caption=f"{caption} · {format_image_meta(meta)}")
+        if layout_id:
+            for warning in validate_banner_image(meta, layout_id, device):
+                st.warning(f"⚠️ {warning}")
+        return
     safe_url = html.escape(url, quote=True)
     st.markdown(
         f'<p style="font-size:12px;color:#666;margin:8px 0 4px;">{html.escape(caption)}</p>'
@@ -276,25 +259,17 @@ def _render_image_preview(url: str, max_width: int = 300, caption: str = "미리
     )
 
 
-def _filter_banners_for_page(banners: List[Dict[str, Any]], page_id: str) -> List[Dict[str, Any]]:
-    """특정 페이지(또는 전체)에 노출되는 배너만 필터"""
-    return [
-        b for b in banners
-        if not b.get("pageId") or b.get("pageId") == "all" or b.get("pageId") == page_id
-    ]
-
-
 def _count_live_banners(banners: List[Dict[str, Any]], page_id: str) -> int:
     """페이지 기준 LIVE 배너 수"""
     return sum(
-        1 for b in _filter_banners_for_page(banners, page_id)
+        1 for b in filter_banners_for_page(banners, page_id)
         if get_banner_status(b) == "live"
     )
 
 
 def _suggest_next_priority(banners: List[Dict[str, Any]], page_id: str) -> int:
     """같은 슬롯·페이지에 등록된 배너 기준 다음 우선순위"""
-    filtered = _filter_banners_for_page(banners, page_id)
+    filtered = filter_banners_for_page(banners, page_id)
     if not filtered:
         return 1
     return max(int(b.get("priority", 1)) for b in filtered) + 1
@@ -360,7 +335,7 @@ def _render_registration_status(spot_banners: List[Dict[str, Any]], page_id: str
     """레이아웃별 배너 등록 현황 (레이아웃 = 최대 노출 수)"""
     info = BANNER_DISPLAY_LAYOUTS.get(layout_id, BANNER_DISPLAY_LAYOUTS["single"])
     max_slots = info["maxBanners"]
-    page_banners = _filter_banners_for_page(spot_banners, page_id)
+    page_banners = filter_banners_for_page(spot_banners, page_id)
     live_count = sum(1 for b in page_banners if get_banner_status(b) == "live")
     total_count = len(page_banners)
     page_label = BANNER_PAGES.get(page_id, {}).get("name", page_id)
@@ -605,19 +580,20 @@ with col_list:
     )
 
     if st.button("💾 레이아웃 저장", key="save_slot_layout_btn", use_container_width=True):
-        if upsert_banner_slot_setting(
+        # 배너 문서에도 displayLayout 동기화 (slot_settings 미배포 시 프론트 폴백용)
+        page_banners = filter_banners_for_page(
+            get_banners_by_spot(st.session_state.selected_spot_id),
+            st.session_state.layout_page_id,
+        )
+        if commit_banner_group(
             st.session_state.selected_spot_id,
             st.session_state.layout_page_id,
-            selected_layout,
+            updates={
+                b["id"]: {"displayLayout": selected_layout}
+                for b in page_banners if b.get("id")
+            },
+            display_layout=selected_layout,
         ):
-            # 배너 문서에도 displayLayout 동기화 (slot_settings 미배포 시 프론트 폴백용)
-            page_banners = _filter_banners_for_page(
-                get_banners_by_spot(st.session_state.selected_spot_id),
-                st.session_state.layout_page_id,
-            )
-            for b in page_banners:
-                if b.get("id"):
-                    update_banner(b["id"], {"displayLayout": selected_layout})
             st.success("디스플레이 레이아웃이 저장되었습니다!")
             st.rerun()
 
@@ -638,7 +614,7 @@ with col_list:
     # 선택된 위치의 배너 목록
     spot_banners = spot_banners_all
     if filter_page_only:
-        spot_banners = _filter_banners_for_page(spot_banners, st.session_state.layout_page_id)
+        spot_banners = filter_banners_for_page(spot_banners, st.session_state.layout_page_id)
         spot_banners = sorted(spot_banners, key=lambda x: x.get("priority", 999))
     
     if spot_banners:
@@ -687,7 +663,7 @@ with col_list:
                         color: #4a90e2;
                         width: 20px;
                         text-align: center;
-                    ">{priority}</div>
+                    ">{idx}</div>
                     <div style="flex-shrink:0;">{thumb_html}</div>
                     <div style="flex: 1; min-width: 0;">
                         <div style="
@@ -719,7 +695,7 @@ with col_list:
                 """, unsafe_allow_html=True)
             else:
                 btn_label = (
-                    f"#{priority} {banner.get('title', '제목 없음')[:18]} "
+                    f"#{idx} {banner.get('title', '제목 없음')[:18]} "
                     f"[{page_label}] {status_badge}"
                 )
                 if st.button(
@@ -736,6 +712,38 @@ with col_list:
                     st.session_state.confirm_delete_banner = False
                     _clear_banner_form_widget_state()
                     st.rerun()
+
+        # 순서 일괄 변경 (바뀐 우선순위만 한 번에 저장)
+        if filter_page_only and len(spot_banners) > 1:
+            with st.expander("↕️ 순서 변경"):
+                order_df = pd.DataFrame([
+                    {
+                        "id": b.get("id"),
+                        "순서": idx,
+                        "제목": b.get("title", "제목 없음"),
+                    }
+                    for idx, b in enumerate(spot_banners, 1)
+                ])
+                edited_order = st.data_editor(
+                    order_df,
+                    column_config={
+                        "id": None,
+                        "순서": st.column_config.NumberColumn("순서", min_value=1, step=1),
+                        "제목": st.column_config.TextColumn("제목", disabled=True),
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    key=f"reorder_{st.session_state.selected_spot_id}_{st.session_state.layout_page_id}",
+                )
+                if st.button("💾 순서 저장", key="save_banner_order_btn", use_container_width=True):
+                    ordered_ids = edited_order.sort_values("순서", kind="stable")["id"].tolist()
+                    if reorder_banners(
+                        st.session_state.selected_spot_id,
+                        st.session_state.layout_page_id,
+                        ordered_ids,
+                    ):
+                        st.success("배너 순서가 저장되었습니다!")
+                        st.rerun()
     else:
         page_label = BANNER_PAGES.get(st.session_state.layout_page_id, {}).get("name", st.session_state.layout_page_id)
         st.info(
@@ -915,10 +923,7 @@ with col_detail:
         _render_layout_size_guide(form_layout, selected_spot_id.startswith("mobile_"))
 
         for slot_idx in range(1, form_max + 1):
-            slot_banner = next(
-                (b for b in banner_group if int(b.get("priority", 0)) == slot_idx),
-                None,
-            )
+            slot_banner = banner_group[slot_idx - 1] if slot_idx <= len(banner_group) else None
             slot_data = slot_banner or {}
             pos_label = {1: "좌1", 2: "좌2", 3: "좌3", 4: "좌4"}.get(slot_idx, str(slot_idx))
 
@@ -974,7 +979,12 @@ with col_detail:
                     st.session_state.get(f"web_image_url_{slot_idx}")
                     or slot_data.get("webImageUrl", "")
                 )
-                _render_image_preview(preview_url, max_width=280, caption=f"#{slot_idx} 미리보기")
+                _render_image_preview(
+                    preview_url,
+                    max_width=280,
+                    caption=f"#{slot_idx} 미리보기",
+                    layout_id=form_layout,
+                )
 
             confirm_key = f"confirm_delete_slot_{slot_idx}"
             if delete_clicked:
@@ -1094,10 +1104,17 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_banners.clear()
-        get_banners_by_spot.clear()
-        get_banner_by_id.clear()
-        get_all_banner_slot_settings.clear()
-        get_banner_slot_setting.clear()
+        invalidate_collection(COLLECTIONS["BANNERS"])
+        invalidate_collection(COLLECTIONS["BANNER_SLOT_SETTINGS"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
+
+    # 배너 매니페스트 발행 (프론트 정적 JSON)
+    st.markdown("#### 📤 배너 매니페스트")
+    st.caption("저장 시 자동 갱신됩니다. 일정 전환(예약 시작/종료) 후에는 수동 발행하세요.")
+    if st.button("📤 배너 매니페스트 발행", use_container_width=True):
+        ok, msg = publish_banner_manifests()
+        if ok:
+            st.success(msg)
+        else:
+            st.error(msg)
@@ -0,0 +1,116 @@
+"""
+작업 관리 페이지 - 백그라운드 작업 진행 상황·결과 조회 및 취소
+"""
+import streamlit as st
+import sys
+import os
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from admin.components import render_page_header
+from admin.config import JOBS_RETENTION_DAYS, JOBS_WORKERS
+from admin.jobs import (
+    JOB_STATUSES, FINISHED_STATUSES, list_jobs, get_job_counts, cancel_job, retry_job,
+    purge_finished_jobs, format_job_time, format_job_duration,
+)
+
+# 페이지 설정
+st.set_page_config(
+    page_title="작업 관리 - Aicuatorhub Admin",
+    page_icon="⏳",
+    layout="wide"
+)
+
+# 페이지 헤더
+render_page_header("⏳ 작업 관리", "일괄 번역·가져오기·내보내기 등 백그라운드 작업의 진행 상황을 확인합니다.")
+
+STATUS_LABELS = {
+    "queued": "⏸️ 대기",
+    "running": "▶️ 실행 중",
+    "succeeded": "✅ 완료",
+    "failed": "❌ 실패",
+    "cancelled": "🚫 취소",
+}
+
+if JOBS_WORKERS <= 0:
+    st.info("이 프로세스는 작업을 실행하지 않습니다 (`ADMIN_JOBS_WORKERS=0`). `python scripts/run_jobs.py`가 실행 중인지 확인하세요.")
+
+col1, col2, col3 = st.columns([3, 1, 1])
+with col1:
+    selected_statuses = st.multiselect(
+        "상태",
+        list(JOB_STATUSES),
+        format_func=lambda s: STATUS_LABELS[s],
+        key="jobs_status_filter",
+    )
+with col2:
+    limit = st.selectbox("표시 개수", [20, 50, 100, 200], index=1, key="jobs_limit")
+with col3:
+    st.write("")
+    if st.button("🗑️ 오래된 기록 삭제", use_container_width=True, help=f"{JOBS_RETENTION_DAYS}일 이전에 끝난 작업 기록 삭제"):
+        removed = purge_finished_jobs()
+        st.success(f"작업 기록 {removed:,}건을 삭제했습니다.")
+
+
+def _render_job(job):
+    """작업 1건 (진행률·메시지·취소/재시도)"""
+    status = job["status"]
+    with st.container(border=True):
+        col1, col2, col3 = st.columns([4, 2, 1])
+        with col1:
+            st.markdown(f"**{job['label']}**  \n`{job['kind']}` · ID `{job['id'][:8]}`")
+        with col2:
+            status_text = STATUS_LABELS.get(status, status)
+            if status == "running" and job["cancelRequested"]:
+                status_text += " (취소 요청됨)"
+            st.markdown(status_text)
+            st.caption(f"생성 {format_job_time(job['created_at'])}"
+                       + (f" · 실행 {format_job_duration(job)}" if job.get("started_at") else ""))
+        with col3:
+            if status in ("queued", "running"):
+                if st.button("취소", key=f"job_cancel_{job['id']}", disabled=job["cancelRequested"],
+                             use_container_width=True):
+                    if cancel_job(job["id"]):
+                        st.rerun()
+            elif status in FINISHED_STATUSES:
+                if st.button("다시 실행", key=f"job_retry_{job['id']}", use_container_width=True):
+                    if retry_job(job["id"]):
+                        st.rerun()
+
+        if status == "running" or job["percent"] is not None:
+            percent = job["percent"] or 0
+            total = job.get("progress_total")
+            progress_text = f"{percent:.1f}%" + (f" ({job['progress_done']:,}/{total:,})" if total else "")
+            st.progress(min(percent / 100, 1.0), text=progress_text)
+        if job.get("message"):
+            st.caption(job["message"])
+        if job.get("error"):
+            with st.expander("오류 내용"):
+                st.code(job["error"])
+        if isinstance(job.get("result"), dict):
+            with st.expander("결과 상세"):
+                st.json(job["result"], expanded=False)
+
+
+def _render_job_list():
+    counts = get_job_counts()
+    metric_cols = st.columns(len(JOB_STATUSES))
+    for col, status in zip(metric_cols, JOB_STATUSES):
+        col.metric(STATUS_LABELS[status], f"{counts.get(status, 0):,}")
+
+    jobs = list_jobs(selected_statuses or None, limit=limit)
+    if not jobs:
+        st.info("작업이 없습니다.")
+        return
+    for job in jobs:
+        _render_job(job)
+
+
+# 실행 중인 작업이 있으면 2초마다 목록만 다시 그림
+if hasattr(st, "fragment"):
+    st.fragment(run_every=2)(_render_job_list)()
+else:
+    _render_job_list()
+    if st.button("🔄 새로고침"):
+        st.rerun()
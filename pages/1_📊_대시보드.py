@@ -20,6 +20,7 @@ from admin.users import get_all_users
 from admin.public_recipes import get_all_public_recipes as get_all_recipes
 from admin.categories import get_category_statistics
 from admin.utils import format_datetime
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -435,10 +436,9 @@ with st.sidebar:
     
     st.markdown("### 🔄 새로고침")
     if st.button("🔄 데이터 새로고침", use_container_width=True):
-        get_all_tools.clear()
-        get_all_users.clear()
-        get_all_recipes.clear()
-        get_category_statistics.clear()
+        # 다른 인스턴스의 캐시·공유 캐시까지 함께 무효화
+        for collection_key in ("AI_TOOLS", "USERS", "PUBLIC_RECIPES", "CATEGORIES"):
+            invalidate_collection(COLLECTIONS[collection_key])
         st.success("데이터가 새로고침되었습니다!")
         st.rerun()
     
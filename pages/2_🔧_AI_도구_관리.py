@@ -13,12 +13,19 @@ from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from admin.firebase import get_db
-from admin.components import render_page_header, render_language_selector
+from admin.components import render_page_header, render_language_selector, render_job_submitted
 from admin.config import COLLECTIONS
 from admin.tools import (
-    get_all_tools, get_tool_by_id, update_tool, create_tool, delete_tool, normalize_tool_id
+    get_all_tools, get_tool_by_id, update_tool, create_tool, delete_tool, normalize_tool_id,
+    build_tool_document, bulk_update_tools,
 )
+from admin.tool_import import (
+    IMPORT_EXISTING_MODES, detect_import_format, get_import_template, import_report_rows, import_tools,
+)
+from admin.images import get_image_meta, format_image_meta
+from admin.jobs import submit_job, save_job_file
 from admin.utils import convert_firestore_data, format_value
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -36,7 +43,41 @@ if db is None:
 # 언어 선택 UI (사이드바에 표시)
 render_language_selector()
 
+# 일괄 편집 모드에서 수정할 수 있는 필드 → 선택지
+BULK_EDIT_FIELDS = {
+    "status": ["active", "inactive"],
+    "featured": [True, False],
+    "verified": [True, False],
+}
+
+
+def _current_bulk_value(tool, field):
+    value = tool.get(field)
+    return bool(value) if isinstance(BULK_EDIT_FIELDS[field][0], bool) else value
+
+
+def _set_pending_change(pending, tool, field, value):
+    """변경 목록에 반영 (원래 값으로 되돌리면 목록에서 제거)"""
+    tool_id = tool.get("id")
+    fields = pending.get(tool_id, {})
+    if value == _current_bulk_value(tool, field):
+        fields.pop(field, None)
+    else:
+        fields[field] = value
+    if fields:
+        pending[tool_id] = fields
+    else:
+        pending.pop(tool_id, None)
+
+
+def _reset_bulk_grid():
+    """그리드를 새 key로 다시 그려 이전 편집 상태 반환을 막음 (변경 목록을 코드에서 바꾼 뒤 호출)"""
+    st.session_state.tool_bulk_grid_version = st.session_state.get("tool_bulk_grid_version", 0) + 1
+
+
 # 세션 상태 초기화
+if 'tool_bulk_changes' not in st.session_state:
+    st.session_state.tool_bulk_changes = {}
 if 'selected_tool_id' not in st.session_state:
     st.session_state.selected_tool_id = None
 if 'selected_tool_data' not in st.session_state:
@@ -52,7 +93,7 @@ render_page_header("🔧 AI 도구 관리", "AI 도구를 조회, 등록, 수정
 # 서브 메뉴
 submenu = st.radio(
     "메뉴",
-    ["도구 조회", "도구 등록", "도구 수정"],
+    ["도구 조회", "도구 등록", "도구 수정", "일괄 등록"],
     key="ai_tools_submenu",
     horizontal=True
 )
@@ -69,8 +110,7 @@ with st.sidebar:
     
     # 캐시 초기화 버튼
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_tools.clear()
-        get_tool_by_id.clear()
+        invalidate_collection(COLLECTIONS["AI_TOOLS"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
 
@@ -82,8 +122,7 @@ if submenu == "도구 조회":
         st.markdown("### 📋 AI 도구 조회")
     with col_header2:
         if st.button("🔄 새로고침", use_container_width=True):
-            get_all_tools.clear()
-            get_tool_by_id.clear()
+            invalidate_collection(COLLECTIONS["AI_TOOLS"])
             st.rerun()
     with col_header3:
         if st.button("📥 Excel 다운로드", use_container_width=True):
@@ -209,12 +248,24 @@ if submenu == "도구 조회":
             "subCategoryEn", "subCategoryKr", "tagsEn", "tagsKr", "verified", "websiteUrl", "affiliateUrl"
         ]
         
+        # 일괄 편집 모드: 셀 편집·다중 선택을 변경 목록에 모았다가 batch 1회로 저장
+        bulk_edit = st.toggle(
+            "✏️ 일괄 편집 모드",
+            key="tool_bulk_edit",
+            help="status·featured·verified 셀을 직접 고치거나 여러 행을 선택해 값을 지정한 뒤 한 번에 저장합니다.",
+        )
+        pending_changes = st.session_state.tool_bulk_changes
+        
         rows = []
         for tool in filtered_tools:
             row = {}
             for col in columns:
                 value = tool.get(col, "")
                 row[col] = format_value(value)
+            if bulk_edit:
+                # 저장 전 변경값을 그리드에 표시
+                for field, value in pending_changes.get(tool.get("id"), {}).items():
+                    row[field] = format_value(value)
             rows.append(row)
         
         df = pd.DataFrame(rows)
@@ -227,7 +278,10 @@ if submenu == "도구 조회":
         
         # AgGrid 설정
         gb = GridOptionsBuilder.from_dataframe(df)
-        gb.configure_selection('single')
+        if bulk_edit:
+            gb.configure_selection('multiple', use_checkbox=True, header_checkbox=True)
+        else:
+            gb.configure_selection('single')
         gb.configure_pagination(
             paginationAutoPageSize=False, 
             paginationPageSize=page_size
@@ -270,6 +324,16 @@ if submenu == "도구 조회":
         if 'subCategoryKr' in df.columns:
             gb.configure_column('subCategoryKr', width=200, minWidth=150)
         
+        if bulk_edit:
+            for field, options in BULK_EDIT_FIELDS.items():
+                gb.configure_column(
+                    field,
+                    editable=True,
+                    cellEditor='agSelectCellEditor',
+                    cellEditorParams={'values': [format_value(option) for option in options]},
+                    cellStyle={'backgroundColor': 'rgba(99, 102, 241, 0.08)'},
+                )
+        
         grid_options = gb.build()
         
         # AgGrid 출력
@@ -279,9 +343,9 @@ if submenu == "도구 조회":
             height=400,
             width='100%',
             data_return_mode=DataReturnMode.FILTERED_AND_SORTED,
-            update_mode=GridUpdateMode.SELECTION_CHANGED,
+            update_mode=GridUpdateMode.MODEL_CHANGED if bulk_edit else GridUpdateMode.SELECTION_CHANGED,
             allow_unsafe_jscode=True,
-            key="tool_grid",
+            key=f"tool_grid_bulk_{st.session_state.get('tool_bulk_grid_version', 0)}" if bulk_edit else "tool_grid",
             theme='streamlit'
         )
         
@@ -293,7 +357,79 @@ if submenu == "도구 조회":
         elif selected_rows is None:
             selected_rows = []
         
-        if len(selected_rows) > 0:
+        if bulk_edit:
+            tools_by_id = {t.get("id"): t for t in filtered_tools}
+            
+            # 셀 편집 → 변경 목록
+            grid_data = grid_response.get('data')
+            if isinstance(grid_data, pd.DataFrame):
+                grid_data = grid_data.to_dict('records')
+            for row in grid_data or []:
+                tool = tools_by_id.get(str(row.get('id', '')).strip())
+                if not tool:
+                    continue
+                for field, options in BULK_EDIT_FIELDS.items():
+                    labels = {format_value(option): option for option in options}
+                    if row.get(field) in labels:
+                        _set_pending_change(pending_changes, tool, field, labels[row[field]])
+            
+            # 다중 선택 → 같은 값 지정
+            selected_ids = [str(r.get('id', '')).strip() for r in selected_rows if str(r.get('id', '')).strip() in tools_by_id]
+            apply_col1, apply_col2, apply_col3 = st.columns([2, 2, 2])
+            with apply_col1:
+                bulk_field = st.selectbox("변경할 필드", list(BULK_EDIT_FIELDS), key="tool_bulk_field")
+            with apply_col2:
+                bulk_value = st.selectbox(
+                    "값", BULK_EDIT_FIELDS[bulk_field], format_func=format_value, key=f"tool_bulk_value_{bulk_field}"
+                )
+            with apply_col3:
+                st.write("")
+                if st.button(
+                    f"선택한 {len(selected_ids)}개 도구에 적용",
+                    disabled=not selected_ids,
+                    use_container_width=True,
+                    key="tool_bulk_apply",
+                ):
+                    for tool_id in selected_ids:
+                        _set_pending_change(pending_changes, tools_by_id[tool_id], bulk_field, bulk_value)
+                    _reset_bulk_grid()
+                    st.rerun()
+            
+            # 변경 목록 · 저장
+            st.markdown(f"#### 🗂️ 저장 대기 변경 ({len(pending_changes)}개 도구)")
+            if pending_changes:
+                all_tools_by_id = {t.get("id"): t for t in all_tools}
+                change_rows = [
+                    {
+                        "ID": tool_id,
+                        "이름": (all_tools_by_id.get(tool_id) or {}).get("name", ""),
+                        "필드": field,
+                        "현재": format_value((all_tools_by_id.get(tool_id) or {}).get(field)),
+                        "변경": format_value(value),
+                    }
+                    for tool_id, fields in pending_changes.items()
+                    for field, value in fields.items()
+                ]
+                st.dataframe(pd.DataFrame(change_rows), use_container_width=True, hide_index=True)
+                save_col, cancel_col = st.columns(2)
+                with save_col:
+                    if st.button(f"💾 변경 저장 ({len(pending_changes)}개 도구)", type="primary", use_container_width=True, key="tool_bulk_save"):
+                        with st.spinner("저장 중..."):
+                            ok, stats = bulk_update_tools(pending_changes)
+                        if ok:
+                            st.session_state.tool_bulk_changes = {}
+                            _reset_bulk_grid()
+                            st.success(f"✅ {stats['updated']:,}개 도구를 저장했습니다.")
+                            st.rerun()
+                with cancel_col:
+                    if st.button("↩️ 변경 취소", use_container_width=True, key="tool_bulk_cancel"):
+                        st.session_state.tool_bulk_changes = {}
+                        _reset_bulk_grid()
+                        st.rerun()
+            else:
+                st.caption("셀을 수정하거나 행을 선택해 값을 적용하면 여기에 모입니다.")
+        
+        elif len(selected_rows) > 0:
             try:
                 selected_row = selected_rows[0]
                 clicked_tool_id = str(selected_row.get('id', '')).strip()
@@ -390,8 +526,13 @@ if submenu == "도구 조회":
 
                     display_url = valid_logo_url or valid_image_url
                     if display_url:
+                        # 로컬 썸네일 캐시 우선, 실패 시 원격 URL 직접 표시
+                        logo_meta = get_image_meta(display_url.strip())
                         try:
-                            st.image(display_url, width=200)
+                            if logo_meta.get("ok") and os.path.isfile(logo_meta.get("thumbPath", "")):
+                                st.image(logo_meta["thumbPath"], width=200, caption=format_image_meta(logo_meta))
+                            else:
+                                st.image(display_url, width=200)
                         except Exception as e:
                             st.warning(f"이미지를 불러올 수 없습니다: {str(e)}")
                     else:
@@ -503,29 +644,27 @@ elif submenu == "도구 등록":
                 if existing_tool:
                     st.error(f"이미 존재하는 도구 ID입니다: {tool_id}")
                 else:
-                    tool_data = {
+                    tool_data = build_tool_document({
                         "name": tool_name,
-                        "company": company if company else None,
-                        "websiteUrl": website_url if website_url else None,
-                        "affiliateUrl": affiliate_url if affiliate_url else None,
+                        "company": company,
+                        "websiteUrl": website_url,
+                        "affiliateUrl": affiliate_url,
                         "description": description,
-                        "primaryCategory": primary_category if primary_category else None,
-                        "primaryCategoryKr": primary_category_kr if primary_category_kr else None,
-                        "primaryCategoryEn": primary_category_en if primary_category_en else None,
-                        "subCategoryKr": sub_category_kr if sub_category_kr else None,
-                        "subCategoryEn": sub_category_en if sub_category_en else None,
+                        "primaryCategory": primary_category,
+                        "primaryCategoryKr": primary_category_kr,
+                        "primaryCategoryEn": primary_category_en,
+                        "subCategoryKr": sub_category_kr,
+                        "subCategoryEn": sub_category_en,
                         "rating": rating,
                         "reviewCount": review_count,
                         "verified": verified,
                         "featured": featured,
                         "status": status,
-                        "tags": [],
-                        "tagsKr": [tag.strip() for tag in tags_kr.split(",") if tag.strip()] if tags_kr else [],
-                        "tagsEn": [tag.strip() for tag in tags_en.split(",") if tag.strip()] if tags_en else [],
-                        "featuresKr": [f.strip() for f in features_kr.split("\n") if f.strip()] if features_kr else [],
-                        "featuresEn": [f.strip() for f in features_en.split("\n") if f.strip()] if features_en else [],
-                        "categories": [],
-                    }
+                        "tagsKr": tags_kr,
+                        "tagsEn": tags_en,
+                        "featuresKr": features_kr,
+                        "featuresEn": features_en,
+                    })
                     
                     if create_tool(tool_id, tool_data):
                         st.success(f"✅ 도구가 성공적으로 등록되었습니다! (ID: {tool_id})")
@@ -582,27 +721,27 @@ elif submenu == "도구 수정":
                     if not tool_name or not description:
                         st.error("도구 이름과 설명은 필수입니다.")
                     else:
-                        update_data = {
+                        update_data = build_tool_document({
                             "name": tool_name,
-                            "company": company if company else None,
-                            "websiteUrl": website_url if website_url else None,
-                            "affiliateUrl": affiliate_url if affiliate_url else None,
+                            "company": company,
+                            "websiteUrl": website_url,
+                            "affiliateUrl": affiliate_url,
                             "description": description,
-                            "primaryCategory": primary_category if primary_category else None,
-                            "primaryCategoryKr": primary_category_kr if primary_category_kr else None,
-                            "primaryCategoryEn": primary_category_en if primary_category_en else None,
-                            "subCategoryKr": sub_category_kr if sub_category_kr else None,
-                            "subCategoryEn": sub_category_en if sub_category_en else None,
+                            "primaryCategory": primary_category,
+                            "primaryCategoryKr": primary_category_kr,
+                            "primaryCategoryEn": primary_category_en,
+                            "subCategoryKr": sub_category_kr,
+                            "subCategoryEn": sub_category_en,
                             "rating": rating,
                             "reviewCount": review_count,
                             "verified": verified,
                             "featured": featured,
                             "status": status,
-                            "tagsKr": [tag.strip() for tag in tags_kr.split(",") if tag.strip()] if tags_kr else [],
-                            "tagsEn": [tag.strip() for tag in tags_en.split(",") if tag.strip()] if tags_en else [],
-                            "featuresKr": [f.strip() for f in features_kr.split("\n") if f.strip()] if features_kr else [],
-                            "featuresEn": [f.strip() for f in features_en.split("\n") if f.strip()] if features_en else [],
-                        }
+                            "tagsKr": tags_kr,
+                            "tagsEn": tags_en,
+                            "featuresKr": features_kr,
+                            "featuresEn": features_en,
+                        }, for_update=True)
                         
                         if update_tool(tool_id_input, update_data):
                             st.success("✅ 도구 정보가 업데이트되었습니다!")
@@ -611,3 +750,80 @@ elif submenu == "도구 수정":
                             st.rerun()
         else:
             st.error(f"❌ 도구를 찾을 수 없습니다: {tool_id_input}")
+
+# 일괄 등록 (CSV / Parquet)
+elif submenu == "일괄 등록":
+    st.markdown("### 📥 AI 도구 일괄 등록")
+    st.caption(
+        "열 이름은 문서 필드 이름(name, description, websiteUrl, primaryCategory …)을 사용합니다. "
+        "ID는 id 열이 없으면 이름으로 만들며, 태그는 쉼표·기능은 줄바꿈으로 구분합니다."
+    )
+    st.download_button(
+        "📄 CSV 양식 다운로드",
+        data=get_import_template(),
+        file_name="ai_tools_import_template.csv",
+        mime="text/csv",
+    )
+    
+    uploaded = st.file_uploader("CSV 또는 Parquet 파일", type=["csv", "parquet"], key="tool_import_file")
+    col1, col2 = st.columns(2)
+    with col1:
+        dry_run = st.checkbox("검증만 하기 (저장하지 않음)", value=True, key="tool_import_dry_run")
+    with col2:
+        on_existing = st.radio(
+            "이미 있는 도구",
+            IMPORT_EXISTING_MODES,
+            format_func=lambda mode: {"update": "값이 있는 열만 수정", "skip": "건너뛰기"}[mode],
+            key="tool_import_on_existing",
+            horizontal=True,
+        )
+    
+    if uploaded is not None:
+        fmt = detect_import_format(uploaded.name)
+        label = "🔍 검증 실행" if dry_run else "💾 일괄 저장"
+        if fmt is None:
+            st.error("CSV 또는 Parquet 파일만 지원합니다.")
+        elif not dry_run and st.button(label, type="primary", key="tool_import_run"):
+            # 저장은 백그라운드 작업으로 실행 (업로드 파일은 세션과 함께 사라지므로 먼저 저장)
+            path = save_job_file(uploaded.name, uploaded.getvalue())
+            job_id = submit_job(
+                "tool_import",
+                {"path": path, "fmt": fmt, "on_existing": on_existing},
+                label=f"AI 도구 일괄 등록 ({uploaded.name})",
+            )
+            st.session_state.pop("tool_import_report", None)
+            render_job_submitted(job_id, f"AI 도구 일괄 등록 ({uploaded.name})")
+        elif dry_run and st.button(label, type="primary", key="tool_import_run"):
+            status_text = st.empty()
+            with st.spinner("파일 처리 중..."):
+                _, report = import_tools(
+                    uploaded, fmt, dry_run=True, on_existing=on_existing,
+                    progress=lambda done: status_text.caption(f"{done:,}행 처리"),
+                )
+            status_text.empty()
+            st.session_state.tool_import_report = report
+    
+    report = st.session_state.get("tool_import_report")
+    if report:
+        (st.success if report["errors"] == 0 and report["total"] else st.warning)(report["message"])
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("생성", f"{report['created']:,}")
+        col2.metric("수정", f"{report['updated']:,}")
+        col3.metric("건너뜀", f"{report['skipped']:,}")
+        col4.metric("오류", f"{report['errors']:,}")
+        if report["ignoredColumns"]:
+            st.caption(f"무시한 열: {', '.join(report['ignoredColumns'])}")
+        
+        error_rows = import_report_rows(report, errors_only=True)
+        if error_rows:
+            st.markdown("#### ❌ 오류 행")
+            st.dataframe(pd.DataFrame(error_rows), use_container_width=True, hide_index=True)
+        if report["rows"]:
+            st.download_button(
+                "📥 행별 결과 CSV 다운로드",
+                data=pd.DataFrame(import_report_rows(report)).to_csv(index=False).encode("utf-8-sig"),
+                file_name="ai_tools_import_report.csv",
+                mime="text/csv",
+            )
+        if report["dryRun"] and report["errors"] == 0 and report["total"]:
+            st.info("검증을 통과했습니다. '검증만 하기'를 해제하고 다시 실행하면 저장합니다.")
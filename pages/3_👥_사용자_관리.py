@@ -12,14 +12,17 @@ from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from admin.firebase import get_db
-from admin.components import render_page_header
+from admin.components import render_page_header, render_job_submitted
+from admin.jobs import submit_job
 from admin.config import COLLECTIONS, SUPPORTED_LANGUAGES
 from admin.users import (
-    get_all_users, get_user_by_id, update_user, delete_user,
+    get_all_users, get_user_by_id, update_user,
     get_user_favorites, get_user_reviews, get_user_ai_sets
 )
 from admin.user_recipes import get_user_recipes
-from admin.utils import convert_firestore_data, format_datetime, format_value
+from admin.tools import get_tools_by_ids, format_tool_names
+from admin.utils import convert_firestore_data, format_datetime
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -291,10 +294,14 @@ if st.session_state.selected_user_data:
         favorites = get_user_favorites(st.session_state.selected_user_id)
         
         if favorites:
+            # 즐겨찾기 도구 이름을 get_all 1회로 조회
+            fav_tools = get_tools_by_ids(tuple(f.get("toolId") for f in favorites if f.get("toolId")))
             fav_data = []
             for fav in favorites:
+                fav_tool = fav_tools.get(fav.get("toolId")) or {}
                 fav_data.append({
                     "도구 ID": fav.get("toolId", "-"),
+                    "도구 이름": fav_tool.get("name", "-"),
                     "추가일": format_datetime(fav.get("favoritedAt")),
                 })
             
@@ -332,11 +339,19 @@ if st.session_state.selected_user_data:
         ai_sets = get_user_ai_sets(st.session_state.selected_user_id)
         
         if ai_sets:
+            # 모든 세트의 도구를 한 번에 조회 (세트마다 get_all 호출하지 않음)
+            set_tool_ids = {}
+            for ai_set in ai_sets:
+                ids = ai_set.get('toolIds') or []
+                for tool_id in ([ids] if isinstance(ids, str) else ids):
+                    if tool_id:
+                        set_tool_ids[str(tool_id)] = None
+            set_tools = get_tools_by_ids(tuple(set_tool_ids))
             for ai_set in ai_sets:
                 with st.expander(f"{ai_set.get('title', 'N/A')} ({ai_set.get('id', 'N/A')})"):
                     st.write(f"**세트 ID**: {ai_set.get('setId', '-')}")
                     st.write(f"**제목**: {ai_set.get('title', '-')}")
-                    st.write(f"**도구 ID 목록**: {format_value(ai_set.get('toolIds', []))}")
+                    st.write(f"**도구 목록**: {', '.join(format_tool_names(ai_set.get('toolIds', []), tools=set_tools)) or '-'}")
                     st.write(f"**생성일**: {format_datetime(ai_set.get('createdAt'))}")
             
             st.info(f"총 {len(ai_sets)}개의 AI 세트가 있습니다.")
@@ -415,7 +430,7 @@ if st.session_state.selected_user_data:
                             # 포함된 도구 목록
                             tool_ids = selected_recipe.get("toolIds", selected_recipe.get("tools", []))
                             if tool_ids:
-                                st.write(f"**포함된 도구**: {format_value(tool_ids)}")
+                                st.write(f"**포함된 도구**: {', '.join(format_tool_names(tool_ids))}")
         else:
             st.info("레시피가 없습니다.")
     
@@ -436,14 +451,13 @@ if st.session_state.selected_user_data:
     with col_action2:
         if st.session_state.get('confirm_delete_user', False):
             if st.button("✅ 확인 (삭제)", use_container_width=True, type="primary"):
-                if delete_user(st.session_state.selected_user_id):
-                    st.success("삭제 완료!")
-                    st.session_state.selected_user_data = None
-                    st.session_state.selected_user_id = None
-                    st.session_state.confirm_delete_user = False
-                    get_all_users.clear()
-                    get_user_by_id.clear()
-                    st.rerun()
+                # 서브컬렉션 문서를 하나씩 지우므로 백그라운드 작업으로 실행
+                delete_uid = st.session_state.selected_user_id
+                job_id = submit_job("delete_user", {"uid": delete_uid}, label=f"사용자 삭제 ({delete_uid})")
+                st.session_state.selected_user_data = None
+                st.session_state.selected_user_id = None
+                st.session_state.confirm_delete_user = False
+                render_job_submitted(job_id, f"사용자 삭제 ({delete_uid})")
             if st.button("❌ 취소", use_container_width=True):
                 st.session_state.confirm_delete_user = False
                 st.rerun()
@@ -487,7 +501,6 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_users.clear()
-        get_user_by_id.clear()
+        invalidate_collection(COLLECTIONS["USERS"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
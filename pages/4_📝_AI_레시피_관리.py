@@ -5,7 +5,6 @@ import streamlit as st
 import sys
 import os
 import pandas as pd
-from datetime import datetime, date
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 
 # 프로젝트 루트 경로 추가
@@ -23,7 +22,10 @@ from admin.public_recipes import (
     approve_public_recipe as approve_recipe, 
     reject_public_recipe as reject_recipe
 )
-from admin.utils import convert_firestore_data, format_datetime, format_value
+from admin.tools import format_tool_names
+from admin.utils import convert_firestore_data, format_datetime, filter_by_date_range
+from admin.swr_cache import get_date_index
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -86,8 +88,10 @@ st.markdown("---")
 # 레시피 목록 로드 및 필터링
 all_recipes = get_all_recipes()
 
-# 필터링 적용
+# 필터링 적용 (날짜는 로더 버전별 정렬 인덱스로 먼저 선택)
 filtered_recipes = all_recipes
+if date_from:
+    filtered_recipes = filter_by_date_range(all_recipes, date_from, index=get_date_index(get_all_recipes))
 
 if search_query:
     search_lower = search_query.lower()
@@ -111,12 +115,6 @@ if status_filter != "전체":
         if r.get("status", "pending") == status_filter
     ]
 
-if date_from:
-    filtered_recipes = [
-        r for r in filtered_recipes
-        if r.get("createdAt") and datetime.fromisoformat(r.get("createdAt").replace("Z", "+00:00")).date() >= date_from
-    ]
-
 # 결과 정보
 st.info(f"📊 검색 결과: {len(filtered_recipes)}개 (전체 {len(all_recipes)}개)")
 
@@ -265,7 +263,7 @@ if st.session_state.selected_recipe_data:
         tool_ids = recipe.get("toolIds", recipe.get("tools", []))
         if tool_ids:
             st.markdown("#### 포함된 도구")
-            st.write(format_value(tool_ids))
+            st.markdown("\n".join(f"- {label}" for label in format_tool_names(tool_ids)))
     
     with tab2:
         st.markdown("#### 레시피 내용")
@@ -391,7 +389,6 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_recipes.clear()
-        get_recipe_by_id.clear()
+        invalidate_collection(COLLECTIONS["PUBLIC_RECIPES"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
@@ -6,14 +6,14 @@ import streamlit as st
 import sys
 import os
 import pandas as pd
-from datetime import datetime, date
+import plotly.express as px
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from admin.firebase import get_db
-from admin.components import render_page_header, render_language_selector
+from admin.components import render_page_header, render_language_selector, render_job_submitted
 from admin.config import (
     COLLECTIONS, SUPPORTED_LANGUAGES, TRANSLATION_TYPES,
     ORIGIN_LANGUAGES, REQUIRED_LANGUAGES
@@ -30,14 +30,23 @@ except ImportError:
 from admin.translations import (
     get_all_translations, get_translation_by_id, update_translation,
     create_translation, delete_translation, format_translation_for_display,
-    get_all_tool_translations, get_tool_translation_by_id, get_tool_translations_by_tool_id,
-    get_tool_translations_by_language, format_tool_translation_for_display,
+    get_all_tool_translations, get_tool_translation_by_id, format_tool_translation_for_display,
     update_tool_translation, create_tool_translation,
     TOOL_TRANSLATION_FIELD_KEYS,
     ensure_tool_translation_fields_shape,
 )
 from admin.tools import get_tool_by_id, get_all_tools
-from admin.utils import convert_firestore_data, format_datetime
+from admin.translation_coverage import (
+    get_translation_coverage, get_default_coverage_langs,
+)
+from admin.tool_translation_batch import (
+    TRANSLATION_PROVIDERS, get_translation_provider, run_tool_translation_batch,
+)
+from admin.translation_freshness import compute_source_hashes, refresh_source_hashes
+from admin.jobs import submit_job
+from admin.utils import convert_firestore_data, format_datetime, filter_by_date_range
+from admin.swr_cache import get_date_index
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -130,7 +139,10 @@ with tab1:
         st.write("")  # 공간
     with col_action2:
         if st.button("🌍 필수 지원 언어 일괄 번역", use_container_width=True, key="i18n_batch_btn"):
-            st.info("일괄 번역 기능은 준비 중입니다.")
+            st.info(
+                "UI 텍스트 일괄 번역은 준비 중입니다. "
+                "AI 도구 콘텐츠는 **🔧 AI 도구 콘텐츠 번역** 탭의 **🤖 일괄 번역 생성**을 사용하세요."
+            )
     with col_action3:
         if st.button("💾 저장", use_container_width=True, type="primary", key="i18n_save_btn"):
             if st.session_state.selected_translation_data and st.session_state.is_edit_mode:
@@ -144,8 +156,12 @@ with tab1:
 
     st.markdown("---")
 
-    # 필터링 적용 (all_translations는 상단에서 로드)
+    # 필터링 적용 (all_translations는 상단에서 로드, 날짜는 로더 버전별 정렬 인덱스로 먼저 선택)
     filtered_translations = list(all_translations)
+    if date_from or date_to:
+        filtered_translations = filter_by_date_range(
+            all_translations, date_from, date_to, index=get_date_index(get_all_translations)
+        )
 
     if translation_type_filter != "전체":
         type_key = [k for k, v in TRANSLATION_TYPES.items() if v == translation_type_filter][0]
@@ -166,18 +182,6 @@ with tab1:
             )
         ]
 
-    if date_from:
-        filtered_translations = [
-            t for t in filtered_translations
-            if t.get("createdAt") and datetime.fromisoformat(t.get("createdAt").replace("Z", "+00:00")).date() >= date_from
-        ]
-
-    if date_to:
-        filtered_translations = [
-            t for t in filtered_translations
-            if t.get("createdAt") and datetime.fromisoformat(t.get("createdAt").replace("Z", "+00:00")).date() <= date_to
-        ]
-
     # 결과 정보
     st.info(f"📊 검색 결과: {len(filtered_translations)}개 (전체 {len(all_translations)}개)")
 
@@ -453,11 +457,8 @@ with tab1:
                     st.error(msg)
         with a6_col2:
             if st.button("📥 가져오기 (public/lang/*.json → translations)", use_container_width=True, key="a6_import_btn"):
-                ok, msg = import_ui_translations_from_json()
-                if ok:
-                    st.success(msg)
-                else:
-                    st.error(msg)
+                job_id = submit_job("import_ui_translations")
+                render_job_submitted(job_id, "UI 텍스트 가져오기")
     else:
         st.warning("UI 텍스트 동기화 모듈을 불러올 수 없습니다. (admin.ui_translation_sync 또는 config.FRONT_LANG_JSON_DIR)")
 
@@ -466,6 +467,150 @@ with tab2:
     st.markdown("### 🔧 AI 도구 콘텐츠 번역 관리")
     st.caption("각 AI 도구의 설명, 장단점 등 콘텐츠 번역을 관리합니다. (tool_translations 컬렉션)")
 
+    # 번역 커버리지 (도구 × 언어 상태 매트릭스)
+    with st.expander("📊 번역 커버리지", expanded=False):
+        coverage = get_translation_coverage()
+        cov_col1, cov_col2 = st.columns([4, 1])
+        with cov_col1:
+            coverage_langs = st.multiselect(
+                "언어",
+                options=list(SUPPORTED_LANGUAGES.keys()),
+                default=get_default_coverage_langs(),
+                format_func=lambda c: SUPPORTED_LANGUAGES.get(c, {}).get("native", c),
+                key="coverage_langs",
+            )
+        with cov_col2:
+            st.write("")
+            if st.button("🔄 다시 계산", use_container_width=True, key="coverage_rebuild_btn"):
+                invalidate_collection(COLLECTIONS["AI_TOOLS"])
+                invalidate_collection(COLLECTIONS["TOOL_TRANSLATIONS"])
+                coverage = get_translation_coverage(rebuild=True)
+            if st.button(
+                "🔍 원문 변경 검사",
+                use_container_width=True,
+                key="stale_sweep_btn",
+                help="전체 도구 원문 해시를 번역 문서의 sourceHashes와 비교해 바뀐 필드만 stale로 표시합니다.",
+            ):
+                job_id = submit_job("sweep_stale_translations")
+                render_job_submitted(job_id, "번역 stale 전체 검사")
+
+        if coverage_langs and coverage.tool_ids:
+            completion = coverage.completion_matrix(coverage_langs)
+            lang_rates = completion.mean(axis=0) if len(completion) else completion
+            metric_cols = st.columns(min(len(coverage_langs), 8))
+            for i, lang in enumerate(coverage_langs):
+                metric_cols[i % len(metric_cols)].metric(lang, f"{lang_rates[i] * 100:.0f}%")
+
+            # 완료율이 낮은 도구부터 표시
+            order = completion.mean(axis=1).argsort(kind="stable")
+            max_rows = 60
+            fig_cov = px.imshow(
+                completion[order][:max_rows],
+                x=coverage_langs,
+                y=[coverage.tool_ids[i] for i in order[:max_rows]],
+                zmin=0, zmax=1,
+                color_continuous_scale="RdYlGn",
+                aspect="auto",
+            )
+            fig_cov.update_layout(height=max(300, 18 * min(len(order), max_rows)), margin=dict(l=0, r=0, t=10, b=0))
+            st.plotly_chart(fig_cov, use_container_width=True)
+            st.caption(f"완료율 하위 {min(len(order), max_rows)}개 도구 (전체 {len(coverage.tool_ids):,}개)")
+
+            query_labels = {
+                "missing": "누락",
+                "stale": "재번역 필요 (stale/error)",
+                "needs_review": "검토 필요 (ai_generated/stale/error)",
+            }
+            coverage_query = st.radio(
+                "조회",
+                options=list(query_labels.keys()),
+                format_func=lambda k: query_labels[k],
+                horizontal=True,
+                key="coverage_query",
+            )
+            cells = getattr(coverage, coverage_query)(coverage_langs)
+            st.write(f"**{len(cells):,}건**")
+            if cells:
+                st.dataframe(
+                    pd.DataFrame([
+                        {"도구 ID": c["toolId"], "언어": c["lang"], "필드": ", ".join(c["fields"])}
+                        for c in cells
+                    ]),
+                    hide_index=True,
+                    use_container_width=True,
+                    height=300,
+                )
+        else:
+            st.info("표시할 도구 또는 언어가 없습니다.")
+
+    # 누락/stale 필드만 골라 일괄 번역 (tool_translations)
+    with st.expander("🤖 일괄 번역 생성", expanded=False):
+        st.caption("대상 도구 × 언어에서 비어 있거나 stale/error인 필드만 번역해 status `ai_generated`로 저장합니다.")
+        batch_tools_all = get_all_tools()
+        batch_col1, batch_col2 = st.columns(2)
+        with batch_col1:
+            batch_tool_ids = st.multiselect(
+                "도구 (비우면 전체)",
+                options=[t.get("id") for t in batch_tools_all if t.get("id")],
+                key="batch_translate_tools",
+            )
+            batch_provider_name = st.selectbox(
+                "번역 공급자",
+                options=list(TRANSLATION_PROVIDERS.keys()),
+                index=list(TRANSLATION_PROVIDERS.keys()).index("mymemory"),
+                key="batch_translate_provider",
+            )
+        with batch_col2:
+            batch_langs = st.multiselect(
+                "대상 언어",
+                options=[c for c in SUPPORTED_LANGUAGES if c != "ko"],
+                default=REQUIRED_LANGUAGES,
+                format_func=lambda c: SUPPORTED_LANGUAGES.get(c, {}).get("native", c),
+                key="batch_translate_langs",
+            )
+            batch_include_stale = st.checkbox("stale/error 필드 재번역", value=True, key="batch_translate_stale")
+
+        batch_btn_col1, batch_btn_col2 = st.columns(2)
+        batch_plan_clicked = batch_btn_col1.button("📋 작업량 확인", use_container_width=True, key="batch_translate_plan_btn")
+        batch_run_clicked = batch_btn_col2.button(
+            "🚀 번역 실행", use_container_width=True, type="primary", key="batch_translate_run_btn",
+            disabled=not batch_langs,
+        )
+        if batch_run_clicked and batch_langs:
+            # 실제 번역은 외부 API 호출이 많아 백그라운드 작업으로 실행 (작업량 확인은 바로 계산)
+            job_id = submit_job(
+                "tool_translation_batch",
+                {
+                    "tool_ids": batch_tool_ids or None,
+                    "langs": batch_langs,
+                    "provider": batch_provider_name,
+                    "include_stale": batch_include_stale,
+                },
+                label=f"AI 도구 일괄 번역 ({len(batch_tool_ids) if batch_tool_ids else '전체'} 도구 × {', '.join(batch_langs)})",
+            )
+            render_job_submitted(job_id, "AI 도구 일괄 번역")
+        elif batch_plan_clicked and batch_langs:
+            batch_provider = get_translation_provider(batch_provider_name)
+            batch_progress = st.progress(0.0, text="번역 준비 중...")
+
+            def _on_batch_progress(done: int, total: int):
+                batch_progress.progress(done / total, text=f"번역 요청 {done}/{total}")
+
+            _, batch_stats = run_tool_translation_batch(
+                batch_tool_ids or None,
+                batch_langs,
+                batch_provider,
+                include_stale=batch_include_stale,
+                dry_run=True,
+                progress_callback=_on_batch_progress,
+            )
+            batch_progress.empty()
+            summary = (
+                f"문서 {batch_stats['docs']:,}건 · 필드 {batch_stats['fields']:,}개 · "
+                f"문자열 {batch_stats['strings']:,}개 · 요청 {batch_stats['requests']:,}회"
+            )
+            st.info(f"📋 예정: {summary}")
+
     # AI 도구 번역 검색 필터 (유사일치 키워드 검색)
     st.markdown("#### 🔍 검색 필터")
     tool_search_col1, tool_search_col2, tool_search_col3, tool_search_col4 = st.columns([2, 2, 2, 1])
@@ -566,12 +711,11 @@ with tab2:
                 "fields": fields,
                 "docStatus": "edited",
                 "translatedFrom": "ko",
+                "sourceHashes": compute_source_hashes(ko_data),
             }
             if create_tool_translation(tool_id, target_lang, data):
                 st.success(f"✅ {tool_id}_{target_lang} 번역이 저장되었습니다.")
                 st.session_state.korean_source_tool = None
-                get_all_tool_translations.clear()
-                get_tool_translation_by_id.clear()
                 st.rerun()
             else:
                 st.error("저장에 실패했습니다.")
@@ -618,10 +762,6 @@ with tab2:
             data = {"fields": empty_fields, "docStatus": "draft", "translatedFrom": ""}
             if create_tool_translation(a3_tid, a3_lang, data):
                 st.success(f"✅ **{a3_tid}_{a3_lang}** 빈 문서가 생성되었습니다.")
-                get_all_tool_translations.clear()
-                get_tool_translation_by_id.clear()
-                get_tool_translations_by_tool_id.clear()
-                get_tool_translations_by_language.clear()
                 st.rerun()
             else:
                 st.error("생성에 실패했습니다.")
@@ -853,13 +993,17 @@ with tab2:
             if st.button("💾 저장", use_container_width=True, type="primary", key="tool_save_btn"):
                 update_data = {
                     "fields": edited_fields,
-                    "docStatus": tool_trans.get("docStatus", "ai_generated")
+                    "docStatus": tool_trans.get("docStatus", "ai_generated"),
+                    # stale이 아닌 필드는 현재 원문 기준으로 확인된 것으로 기록
+                    "sourceHashes": refresh_source_hashes(
+                        tool_trans.get("sourceHashes"),
+                        compute_source_hashes(get_tool_by_id(tool_id) or {}),
+                        edited_fields,
+                    ),
                 }
                 
                 if update_tool_translation(tool_id, tool_lang, update_data):
                     st.success("✅ AI 도구 번역이 업데이트되었습니다!")
-                    get_all_tool_translations.clear()
-                    get_tool_translation_by_id.clear()
                     st.session_state.selected_tool_translation_data = None
                     st.rerun()
         
@@ -889,11 +1033,7 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_translations.clear()
-        get_translation_by_id.clear()
-        get_all_tool_translations.clear()
-        get_tool_translation_by_id.clear()
-        get_tool_translations_by_tool_id.clear()
-        get_tool_translations_by_language.clear()
+        invalidate_collection(COLLECTIONS["TRANSLATIONS"])
+        invalidate_collection(COLLECTIONS["TOOL_TRANSLATIONS"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
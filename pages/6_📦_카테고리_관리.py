@@ -17,6 +17,7 @@ from admin.categories import (
     get_all_categories, get_category_statistics, get_tools_by_category, update_category
 )
 from admin.utils import format_value
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -364,7 +365,7 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_category_statistics.clear()
+        invalidate_collection(COLLECTIONS["CATEGORIES"])
         get_all_categories.clear()
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
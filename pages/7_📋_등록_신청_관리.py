@@ -5,7 +5,6 @@ import streamlit as st
 import sys
 import os
 import pandas as pd
-from datetime import datetime, date
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 
 # 프로젝트 루트 경로 추가
@@ -16,9 +15,13 @@ from admin.components import render_page_header
 from admin.config import COLLECTIONS
 from admin.applications import (
     get_all_tool_registrations, get_registration_by_id, update_registration,
-    approve_registration, reject_registration, delete_registration
+    approve_registration, reject_registration, delete_registration,
+    APPROVABLE_STATUSES, bulk_approve_registrations, build_tool_from_registration,
 )
-from admin.utils import convert_firestore_data, format_datetime, format_value
+from admin.tools import get_all_tools
+from admin.utils import convert_firestore_data, format_datetime, format_value, filter_by_date_range
+from admin.swr_cache import get_date_index
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -79,8 +82,12 @@ st.markdown("---")
 # 등록 신청 목록 로드 및 필터링
 all_registrations = get_all_tool_registrations()
 
-# 필터링 적용
+# 필터링 적용 (날짜는 로더 버전별 정렬 인덱스로 먼저 선택)
 filtered_registrations = all_registrations
+if date_from or date_to:
+    filtered_registrations = filter_by_date_range(
+        all_registrations, date_from, date_to, index=get_date_index(get_all_tool_registrations)
+    )
 
 if search_query:
     search_lower = search_query.lower()
@@ -98,18 +105,6 @@ if status_filter != "전체":
         if r.get("status", "pending") == status_filter
     ]
 
-if date_from:
-    filtered_registrations = [
-        r for r in filtered_registrations
-        if r.get("createdAt") and datetime.fromisoformat(r.get("createdAt").replace("Z", "+00:00")).date() >= date_from
-    ]
-
-if date_to:
-    filtered_registrations = [
-        r for r in filtered_registrations
-        if r.get("createdAt") and datetime.fromisoformat(r.get("createdAt").replace("Z", "+00:00")).date() <= date_to
-    ]
-
 # 결과 정보
 st.info(f"📊 검색 결과: {len(filtered_registrations)}개 (전체 {len(all_registrations)}개)")
 
@@ -211,6 +206,60 @@ if filtered_registrations:
 else:
     st.warning("검색 결과가 없습니다.")
 
+# 일괄 승인 (신청 승인 + ai-tools 문서 생성·병합)
+approvable_registrations = {
+    r.get("id"): r for r in filtered_registrations
+    if r.get("id") and r.get("status", "pending") in APPROVABLE_STATUSES
+}
+with st.expander(f"✅ 일괄 승인 (승인 가능 {len(approvable_registrations):,}건)", expanded=False):
+    st.caption("선택한 신청을 승인하고 같은 트랜잭션에서 AI 도구 문서를 만듭니다. 이미 있는 도구 ID면 신청에 값이 있는 필드만 병합합니다.")
+    bulk_ids = st.multiselect(
+        "승인할 신청 (대기·검토중, 현재 검색 결과 기준)",
+        options=list(approvable_registrations.keys()),
+        format_func=lambda rid: f"{approvable_registrations[rid].get('toolName', approvable_registrations[rid].get('name', '-'))} ({rid})",
+        key="bulk_approve_ids",
+    )
+    if bulk_ids:
+        existing_tool_ids = {t.get("id") for t in get_all_tools()}
+        preview_rows = []
+        seen_tool_ids = set()
+        for rid in bulk_ids:
+            tool_id, _ = build_tool_from_registration(approvable_registrations[rid])
+            if tool_id is None:
+                action = "❌ ID 생성 불가"
+            elif tool_id in seen_tool_ids:
+                action = "❌ 선택 내 ID 중복"
+            elif tool_id in existing_tool_ids:
+                action = "🔀 기존 도구에 병합"
+            else:
+                action = "🆕 새 도구"
+            seen_tool_ids.add(tool_id)
+            preview_rows.append({"신청 ID": rid, "도구 ID": tool_id or "-", "처리": action})
+        st.dataframe(pd.DataFrame(preview_rows), use_container_width=True, hide_index=True)
+    
+    if st.button(f"✅ 선택한 {len(bulk_ids)}건 승인", type="primary", disabled=not bulk_ids, key="bulk_approve_btn"):
+        with st.spinner("승인 및 도구 문서 저장 중..."):
+            _, bulk_stats = bulk_approve_registrations(bulk_ids)
+        st.session_state.bulk_approve_result = bulk_stats
+        st.session_state.selected_registration_id = None
+        st.session_state.selected_registration_data = None
+        st.session_state.pop("bulk_approve_ids", None)
+        st.rerun()
+    
+    bulk_result = st.session_state.get("bulk_approve_result")
+    if bulk_result:
+        summary = (
+            f"승인 {bulk_result['approved']:,}건 (새 도구 {bulk_result['created']:,} · 병합 {bulk_result['merged']:,}) · "
+            f"건너뜀 {bulk_result['skipped']:,} · 실패 {bulk_result['failed']:,}"
+        )
+        (st.success if bulk_result["failed"] == 0 else st.warning)(summary)
+        issue_rows = [
+            {"신청 ID": r["registrationId"], "도구 ID": r["toolId"] or "-", "처리": r["action"], "사유": r["error"]}
+            for r in bulk_result["results"] if r["error"]
+        ]
+        if issue_rows:
+            st.dataframe(pd.DataFrame(issue_rows), use_container_width=True, hide_index=True)
+
 # 상세 정보 영역
 st.markdown("---")
 st.markdown("### 📝 등록 신청 상세 정보")
@@ -352,7 +401,6 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_tool_registrations.clear()
-        get_registration_by_id.clear()
+        invalidate_collection(COLLECTIONS["TOOL_REGISTRATIONS"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
@@ -5,7 +5,6 @@ import streamlit as st
 import sys
 import os
 import pandas as pd
-from datetime import datetime, date
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
 
 # 프로젝트 루트 경로 추가
@@ -18,7 +17,9 @@ from admin.paid_services import (
     get_all_paid_service_requests, get_paid_service_request_by_id, update_paid_service_request,
     approve_paid_service_request, reject_paid_service_request, delete_paid_service_request
 )
-from admin.utils import convert_firestore_data, format_datetime, format_value
+from admin.utils import convert_firestore_data, format_datetime, format_value, filter_by_date_range
+from admin.swr_cache import get_date_index
+from admin.shared_cache import invalidate_collection
 
 # 페이지 설정
 st.set_page_config(
@@ -79,8 +80,12 @@ st.markdown("---")
 # 유료 서비스 신청 목록 로드 및 필터링
 all_requests = get_all_paid_service_requests()
 
-# 필터링 적용
+# 필터링 적용 (날짜는 로더 버전별 정렬 인덱스로 먼저 선택)
 filtered_requests = all_requests
+if date_from:
+    filtered_requests = filter_by_date_range(
+        all_requests, date_from, index=get_date_index(get_all_paid_service_requests)
+    )
 
 if search_query:
     search_lower = search_query.lower()
@@ -104,12 +109,6 @@ if service_type_filter != "전체":
         if r.get("serviceType", "") == service_type_filter
     ]
 
-if date_from:
-    filtered_requests = [
-        r for r in filtered_requests
-        if r.get("createdAt") and datetime.fromisoformat(r.get("createdAt").replace("Z", "+00:00")).date() >= date_from
-    ]
-
 # 결과 정보
 st.info(f"📊 검색 결과: {len(filtered_requests)}개 (전체 {len(all_requests)}개)")
 
@@ -387,7 +386,6 @@ with st.sidebar:
     
     # 캐시 초기화
     if st.button("🔄 캐시 초기화", use_container_width=True):
-        get_all_paid_service_requests.clear()
-        get_paid_service_request_by_id.clear()
+        invalidate_collection(COLLECTIONS["PAID_SERVICE_REQUESTS"])
         st.success("캐시가 초기화되었습니다!")
         st.rerun()
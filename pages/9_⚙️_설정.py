@@ -10,7 +10,8 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from admin.firebase import get_db, init_firebase
-from admin.components import render_page_header
+from admin.components import render_page_header, render_job_submitted
+from admin.jobs import submit_job
 from admin.config import (
     ENV, DEBUG, COLLECTIONS, FIREBASE_SERVICE_ACCOUNT_KEY_PATH, 
     FIREBASE_SERVICE_ACCOUNT_KEY_JSON, CATEGORIES
@@ -21,6 +22,11 @@ from admin.public_recipes import get_all_public_recipes as get_all_recipes
 from admin.translations import get_all_translations
 from admin.applications import get_all_tool_registrations
 from admin.paid_services import get_all_paid_service_requests
+from admin.translations import clear_tool_translation_caches
+from admin.snapshot_cache import clear_snapshots
+from admin.shared_cache import invalidate_collection, get_shared_cache_status
+from admin.export import EXPORT_FORMATS, get_export_targets, get_export_status
+from admin.config import EXPORT_DIR, EXPORT_CHUNK_SIZE
 
 # 페이지 설정
 st.set_page_config(
@@ -33,8 +39,8 @@ st.set_page_config(
 render_page_header("⚙️ 설정", "시스템 설정 및 Firebase 연결 상태를 확인할 수 있습니다.")
 
 # 탭으로 구분
-tab1, tab2, tab3, tab4 = st.tabs([
-    "Firebase 연결 상태", "메뉴별 컬렉션 상태", "시스템 정보", "캐시 관리"
+tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    "Firebase 연결 상태", "메뉴별 컬렉션 상태", "시스템 정보", "캐시 관리", "데이터 내보내기"
 ])
 
 # 탭 1: Firebase 연결 상태
@@ -290,14 +296,13 @@ with tab4:
         st.markdown("#### 캐시 초기화")
         
         if st.button("🔄 전체 캐시 초기화", use_container_width=True, type="primary"):
-            # 모든 캐시 함수 초기화
+            # 모든 캐시 함수 초기화 (공유 캐시 사용 시 다른 인스턴스도 함께)
             try:
-                get_all_tools.clear()
-                get_all_users.clear()
-                get_all_recipes.clear()
-                get_all_translations.clear()
-                get_all_tool_registrations.clear()
-                get_all_paid_service_requests.clear()
+                for collection_key in (
+                    "AI_TOOLS", "USERS", "PUBLIC_RECIPES", "RECIPES", "TRANSLATIONS", "TOOL_TRANSLATIONS",
+                    "TOOL_REGISTRATIONS", "PAID_SERVICE_REQUESTS", "BANNERS", "BANNER_SLOT_SETTINGS", "CATEGORIES",
+                ):
+                    invalidate_collection(COLLECTIONS[collection_key])
                 init_firebase.clear()
                 
                 st.success("✅ 전체 캐시가 초기화되었습니다!")
@@ -305,17 +310,29 @@ with tab4:
             except Exception as e:
                 st.error(f"캐시 초기화 실패: {str(e)}")
         
+        if st.button("💾 디스크 스냅샷 초기화", use_container_width=True,
+                     help="재시작 후에도 유지되는 컬렉션 스냅샷을 삭제합니다. 다음 조회 시 전체 데이터를 다시 읽습니다."):
+            try:
+                clear_snapshots()
+                get_all_tools.clear()
+                get_all_users.clear()
+                get_all_recipes.clear()
+                clear_tool_translation_caches()
+                st.success("✅ 디스크 스냅샷이 초기화되었습니다!")
+            except Exception as e:
+                st.error(f"스냅샷 초기화 실패: {str(e)}")
+        
         st.markdown("---")
         
         st.markdown("#### 개별 캐시 초기화")
         
         cache_buttons = {
-            "AI 도구": get_all_tools.clear,
-            "사용자": get_all_users.clear,
-            "레시피": get_all_recipes.clear,
-            "번역": get_all_translations.clear,
-            "등록 신청": get_all_tool_registrations.clear,
-            "유료 서비스 신청": get_all_paid_service_requests.clear,
+            "AI 도구": lambda: invalidate_collection(COLLECTIONS["AI_TOOLS"]),
+            "사용자": lambda: invalidate_collection(COLLECTIONS["USERS"]),
+            "레시피": lambda: invalidate_collection(COLLECTIONS["PUBLIC_RECIPES"]),
+            "번역": lambda: invalidate_collection(COLLECTIONS["TRANSLATIONS"]),
+            "등록 신청": lambda: invalidate_collection(COLLECTIONS["TOOL_REGISTRATIONS"]),
+            "유료 서비스 신청": lambda: invalidate_collection(COLLECTIONS["PAID_SERVICE_REQUESTS"]),
             "Firebase 연결": init_firebase.clear
         }
         
@@ -330,8 +347,20 @@ with tab4:
     with col_cache2:
         st.markdown("#### 캐시 정보")
         st.write("**캐시 타입**:")
-        st.write("- `@st.cache_data`: 데이터 캐시 (TTL: 300초)")
+        st.write("- `@st.cache_data`: 데이터 캐시 (TTL: 60~300초)")
+        st.write("- 컬렉션 전체 로더 (`@swr_cache`): 300초 후에는 이전 결과를 바로 표시하고 백그라운드에서 갱신 (사이드바에 마지막 갱신 시각 표시)")
         st.write("- `@st.cache_resource`: 리소스 캐시 (Firebase 연결)")
+        st.write("- 디스크 스냅샷 (SQLite): AI 도구·사용자·공개 레시피·AI 도구 번역 — 재시작 후 즉시 로드, `updatedAt` 이후 변경분만 조회")
+        shared_status = get_shared_cache_status()
+        if shared_status["enabled"]:
+            st.write(
+                f"- 인스턴스 공유 캐시 ({shared_status['backend']}): 인스턴스 `{shared_status['instance']}`, "
+                f"저장 시 모든 인스턴스의 캐시를 함께 무효화"
+            )
+        elif shared_status["error"]:
+            st.warning(shared_status["error"])
+        else:
+            st.write("- 인스턴스 공유 캐시: 사용 안 함 (`ADMIN_SHARED_CACHE_URL` 미설정, 이 인스턴스의 캐시만 초기화)")
         
         st.markdown("---")
         st.write("**캐시된 함수**:")
@@ -343,6 +372,63 @@ with tab4:
         st.write("- `get_all_paid_service_requests()`")
         st.write("- `init_firebase()`")
 
+# 탭 5: 데이터 내보내기
+with tab5:
+    st.markdown("### 📦 데이터 내보내기")
+    
+    st.info(f"""
+    컬렉션을 {EXPORT_CHUNK_SIZE:,}건 단위로 나눠 조회하며 파일에 이어 씁니다 (전체를 메모리에 올리지 않음).
+    중단되면 같은 대상·형식으로 다시 실행할 때 마지막 위치부터 이어서 진행합니다.
+    저장 위치: `{EXPORT_DIR}` (CLI: `python scripts/export_collections.py`)
+    """)
+    
+    export_targets = get_export_targets()
+    col_export1, col_export2 = st.columns([2, 1])
+    
+    with col_export1:
+        selected_targets = st.multiselect(
+            "내보낼 컬렉션",
+            options=list(export_targets.keys()),
+            format_func=lambda key: f"{key} ({export_targets[key]['label']})",
+            key="export_targets",
+        )
+    
+    with col_export2:
+        export_format = st.radio("형식", EXPORT_FORMATS, horizontal=True, key="export_format",
+                                 help="parquet는 pyarrow가 필요합니다.")
+        export_chunk_size = st.number_input("청크 크기 (문서 수)", min_value=50, max_value=5000,
+                                            value=EXPORT_CHUNK_SIZE, step=50, key="export_chunk_size")
+        export_resume = st.checkbox("중단된 내보내기 이어서 진행", value=True, key="export_resume")
+    
+    if st.button("📦 내보내기 시작", type="primary", disabled=not selected_targets, key="export_start"):
+        job_label = f"컬렉션 내보내기 ({export_format}: {', '.join(selected_targets)})"
+        job_id = submit_job(
+            "export_collections",
+            {
+                "targets": selected_targets,
+                "fmt": export_format,
+                "chunk_size": int(export_chunk_size),
+                "resume": export_resume,
+            },
+            label=job_label,
+        )
+        render_job_submitted(job_id, job_label)
+    
+    st.markdown("---")
+    st.markdown("#### 내보내기 기록")
+    
+    export_status = get_export_status()
+    if export_status:
+        for row in export_status:
+            state = "✅ 완료" if row.get("completed") else "⏸️ 중단됨 (이어서 진행 가능)"
+            st.write(
+                f"- **{row.get('collection', row.get('target'))}** ({row.get('format')}) — {state}, "
+                f"{row.get('documents', 0):,}건, {row.get('updatedAt') or row.get('startedAt', '')}  \n"
+                f"  `{row.get('path')}`"
+            )
+    else:
+        st.info("내보내기 기록이 없습니다.")
+
 # 사이드바
 with st.sidebar:
     st.markdown("### ⚙️ 빠른 설정")
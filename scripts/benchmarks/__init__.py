@@ -0,0 +1 @@
+# benchmarks package (Firestore 에뮬레이터 기반 성능 측정)
@@ -0,0 +1,93 @@
+"""
+Firestore 에뮬레이터 실행·초기화
+
+gcloud CLI(`gcloud emulators firestore start`) 또는 Firebase CLI(`firebase emulators:start`)
+중 설치된 쪽으로 에뮬레이터를 띄우고, 벤치마크 규모마다 데이터를 비웁니다.
+"""
+import os
+import shutil
+import socket
+import subprocess
+import time
+import urllib.request
+from typing import Optional
+
+DEFAULT_EMULATOR_HOST = "127.0.0.1:8085"
+STARTUP_TIMEOUT_SECONDS = 60
+
+
+def _port_open(host_port: str) -> bool:
+    host, port = host_port.rsplit(":", 1)
+    try:
+        with socket.create_connection((host, int(port)), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _emulator_command(host_port: str, project_id: str) -> list:
+    if shutil.which("gcloud"):
+        return [
+            "gcloud", "emulators", "firestore", "start",
+            f"--host-port={host_port}", f"--project={project_id}",
+        ]
+    if shutil.which("firebase"):
+        return ["firebase", "emulators:start", "--only", "firestore", "--project", project_id]
+    raise RuntimeError("gcloud 또는 firebase CLI가 필요합니다 (Firestore 에뮬레이터 실행).")
+
+
+class FirestoreEmulator:
+    """
+    에뮬레이터 프로세스 관리 (with 문으로 사용)
+
+    이미 FIRESTORE_EMULATOR_HOST에서 실행 중이면 새로 띄우지 않고 그대로 사용합니다.
+    Firebase CLI를 쓰는 경우 포트는 firebase.json의 emulators.firestore.port와 같아야 합니다.
+    """
+
+    def __init__(self, host_port: Optional[str] = None, project_id: str = "aicuratorhub-bench"):
+        self.host_port = host_port or os.getenv("FIRESTORE_EMULATOR_HOST") or DEFAULT_EMULATOR_HOST
+        self.project_id = project_id
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self) -> "FirestoreEmulator":
+        if not _port_open(self.host_port):
+            self._process = subprocess.Popen(
+                _emulator_command(self.host_port, self.project_id),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+            while not _port_open(self.host_port):
+                if self._process.poll() is not None:
+                    raise RuntimeError("Firestore 에뮬레이터가 시작 직후 종료되었습니다.")
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f"Firestore 에뮬레이터 시작 시간 초과 ({self.host_port})")
+                time.sleep(0.5)
+        # admin.config가 import 되기 전에 설정되어야 init_firebase가 에뮬레이터로 연결됨
+        os.environ["FIRESTORE_EMULATOR_HOST"] = self.host_port
+        os.environ["FIREBASE_PROJECT_ID"] = self.project_id
+        return self
+
+    def reset(self) -> None:
+        """에뮬레이터의 모든 문서 삭제 (규모 변경 전 호출)"""
+        url = (
+            f"http://{self.host_port}/emulator/v1/projects/{self.project_id}"
+            f"/databases/(default)/documents"
+        )
+        urllib.request.urlopen(urllib.request.Request(url, method="DELETE"), timeout=30).close()
+
+    def stop(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+    def __enter__(self) -> "FirestoreEmulator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
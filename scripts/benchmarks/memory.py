@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+캐시 레코드 메모리 벤치마크 (tracemalloc, Firestore 불필요)
+
+합성 데이터(synthetic.py)를 스냅샷 캐시와 같은 JSON 왕복으로 로더 결과 형태로 만든 뒤
+컬렉션별로 일반 dict 리스트와 압축 레코드(admin.records) 리스트가 유지하는 메모리(문서당 바이트)와
+전체 순회 시간(필드 1개 조회)을 비교합니다.
+
+실행 (프로젝트 루트에서):
+  python -m scripts.benchmarks.memory                                  # 1k/10k
+  python -m scripts.benchmarks.memory --sizes 100000 --translated-ratio 0.1
+  python -m scripts.benchmarks.memory --output .cache/memory.json      # 결과 JSON 저장 (회귀 비교용)
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+# 프로젝트 루트를 path에 추가
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(os.path.dirname(_script_dir))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from admin.config import SUPPORTED_LANGUAGES
+from admin.records import ToolRecord, ToolTranslationRecord, UserRecord
+from admin.utils import convert_firestore_data, with_timestamp_ms
+from scripts.benchmarks.synthetic import (
+    generate_tool_translations, generate_tools, generate_users, scale_counts,
+)
+
+DEFAULT_SIZES = "1000,10000"
+
+# 컬렉션 → (레코드 타입, 문서 ID 키, 순회 시 조회할 필드)
+COLLECTION_RECORDS = {
+    "ai-tools": (ToolRecord, "id", "status"),
+    "users": (UserRecord, "uid", "createdAtMs"),
+    "tool_translations": (ToolTranslationRecord, "id", "lang"),
+}
+
+
+def _encode_docs(docs, id_field: str) -> List[bytes]:
+    """로더 결과 형태(id + ms 컬럼 + 문자열 타임스탬프)로 변환해 JSON으로 보관"""
+    blobs = []
+    for doc_id, data in docs:
+        data = dict(data)
+        data[id_field] = doc_id
+        record = convert_firestore_data(with_timestamp_ms(data))
+        blobs.append(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+    return blobs
+
+
+def _retained_bytes(build: Callable[[], List[Any]]) -> tuple:
+    """build() 결과가 유지하는 메모리 (임시 객체 제외) → (바이트, 결과)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def _scan_ms(items: List[Any], field: str) -> float:
+    start = time.perf_counter()
+    for item in items:
+        item.get(field)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_collection(blobs: List[bytes], record_type: type, field: str) -> Dict[str, Any]:
+    """
+    dict 리스트와 레코드 리스트의 문서당 메모리·순회 시간 비교
+
+    Args:
+        blobs: 문서 JSON 리스트
+        record_type: CompactRecord 하위 클래스
+        field: 순회 시간 측정에 조회할 필드
+
+    Returns:
+        Dict: {"documents", "dictBytesPerDoc", "recordBytesPerDoc", "reductionPct", "dictScanMs", "recordScanMs"}
+    """
+    count = len(blobs)
+    dict_bytes, docs = _retained_bytes(lambda: [json.loads(blob) for blob in blobs])
+    dict_scan = _scan_ms(docs, field)
+    del docs
+    record_bytes, records = _retained_bytes(lambda: [record_type(json.loads(blob)) for blob in blobs])
+    record_scan = _scan_ms(records, field)
+    del records
+    return {
+        "documents": count,
+        "dictBytesPerDoc": round(dict_bytes / count, 1),
+        "recordBytesPerDoc": round(record_bytes / count, 1),
+        "reductionPct": round((1 - record_bytes / dict_bytes) * 100, 1) if dict_bytes else 0.0,
+        "dictScanMs": round(dict_scan, 2),
+        "recordScanMs": round(record_scan, 2),
+    }
+
+
+def run(sizes: List[int], seed: int, translated_ratio: float = None) -> Dict[str, Any]:
+    """규모별 컬렉션 메모리 측정"""
+    report: Dict[str, Any] = {"seed": seed, "sizes": {}}
+    now = datetime.now(timezone.utc)
+    for size in sizes:
+        counts = scale_counts(size, translated_ratio)
+        rng = random.Random(seed)
+        sources = {
+            "ai-tools": lambda: generate_tools(rng, counts["tools"], now),
+            "users": lambda: ((uid, data) for uid, data, _ in generate_users(rng, counts["users"], counts["tools"], now)),
+            "tool_translations": lambda: generate_tool_translations(
+                rng, counts["tool_translations"] // len(SUPPORTED_LANGUAGES), now,
+            ),
+        }
+        print(f"\n=== size={size:,} ===")
+        results = {}
+        for collection, (record_type, id_field, field) in COLLECTION_RECORDS.items():
+            blobs = _encode_docs(sources[collection](), id_field)
+            results[collection] = measure_collection(blobs, record_type, field)
+            r = results[collection]
+            print(
+                f"  {collection:<18} docs={r['documents']:>9,}  dict={r['dictBytesPerDoc']:>8,.0f} B/doc  "
+                f"record={r['recordBytesPerDoc']:>8,.0f} B/doc  (-{r['reductionPct']}%)  "
+                f"scan {r['dictScanMs']:,.1f} → {r['recordScanMs']:,.1f} ms"
+            )
+        report["sizes"][str(size)] = results
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캐시 레코드 메모리 벤치마크 (tracemalloc)")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="ai-tools 문서 수 (쉼표 구분)")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 seed")
+    parser.add_argument("--translated-ratio", type=float, default=None, help="번역이 있는 도구 비율 (기본 1.0)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    sizes = [int(s.replace("_", "")) for s in args.sizes.split(",") if s.strip()]
+    report = run(sizes, args.seed, args.translated_ratio)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
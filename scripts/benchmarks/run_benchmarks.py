@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Firestore 에뮬레이터 기반 성능 벤치마크
+
+규모(ai-tools 문서 수)별로 에뮬레이터를 비우고 합성 데이터를 시딩한 뒤
+admin/* 로더·필터·쓰기 경로와 페이지 스크립트(Streamlit AppTest)의 소요 시간과
+문서 읽기 수를 측정합니다.
+
+실행 (프로젝트 루트에서, gcloud 또는 firebase CLI 필요):
+  python -m scripts.benchmarks.run_benchmarks                       # 1k/10k/100k
+  python -m scripts.benchmarks.run_benchmarks --sizes 1000 --repeat 5
+  python -m scripts.benchmarks.run_benchmarks --sizes 100000 --translated-ratio 0.1 --skip-pages
+  python -m scripts.benchmarks.run_benchmarks --output .cache/bench.json  # 결과 JSON 저장 (회귀 비교용)
+
+에뮬레이터에만 연결합니다 (FIRESTORE_EMULATOR_HOST). 프로덕션 키는 사용하지 않습니다.
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트를 path에 추가
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(os.path.dirname(_script_dir))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from scripts.benchmarks.emulator import FirestoreEmulator
+
+DEFAULT_SIZES = "1000,10000,100000"
+PAGE_TIMEOUT_SECONDS = 600
+
+
+class ReadCounter:
+    """
+    DocumentSnapshot 생성 횟수로 문서 읽기 수 집계 (stream/get/get_all 공통 경로)
+
+    벤치마크 프로세스 안에서만 패치하며, 앱 코드는 변경하지 않습니다.
+    """
+
+    def __init__(self):
+        self.reads = 0
+
+    def install(self) -> None:
+        from google.cloud.firestore_v1.base_document import DocumentSnapshot
+
+        original = DocumentSnapshot.__init__
+        counter = self
+
+        def _counting_init(snapshot, *args, **kwargs):
+            counter.reads += 1
+            original(snapshot, *args, **kwargs)
+
+        DocumentSnapshot.__init__ = _counting_init
+
+    @contextmanager
+    def measure(self):
+        start = self.reads
+        result = {"reads": 0}
+        yield result
+        result["reads"] = self.reads - start
+
+
+def _clear_streamlit_caches() -> None:
+    import streamlit as st
+    from admin.swr_cache import clear_all_loaders
+    from admin.translations import clear_tool_translation_caches
+
+    st.cache_data.clear()
+    clear_all_loaders()
+    clear_tool_translation_caches()
+
+
+def _time_case(
+    counter: ReadCounter,
+    func: Callable[[], Any],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """func를 repeat회 실행해 소요 시간(ms)·읽기 수 집계 (setup은 측정 제외)"""
+    timings, reads = [], []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with counter.measure() as measured:
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        reads.append(measured["reads"])
+    return {
+        "minMs": round(min(timings), 2),
+        "medianMs": round(statistics.median(timings), 2),
+        "reads": max(reads),
+    }
+
+
+def _benchmark_cases(size: int) -> Dict[str, Dict[str, Any]]:
+    """측정 대상 (name → {func, setup, group})"""
+    from admin.tools import get_all_tools, get_tools_by_ids, update_tool
+    from admin.users import get_all_users, get_user_favorites, get_user_reviews
+    from admin.translations import get_all_tool_translations, update_tool_translation
+    from admin.banners import (
+        get_all_banners, get_all_banner_slot_settings, get_banners_by_spot, filter_banners_for_page, reorder_banners,
+    )
+    from admin.banner_manifest import build_page_manifest, get_manifest_page_ids
+    from admin.public_recipes import get_all_public_recipes
+    from admin.recipes import get_all_recipes
+    from admin.translation_coverage import TranslationCoverage
+    from admin.utils import filter_by_date_range
+    from datetime import date, timedelta
+
+    sample_ids = tuple(f"tool-{i:06d}" for i in range(0, size, max(1, size // 100)))[:100]
+    sample_uids = [f"user-{i:06d}" for i in range(20)]
+    cold = _clear_streamlit_caches
+
+    def _page_manifests():
+        banners, settings = get_all_banners(), get_all_banner_slot_settings()
+        for page_id in get_manifest_page_ids():
+            build_page_manifest(page_id, banners, settings)
+
+    def _user_subcollections():
+        for uid in sample_uids:
+            get_user_favorites(uid)
+            get_user_reviews(uid)
+
+    def _reorder_first_slot():
+        banners = [b for b in get_all_banners() if b.get("spotId") and b.get("pageId")]
+        if banners:
+            spot_id, page_id = banners[0]["spotId"], banners[0]["pageId"]
+            ids = [b["id"] for b in filter_banners_for_page(get_banners_by_spot(spot_id), page_id)]
+            reorder_banners(spot_id, page_id, list(reversed(ids)))
+
+    today = date.today()
+    return {
+        # 로더 (캐시 비운 상태)
+        "load.tools": {"group": "loader", "func": get_all_tools, "setup": cold},
+        "load.users": {"group": "loader", "func": get_all_users, "setup": cold},
+        "load.user_subcollections(20)": {"group": "loader", "func": _user_subcollections, "setup": cold},
+        "load.tool_translations": {"group": "loader", "func": get_all_tool_translations, "setup": cold},
+        "load.banners": {"group": "loader", "func": get_all_banners, "setup": cold},
+        "load.public_recipes": {"group": "loader", "func": get_all_public_recipes, "setup": cold},
+        "load.recipes": {"group": "loader", "func": get_all_recipes, "setup": cold},
+        "load.tools_by_ids(100)": {"group": "loader", "func": lambda: get_tools_by_ids(sample_ids), "setup": cold},
+        # 필터·집계 (캐시 워밍 후, 순수 계산)
+        "filter.recipes_date_range": {
+            "group": "filter",
+            "func": lambda: filter_by_date_range(get_all_public_recipes(), today - timedelta(days=90), today),
+        },
+        "filter.translation_coverage": {
+            "group": "filter",
+            "func": lambda: TranslationCoverage.from_data(get_all_tools(), get_all_tool_translations()),
+        },
+        "filter.banner_manifests": {"group": "filter", "func": _page_manifests},
+        # 쓰기 경로 (캐시 무효화·후처리 포함)
+        "write.update_tool": {
+            "group": "write",
+            "func": lambda: update_tool("tool-000000", {"shortDescription": f"bench {time.time()}"}),
+        },
+        "write.update_tool_translation": {
+            "group": "write",
+            "func": lambda: update_tool_translation(
+                "tool-000000", "en", {"fields.shortDescription": {"text": f"bench {time.time()}", "status": "edited"}}
+            ),
+        },
+        "write.reorder_banners": {"group": "write", "func": _reorder_first_slot},
+    }
+
+
+def _page_scripts() -> List[str]:
+    pages = sorted(glob.glob(os.path.join(_project_root, "pages", "*.py")))
+    return [os.path.join(_project_root, "admin_main.py")] + pages
+
+
+def _run_pages(counter: ReadCounter) -> Dict[str, Dict[str, Any]]:
+    """페이지 스크립트 1회 실행 (콜드 캐시) — 소요 시간·읽기 수·예외 수"""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for path in _page_scripts():
+        _clear_streamlit_caches()
+        app = AppTest.from_file(path, default_timeout=PAGE_TIMEOUT_SECONDS)
+        with counter.measure() as measured:
+            start = time.perf_counter()
+            app.run()
+            elapsed = (time.perf_counter() - start) * 1000
+        results[f"page.{os.path.basename(path)}"] = {
+            "ms": round(elapsed, 2),
+            "reads": measured["reads"],
+            "exceptions": len(app.exception),
+        }
+    return results
+
+
+def run(emulator: FirestoreEmulator, sizes: List[int], repeat: int, seed: int, translated_ratio: Optional[float], skip_pages: bool) -> Dict[str, Any]:
+    from admin.firebase import get_db
+    from admin.snapshot_cache import clear_snapshots
+    from scripts.benchmarks.synthetic import seed_dataset
+
+    counter = ReadCounter()
+    counter.install()
+    report: Dict[str, Any] = {"repeat": repeat, "seed": seed, "sizes": {}}
+
+    for size in sizes:
+        emulator.reset()
+        # 이전 규모의 스냅샷이 남으면 워터마크 이후 변경분만 읽어 새 시딩 문서를 놓침
+        clear_snapshots()
+        _clear_streamlit_caches()
+        print(f"\n=== size={size:,} — 시딩 중 ===")
+        start = time.perf_counter()
+        written = seed_dataset(get_db(), size, seed=seed, translated_ratio=translated_ratio)
+        print(f"시딩 완료 ({time.perf_counter() - start:,.1f}s): {written}")
+
+        results = {}
+        for name, case in _benchmark_cases(size).items():
+            if case["group"] == "filter":
+                case["func"]()  # 캐시 워밍
+            results[name] = _time_case(counter, case["func"], repeat, case.get("setup"))
+            print(f"  {name:<36} {results[name]['medianMs']:>10,.1f} ms  reads={results[name]['reads']:,}")
+        if not skip_pages:
+            for name, result in _run_pages(counter).items():
+                results[name] = result
+                print(f"  {name:<36} {result['ms']:>10,.1f} ms  reads={result['reads']:,}  exceptions={result['exceptions']}")
+        report["sizes"][str(size)] = {"documents": written, "results": results}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Firestore 에뮬레이터 기반 어드민 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="ai-tools 문서 수 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 seed")
+    parser.add_argument("--translated-ratio", type=float, default=None, help="번역이 있는 도구 비율 (기본 1.0)")
+    parser.add_argument("--skip-pages", action="store_true", help="페이지(AppTest) 측정 생략")
+    parser.add_argument("--host", default=None, help="에뮬레이터 host:port (기본 FIRESTORE_EMULATOR_HOST 또는 127.0.0.1:8085)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    sizes = [int(s.replace("_", "")) for s in args.sizes.split(",") if s.strip()]
+    # 배너 매니페스트 자동 발행 비활성화 (프론트 폴더에 쓰지 않도록)
+    os.environ["BANNER_MANIFEST_DIR"] = ""
+    # 디스크 스냅샷은 임시 경로에 (개발용 스냅샷을 덮어쓰거나 지우지 않도록)
+    os.environ["ADMIN_SNAPSHOT_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="admin-bench-"), "snapshots.sqlite3")
+
+    with FirestoreEmulator(args.host) as emulator:
+        report = run(emulator, sizes, args.repeat, args.seed, args.translated_ratio, args.skip_pages)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
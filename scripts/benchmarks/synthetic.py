@@ -0,0 +1,271 @@
+"""
+벤치마크용 합성 데이터 생성·시딩
+
+- 규모(n) 하나로 컬렉션별 문서 수를 비례 배분합니다 (ai-tools = n 기준).
+- 같은 seed면 항상 같은 데이터 (실행 간 비교 가능)
+- 쓰기는 Firestore batch(450건 단위)로 처리합니다.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+
+from admin.config import (
+    COLLECTIONS, SUPPORTED_LANGUAGES, BANNER_SPOTS, BANNER_PAGES, BANNER_DISPLAY_LAYOUTS, CATEGORIES,
+)
+from admin.translations import TOOL_TRANSLATION_FIELD_KEYS
+
+BATCH_WRITE_LIMIT = 450
+
+# 도구 수 대비 컬렉션별 문서 비율
+SCALE_RATIOS = {
+    "users": 0.5,
+    "tool_translations_tools": 1.0,  # 번역이 있는 도구 비율 (언어 수만큼 곱해짐)
+    "public_recipes": 0.2,
+    "recipes": 0.2,
+    "banners": 0.01,
+}
+# 사용자 1명당 하위 컬렉션 문서 수
+USER_SUBCOLLECTION_SIZES = {"favorites": 5, "reviews": 2, "my-ai-sets": 1}
+
+_WORDS = (
+    "ai", "smart", "auto", "writer", "vision", "studio", "flow", "chat", "voice", "data",
+    "insight", "code", "design", "video", "note", "search", "agent", "lab", "cloud", "pro",
+)
+_STATUS_WEIGHTS = (("approved", 6), ("pending", 3), ("rejected", 1))
+_FIELD_STATUSES = ("ai_generated", "ai_generated", "edited", "reviewed", "stale")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _timestamp(rng: random.Random, now: datetime, days: int = 365) -> datetime:
+    return now - timedelta(seconds=rng.randint(0, days * 86400))
+
+
+def _weighted(rng: random.Random, choices: Tuple[Tuple[str, int], ...]) -> str:
+    return rng.choices([c for c, _ in choices], weights=[w for _, w in choices])[0]
+
+
+def scale_counts(size: int, translated_ratio: float = None) -> Dict[str, int]:
+    """
+    규모별 컬렉션 문서 수
+
+    Args:
+        size: ai-tools 문서 수
+        translated_ratio: 번역이 있는 도구 비율 (기본: SCALE_RATIOS, 100k 규모에서 줄일 때 사용)
+
+    Returns:
+        Dict[str, int]: {컬렉션 키: 문서 수}
+    """
+    ratios = dict(SCALE_RATIOS)
+    if translated_ratio is not None:
+        ratios["tool_translations_tools"] = translated_ratio
+    counts = {"tools": size}
+    for key, ratio in ratios.items():
+        counts[key] = max(1, int(size * ratio))
+    counts["tool_translations"] = counts.pop("tool_translations_tools") * len(SUPPORTED_LANGUAGES)
+    return counts
+
+
+def generate_tools(rng: random.Random, count: int, now: datetime) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """ai-tools 문서 생성 (id, data)"""
+    categories = [c["id"] for name, c in CATEGORIES.items() if c["id"] != "all"]
+    for i in range(count):
+        name = f"{_text(rng, 2).title()} {i}"
+        created = _timestamp(rng, now)
+        yield f"tool-{i:06d}", {
+            "name": name,
+            "company": f"{rng.choice(_WORDS).title()} Inc.",
+            "primaryCategory": rng.choice(categories),
+            "shortDescription": _text(rng, 8),
+            "description": _text(rng, 40),
+            "intro": _text(rng, 20),
+            "pros": [_text(rng, 4) for _ in range(3)],
+            "cons": [_text(rng, 4) for _ in range(2)],
+            "tags": rng.sample(_WORDS, 3),
+            "rating": round(rng.uniform(3.0, 5.0), 1),
+            "reviewCount": rng.randint(0, 500),
+            "featured": rng.random() < 0.05,
+            "verified": rng.random() < 0.3,
+            "status": "active",
+            "websiteUrl": f"https://example.com/{i}",
+            "createdAt": created,
+            "updatedAt": created + timedelta(days=rng.randint(0, 30)),
+        }
+
+
+def generate_users(
+    rng: random.Random, count: int, tool_count: int, now: datetime,
+) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, List[Tuple[str, Dict[str, Any]]]]]]:
+    """users 문서 + 하위 컬렉션 생성 (id, data, {서브컬렉션: [(id, data)]})"""
+    for i in range(count):
+        created = _timestamp(rng, now)
+        subcollections = {
+            "favorites": [
+                (f"tool-{t:06d}", {"toolId": f"tool-{t:06d}", "createdAt": _timestamp(rng, now)})
+                for t in rng.sample(range(tool_count), min(tool_count, USER_SUBCOLLECTION_SIZES["favorites"]))
+            ],
+            "reviews": [
+                (f"review-{j}", {
+                    "toolId": f"tool-{rng.randrange(tool_count):06d}",
+                    "rating": rng.randint(1, 5),
+                    "comment": _text(rng, 12),
+                    "createdAt": _timestamp(rng, now),
+                })
+                for j in range(USER_SUBCOLLECTION_SIZES["reviews"])
+            ],
+            "my-ai-sets": [
+                (f"set-{j}", {
+                    "name": _text(rng, 2),
+                    "toolIds": [f"tool-{rng.randrange(tool_count):06d}" for _ in range(4)],
+                    "createdAt": _timestamp(rng, now),
+                })
+                for j in range(USER_SUBCOLLECTION_SIZES["my-ai-sets"])
+            ],
+        }
+        yield f"user-{i:06d}", {
+            "email": f"user{i}@example.com",
+            "displayName": _text(rng, 2).title(),
+            "role": "user",
+            "createdAt": created,
+            "lastLoginAt": created + timedelta(days=rng.randint(0, 60)),
+        }, subcollections
+
+
+def generate_tool_translations(
+    rng: random.Random, tool_count: int, now: datetime,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """tool_translations 문서 생성 (도구 × 전체 지원 언어)"""
+    for t in range(tool_count):
+        tool_id = f"tool-{t:06d}"
+        for lang in SUPPORTED_LANGUAGES:
+            fields = {}
+            for key in TOOL_TRANSLATION_FIELD_KEYS:
+                if rng.random() < 0.1:
+                    continue  # 일부 누락 (커버리지 계산용)
+                text = [_text(rng, 4) for _ in range(2)] if key in ("pros", "cons") else _text(rng, 10)
+                fields[key] = {"text": text, "status": rng.choice(_FIELD_STATUSES)}
+            created = _timestamp(rng, now)
+            yield f"{tool_id}_{lang}", {
+                "toolId": tool_id,
+                "lang": lang,
+                "fields": fields,
+                "createdAt": created,
+                "updatedAt": created,
+                "createdBy": "benchmark",
+                "updatedBy": "benchmark",
+            }
+
+
+def generate_recipes(rng: random.Random, count: int, tool_count: int, now: datetime) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """레시피 문서 생성 (공개/개인 레시피 공용 형태)"""
+    for i in range(count):
+        created = _timestamp(rng, now)
+        yield f"recipe-{i:06d}", {
+            "title": _text(rng, 4).title(),
+            "description": _text(rng, 20),
+            "toolIds": [f"tool-{rng.randrange(tool_count):06d}" for _ in range(3)],
+            "steps": [_text(rng, 8) for _ in range(4)],
+            "status": _weighted(rng, _STATUS_WEIGHTS),
+            "createdAt": created,
+            "updatedAt": created,
+        }
+
+
+def generate_banners(rng: random.Random, count: int, now: datetime) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """banners 문서 생성 (LIVE/예약/종료 혼합)"""
+    spots, pages, layouts = list(BANNER_SPOTS), list(BANNER_PAGES), list(BANNER_DISPLAY_LAYOUTS)
+    for i in range(count):
+        start = now + timedelta(days=rng.randint(-30, 10))
+        yield f"banner-{i:05d}", {
+            "spotId": rng.choice(spots),
+            "pageId": rng.choice(pages),
+            "displayLayout": rng.choice(layouts),
+            "priority": rng.randint(1, 10),
+            "status": rng.choice(("on", "on", "off")),
+            # 닫힌 로컬 포트: 페이지 미리보기가 외부 네트워크 대기 없이 즉시 실패
+            "webImageUrl": f"http://127.0.0.1:9/banners/{i}.png",
+            "webLinkUrl": f"https://example.com/promo/{i}",
+            "displayStart": start.isoformat(),
+            "displayEnd": (start + timedelta(days=rng.randint(1, 60))).isoformat(),
+            "createdAt": start,
+            "updatedAt": start,
+        }
+
+
+def _write_batches(db, writes: Iterator[Tuple[Any, Dict[str, Any]]]) -> int:
+    """(doc_ref, data) 스트림을 batch로 저장, 저장 건수 반환"""
+    total = 0
+    batch, pending = db.batch(), 0
+    for ref, data in writes:
+        batch.set(ref, data)
+        pending += 1
+        if pending >= BATCH_WRITE_LIMIT:
+            batch.commit()
+            total += pending
+            batch, pending = db.batch(), 0
+    if pending:
+        batch.commit()
+        total += pending
+    return total
+
+
+def seed_dataset(db, size: int, seed: int = 42, translated_ratio: float = None) -> Dict[str, int]:
+    """
+    합성 데이터 시딩 (에뮬레이터 전용 — 프로덕션 DB에 호출하지 마세요)
+
+    Args:
+        db: Firestore 클라이언트 (에뮬레이터)
+        size: ai-tools 문서 수
+        seed: 난수 seed
+        translated_ratio: 번역이 있는 도구 비율 (scale_counts 참고)
+
+    Returns:
+        Dict[str, int]: {컬렉션: 저장 문서 수}
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    counts = scale_counts(size, translated_ratio)
+    translated_tools = counts["tool_translations"] // len(SUPPORTED_LANGUAGES)
+    written: Dict[str, int] = {}
+
+    tools_col = db.collection(COLLECTIONS["AI_TOOLS"])
+    written["ai-tools"] = _write_batches(
+        db, ((tools_col.document(doc_id), data) for doc_id, data in generate_tools(rng, size, now))
+    )
+
+    users_col = db.collection(COLLECTIONS["USERS"])
+
+    def _user_writes():
+        for uid, data, subcollections in generate_users(rng, counts["users"], size, now):
+            user_ref = users_col.document(uid)
+            yield user_ref, data
+            for sub_name, docs in subcollections.items():
+                for doc_id, sub_data in docs:
+                    yield user_ref.collection(sub_name).document(doc_id), sub_data
+
+    written["users"] = _write_batches(db, _user_writes())
+
+    trans_col = db.collection(COLLECTIONS["TOOL_TRANSLATIONS"])
+    written["tool_translations"] = _write_batches(
+        db, ((trans_col.document(doc_id), data) for doc_id, data in generate_tool_translations(rng, translated_tools, now))
+    )
+
+    public_col = db.collection(COLLECTIONS["PUBLIC_RECIPES"])
+    written["public_recipes"] = _write_batches(
+        db, ((public_col.document(doc_id), data)
+             for doc_id, data in generate_recipes(rng, counts["public_recipes"], size, now))
+    )
+
+    recipes_col = db.collection(COLLECTIONS["RECIPES"])
+    written["recipes"] = _write_batches(
+        db, ((recipes_col.document(doc_id), data)
+             for doc_id, data in generate_recipes(rng, counts["recipes"], size, now))
+    )
+
+    banners_col = db.collection(COLLECTIONS["BANNERS"])
+    written["banners"] = _write_batches(
+        db, ((banners_col.document(doc_id), data) for doc_id, data in generate_banners(rng, counts["banners"], now))
+    )
+    return written
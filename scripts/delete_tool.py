@@ -92,6 +92,7 @@ def main():
 
     deleted_tool = 0
     deleted_trans = 0
+    deleted_trans_ids = []
 
     # ai-tools 문서 삭제
     if tool_doc.exists:
@@ -107,10 +108,21 @@ def main():
         try:
             trans_ref.document(d.id).delete()
             deleted_trans += 1
+            deleted_trans_ids.append(d.id)
             print(f"  [OK] tool_translations/{d.id} 삭제됨")
         except Exception as e:
             print(f"  [FAIL] tool_translations/{d.id}: {e}")
 
+    # 어드민 인스턴스 캐시 정리 (공유 캐시 사용 시 다른 인스턴스의 스냅샷에도 삭제 기록 전달)
+    from admin.snapshot_cache import remove_snapshot_docs
+    from admin.shared_cache import invalidate_collection
+    if deleted_tool:
+        remove_snapshot_docs(COLLECTIONS["AI_TOOLS"], [tool_id])
+        invalidate_collection(COLLECTIONS["AI_TOOLS"])
+    if deleted_trans_ids:
+        remove_snapshot_docs(COLLECTIONS["TOOL_TRANSLATIONS"], deleted_trans_ids)
+        invalidate_collection(COLLECTIONS["TOOL_TRANSLATIONS"])
+
     print(f"\n완료: ai-tools {deleted_tool}건, tool_translations {deleted_trans}건 삭제되었습니다.")
 
 
@@ -0,0 +1,63 @@
+"""
+컬렉션 스냅샷 내보내기 CLI (NDJSON / Parquet)
+
+  python scripts/export_collections.py --list                          # 대상 목록
+  python scripts/export_collections.py AI_TOOLS USERS                  # NDJSON
+  python scripts/export_collections.py --all --format parquet          # 전체 (pyarrow 필요)
+  python scripts/export_collections.py USERS/favorites --chunk-size 1000 --output-dir /backup
+  python scripts/export_collections.py AI_TOOLS --no-resume            # 체크포인트 무시하고 처음부터
+
+중단된 내보내기는 같은 대상·형식으로 다시 실행하면 마지막 체크포인트부터 이어서 진행합니다.
+프로젝트 루트(ai_curatorhub_admin)에서 실행하거나, PYTHONPATH에 루트를 추가하세요.
+"""
+import argparse
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from admin.config import EXPORT_CHUNK_SIZE, EXPORT_DIR
+from admin.export import EXPORT_FORMATS, export_collection, get_export_targets
+
+
+def main():
+    targets = get_export_targets()
+    parser = argparse.ArgumentParser(description="컬렉션 스냅샷 내보내기 (NDJSON / Parquet)")
+    parser.add_argument("targets", nargs="*", help="대상 키 (--list로 확인)")
+    parser.add_argument("--all", action="store_true", help="모든 대상 내보내기")
+    parser.add_argument("--list", action="store_true", help="대상 목록 출력")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson", help="출력 형식")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE, help="1회 조회 문서 수")
+    parser.add_argument("--output-dir", default=EXPORT_DIR, help="저장 디렉터리")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트를 무시하고 처음부터 내보내기")
+    args = parser.parse_args()
+
+    if args.list or not (args.targets or args.all):
+        for key, target in targets.items():
+            print(f"{key:<32} {target['label']}")
+        sys.exit(0 if args.list else 1)
+
+    selected = list(targets) if args.all else args.targets
+    unknown = [key for key in selected if key not in targets]
+    if unknown:
+        print(f"알 수 없는 대상: {', '.join(unknown)} (--list로 확인)")
+        sys.exit(1)
+
+    failed = 0
+    for key in selected:
+        ok, msg = export_collection(
+            key, args.format, output_dir=args.output_dir, chunk_size=args.chunk_size,
+            resume=not args.no_resume,
+            progress=lambda documents, chunks, key=key: print(f"  {key}: {documents:,}건 ({chunks:,}개 청크)"),
+        )
+        print(msg)
+        failed += 0 if ok else 1
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
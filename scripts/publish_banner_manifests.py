@@ -0,0 +1,33 @@
+"""
+배너 매니페스트 발행 CLI
+
+배포/빌드 단계 또는 크론(일정 전환 시각 이후)에서 실행:
+  python scripts/publish_banner_manifests.py              # 전체 페이지 → BANNER_MANIFEST_DIR
+  python scripts/publish_banner_manifests.py home tools   # 지정 페이지만
+  BANNER_MANIFEST_DIR=/path/to/public/banners python scripts/publish_banner_manifests.py
+
+프로젝트 루트(ai_curatorhub_admin)에서 실행하거나, PYTHONPATH에 루트를 추가하세요.
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from admin.firebase import get_db
+from admin.banner_manifest import publish_banner_manifests
+
+
+def main():
+    page_ids = [arg.strip() for arg in sys.argv[1:] if arg.strip()] or None
+    get_db()  # Firebase 연결
+    ok, msg = publish_banner_manifests(page_ids, create_dir=True)
+    print(msg)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
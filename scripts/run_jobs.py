@@ -0,0 +1,60 @@
+"""
+백그라운드 작업 워커 프로세스 (Streamlit과 별도로 실행)
+
+  python scripts/run_jobs.py                 # ADMIN_JOBS_WORKERS개 워커로 대기열 처리 (Ctrl+C로 종료)
+  python scripts/run_jobs.py --workers 4
+  python scripts/run_jobs.py --list          # 최근 작업 목록
+
+Streamlit 프로세스의 ADMIN_JOBS_WORKERS=0으로 두면 작업 실행을 이 프로세스에만 맡길 수 있습니다.
+두 프로세스는 같은 ADMIN_JOBS_DB_PATH를 사용해야 합니다.
+작업이 저장한 내용의 캐시 무효화가 Streamlit 프로세스에 전달되려면 두 프로세스 모두
+ADMIN_SHARED_CACHE_URL에 같은 Redis 주소를 지정해야 합니다 (없거나 memory://면 캐시 만료 후 반영).
+프로젝트 루트(ai_curatorhub_admin)에서 실행하거나, PYTHONPATH에 루트를 추가하세요.
+"""
+import argparse
+import sys
+import os
+import time
+
+# 프로젝트 루트를 path에 추가
+_script_dir = os.path.dirname(os.path.abspath(__file__))
+_project_root = os.path.dirname(_script_dir)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from admin.config import JOBS_WORKERS, SHARED_CACHE_URL
+from admin.jobs import format_job_time, list_jobs, start_job_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백그라운드 작업 워커")
+    parser.add_argument("--workers", type=int, default=max(1, JOBS_WORKERS), help="워커 스레드 수")
+    parser.add_argument("--list", action="store_true", help="최근 작업 목록 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        for job in list_jobs(limit=30):
+            percent = f"{job['percent']:.0f}%" if job["percent"] is not None else ""
+            print(
+                f"{format_job_time(job['created_at'])}  {job['id'][:8]}  {job['status']:<10} {percent:>5}  "
+                f"{job['label']}  {job['message'] or ''}"
+            )
+        sys.exit(0)
+
+    if not SHARED_CACHE_URL.startswith(("redis://", "rediss://", "unix://")):
+        print(
+            "경고: ADMIN_SHARED_CACHE_URL이 Redis가 아니어서 작업의 캐시 무효화가 Streamlit 프로세스에 전달되지 않습니다. "
+            "페이지는 캐시가 만료될 때까지 이전 데이터를 보여줍니다."
+        )
+    count = start_job_workers(max(1, args.workers))
+    print(f"작업 워커 {count}개 실행 중 (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        # 실행 중이던 작업은 heartbeat가 끊긴 뒤 다른 워커가 다시 실행
+        print("종료")
+
+
+if __name__ == "__main__":
+    main()